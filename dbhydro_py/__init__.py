@@ -6,6 +6,9 @@ __version__ = '0.0.1'
 # Main API client - the primary entry point users need
 from .api import DbHydroApi
 
+# Asynchronous client (requires the 'async' extra to be instantiated)
+from .async_api import AsyncDbHydroApi
+
 # Common response models users will work with
 from .models import TimeSeriesResponse, Status
 from .models.responses import PointResponse
@@ -18,6 +21,7 @@ from .exceptions import DbHydroException
 
 __all__ = [
     'DbHydroApi',
+    'AsyncDbHydroApi',
     'TimeSeriesResponse', 
     'Status',
     'PointResponse',
@@ -0,0 +1,334 @@
+# Standard library imports
+import asyncio
+from collections.abc import Awaitable, Iterable, Sequence
+from datetime import datetime
+from types import TracebackType
+from typing import Literal, TypeVar, cast
+
+# Optional asynchronous HTTP client
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
+# Local imports
+from dbhydro_py.api import _DbHydroApiCore, _DEFAULT_HEADERS, _parse_period_of_record, _parse_point, _parse_time_series
+from dbhydro_py.exceptions import DbHydroException
+from dbhydro_py.models.responses import TimeSeriesResponse, PointResponse, SynchronizeResponse
+from dbhydro_py.models.responses.aggregate import AggregateResponse
+from dbhydro_py.models.responses.interpolate import InterpolateResponse
+from dbhydro_py.models.responses.time_series import PeriodOfRecord
+from dbhydro_py.utils import json_loads
+
+_T = TypeVar('_T')
+
+# Connections kept open by a session created by the client, shared by all concurrent requests
+_MAX_CONNECTIONS = 32
+
+# Default number of calls run at once by `get_many`
+_DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncDbHydroApi(_DbHydroApiCore):
+    """Asynchronous client for the DBHydro API built on aiohttp.
+
+    Mirrors the `get_*` methods of `DbHydroApi` as coroutines, with the same argument
+    validation and response models, so many independent queries can run concurrently
+    on one event loop. Responses are not cached between calls.
+
+    Args:
+        client_id (str): API client ID for authentication.
+        client_secret (str): API client secret for authentication.
+        api_version (int, optional): API version to use. Defaults to 1.
+        session (aiohttp.ClientSession, optional): Session to send requests with. If not given, one is
+            created on the first request and closed by `close()`.
+
+    Raises:
+        ImportError: If aiohttp is not installed.
+
+    Examples:
+        >>> async with AsyncDbHydroApi("client_id", "secret") as api:
+        ...     responses = await asyncio.gather(
+        ...         *(api.get_time_series(site, '2023-01-01', '2023-01-31') for site in sites)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        api_version: int = 1,
+        session: 'aiohttp.ClientSession | None' = None
+    ):
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for AsyncDbHydroApi. Install with: pip install aiohttp')
+
+        super().__init__(client_id, client_secret, api_version)
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> 'AsyncDbHydroApi':
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session if it was created by this client."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    async def get_many(self, calls: Iterable[Awaitable[_T]], max_concurrency: int = _DEFAULT_MAX_CONCURRENCY) -> list[_T]:
+        """Run many independent `get_*` calls concurrently, a bounded number at a time.
+
+        Args:
+            calls (Iterable[Awaitable]): Un-awaited calls of this client's `get_*` methods.
+            max_concurrency (int, optional): Maximum number of calls in flight at once. Defaults to 8.
+
+        Returns:
+            list: The result of each call, in the order given.
+
+        Raises:
+            ValueError: If max_concurrency is not a positive integer.
+            DbHydroException: If any call fails; the remaining calls are cancelled.
+
+        Examples:
+            >>> responses = await api.get_many(
+            ...     api.get_period_of_record(station) for station in stations
+            ... )
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency: {max_concurrency}. Must be a positive integer.")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(call: Awaitable[_T]) -> _T:
+            async with semaphore:
+                return await call
+
+        tasks = [asyncio.ensure_future(run(call)) for call in calls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _perform_request(self, full_url: str, params: dict) -> dict:
+        """Helper method to perform GET requests using the aiohttp session.
+
+        Args:
+            full_url (str): The full API endpoint URL.
+            params (dict): The query parameters for the request.
+
+        Returns:
+            dict: The raw response data from the GET request.
+        """
+        # The session is created lazily so it binds to the running event loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=_MAX_CONNECTIONS))
+            self._owns_session = True
+
+        # aiohttp rejects None query values; requests drops them, so do the same
+        query = {key: value for key, value in params.items() if value is not None}
+
+        try:
+            async with self._session.get(full_url, params=query, headers=_DEFAULT_HEADERS) as response:
+                status_code = response.status
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise DbHydroException(f'Request failed: {e}')
+
+        # Parse the body, falling back to an empty response like the synchronous adapter
+        try:
+            response_data = json_loads(body)
+        except ValueError:
+            response_data = {}
+
+        # Check for API-level errors first (handles both HTTP errors and API-level errors)
+        self._check_api_response(response_data, status_code)
+
+        return cast(dict, response_data)
+
+    async def _fetch_time_series(
+        self,
+        full_url: str,
+        params: dict,
+        id_param: str,
+        ids: Sequence[str],
+        max_parallel: int
+    ) -> TimeSeriesResponse:
+        """Fetch a time series response, splitting large identifier lists across concurrent requests.
+
+        Args:
+            full_url (str): The full API endpoint URL.
+            params (dict): The query parameters for a single request covering all identifiers.
+            id_param (str): The name of the query parameter holding the comma-joined identifiers.
+            ids (Sequence[str]): The validated identifiers.
+            max_parallel (int): Maximum number of concurrent requests.
+
+        Returns:
+            TimeSeriesResponse: Parsed response with the time series of all requests merged in order.
+        """
+        chunk_params = self._split_identifier_params(params, id_param, ids, max_parallel)
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def fetch(request_params: dict) -> TimeSeriesResponse:
+            async with semaphore:
+                response_data = await self._perform_request(full_url, request_params)
+            return _parse_time_series(response_data)
+
+        responses = await asyncio.gather(*(fetch(request_params) for request_params in chunk_params))
+        return self._merge_time_series(list(responses))
+
+    async def get_time_series(
+        self,
+        site_ids: Sequence[str] | str,
+        date_start: datetime | str,
+        date_end: datetime | str,
+        calculation: Literal['MEAN', 'MAX', 'MIN', 'SUM'] | None = None,
+        timespan_unit: Literal['YEAR', 'MONTH', 'WEEK', 'DAY', 'HOUR', 'MINUTE', 'SECOND'] | None = None,
+        timespan_value: int = 1,
+        max_parallel: int = 1
+    ) -> TimeSeriesResponse:
+        """Retrieve time series data using the timeseries endpoint. See `DbHydroApi.get_time_series`."""
+        full_url, params, id_param, ids = self._prepare_time_series(
+            site_ids,
+            date_start,
+            date_end,
+            calculation,
+            timespan_unit,
+            timespan_value
+        )
+        return await self._fetch_time_series(full_url, params, id_param, ids, max_parallel)
+
+    async def get_daily_data(
+        self,
+        identifiers: Sequence[str] | str,
+        identifier_type: Literal['timeseries', 'station', 'id'],
+        date_start: datetime | str,
+        date_end: datetime | str,
+        requested_datum: Literal['NGVD29', 'NAVD88'] = 'NGVD29',
+        include_summary: bool = False,
+        max_parallel: int = 1
+    ) -> TimeSeriesResponse:
+        """Retrieve daily data using the dailydata endpoint. See `DbHydroApi.get_daily_data`."""
+        full_url, params, id_param, ids = self._prepare_daily_data(
+            identifiers,
+            identifier_type,
+            date_start,
+            date_end,
+            requested_datum,
+            include_summary
+        )
+        return await self._fetch_time_series(full_url, params, id_param, ids, max_parallel)
+
+    async def get_aggregate(
+        self,
+        station_id: str,
+        date_start: datetime | str,
+        date_end: datetime | str,
+        calculation: Literal['MEAN', 'MAX', 'MIN', 'SUM', 'MEDI'] | None = None,
+        timespan_unit: Literal['YEAR', 'MONTH', 'WEEK', 'DAY', 'HOUR', 'MINUTE', 'SECOND'] | None = None,
+        timespan_value: int = 1
+    ) -> AggregateResponse:
+        """Retrieve aggregate statistical data using the aggregate endpoint. See `DbHydroApi.get_aggregate`."""
+        full_url, params = self._prepare_aggregate(
+            station_id,
+            date_start,
+            date_end,
+            calculation,
+            timespan_unit,
+            timespan_value
+        )
+        response_data = await self._perform_request(full_url, params)
+        return AggregateResponse.from_dict(response_data)
+
+    async def get_interpolate(self, station_id: str, date_time: datetime | str) -> InterpolateResponse:
+        """Retrieve an interpolated value using the interpolate endpoint. See `DbHydroApi.get_interpolate`."""
+        full_url, params = self._prepare_interpolate(station_id, date_time)
+        response_data = await self._perform_request(full_url, params)
+        return InterpolateResponse.from_dict(response_data)
+
+    async def get_real_time(
+        self,
+        identifiers: Sequence[str] | str,
+        identifier_type: Literal['sites', 'timeseries'],
+        status: str | None = None,
+        max_parallel: int = 1
+    ) -> TimeSeriesResponse:
+        """Retrieve real-time data using the realtime endpoint. See `DbHydroApi.get_real_time`."""
+        full_url, params, id_param, ids = self._prepare_real_time(identifiers, identifier_type, status)
+        return await self._fetch_time_series(full_url, params, id_param, ids, max_parallel)
+
+    async def get_period_of_record(self, station_id: str) -> PeriodOfRecord:
+        """Retrieve the period of record for a station using the por endpoint. See `DbHydroApi.get_period_of_record`."""
+        full_url, params = self._prepare_period_of_record(station_id)
+        response_data = await self._perform_request(full_url, params)
+        return _parse_period_of_record(response_data)
+
+    async def get_nexrad_pixel_data(
+        self,
+        pixel_ids: Sequence[str] | str,
+        date_start: datetime | str,
+        date_end: datetime | str,
+        frequency: Literal['H', 'D', 'M', 'Y', 'E'],
+        include_zero: bool = False,
+        max_parallel: int = 1
+    ) -> TimeSeriesResponse:
+        """Retrieve NEXRAD pixel data using the nexrad endpoint. See `DbHydroApi.get_nexrad_pixel_data`."""
+        full_url, params, id_param, ids = self._prepare_nexrad_pixel_data(
+            pixel_ids,
+            date_start,
+            date_end,
+            frequency,
+            include_zero
+        )
+        return await self._fetch_time_series(full_url, params, id_param, ids, max_parallel)
+
+    async def get_nexrad_polygon_data(
+        self,
+        identifiers: Sequence[str] | str,
+        identifier_type: Literal['polygonId', 'polygonName'],
+        polygon_type: Literal[1, 2, 3, 4, 5, 6, 7, 8, 9],
+        date_start: datetime | str,
+        date_end: datetime | str,
+        frequency: Literal['15', 'H', 'D', 'M', 'Y', 'E'],
+        include_zero: bool = False
+    ) -> TimeSeriesResponse:
+        """Retrieve NEXRAD polygon data using the nexrad endpoint. See `DbHydroApi.get_nexrad_polygon_data`."""
+        full_url, params = self._prepare_nexrad_polygon_data(
+            identifiers,
+            identifier_type,
+            polygon_type,
+            date_start,
+            date_end,
+            frequency,
+            include_zero
+        )
+        response_data = await self._perform_request(full_url, params)
+        return _parse_time_series(response_data)
+
+    async def get_time_series_arithmetic(self, id: str, timestamp: datetime | str) -> PointResponse:
+        """Retrieve time series arithmetic data using the tsarithmetic endpoint. See `DbHydroApi.get_time_series_arithmetic`."""
+        full_url, params = self._prepare_time_series_arithmetic(id, timestamp)
+        response_data = await self._perform_request(full_url, params)
+        return _parse_point(response_data)
+
+    async def get_synchronize(
+        self,
+        time_series_names: Sequence[str] | str,
+        date_start: datetime | str,
+        date_end: datetime | str,
+        requested_datum: Literal['NGVD29', 'NAVD88'] | None = None
+    ) -> SynchronizeResponse:
+        """Retrieve synchronized data using the synchronize endpoint. See `DbHydroApi.get_synchronize`."""
+        full_url, params = self._prepare_synchronize(time_series_names, date_start, date_end, requested_datum)
+        response_data = await self._perform_request(full_url, params)
+        return SynchronizeResponse.from_dict(response_data)
@@ -22,15 +22,10 @@ class DbHydroException(Exception):
     
     def __str__(self) -> str:
         """Return a comprehensive error description."""
-        parts = [self.message]
-        
-        if self.api_status_message:
-            parts.append(f'API Error: {self.api_status_message}')
-        
-        if self.http_status_code:
-            parts.append(f'HTTP Status: {self.http_status_code}')
-            
-        if self.api_status_code and self.api_status_code != self.http_status_code:
-            parts.append(f'API Status: {self.api_status_code}')
-            
-        return ' | '.join(parts)
+        api_status_code = self.api_status_code
+        return ' | '.join(filter(None, (
+            self.message,
+            f'API Error: {self.api_status_message}' if self.api_status_message else None,
+            f'HTTP Status: {self.http_status_code}' if self.http_status_code else None,
+            f'API Status: {api_status_code}' if api_status_code and api_status_code != self.http_status_code else None
+        )))
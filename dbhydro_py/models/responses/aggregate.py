@@ -1,14 +1,24 @@
 # Standard library imports
+from collections import Counter
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Only import pandas for type checking (optional import at runtime)
     import pandas as pd
 
+# Optional array backend for numeric reductions over large responses
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 # Local imports
 from dbhydro_py.models.responses.base import ApiResponseBase
-from dbhydro_py.utils import dataclass_from_dict
 
 # Hierarchy of dataclasses representing the Aggregate Response structure
 """
@@ -36,8 +46,73 @@ AggregateResponse
             └── origin
 """
 
+# DataFrame columns produced by AggregateResponse.to_dataframe
+_BASIC_COLUMNS = ('start_datetime', 'end_datetime', 'statistic_type', 'value', 'key', 'quality_code')
+_METADATA_COLUMNS = (
+    'start_date', 'end_date', 'key_type', 'percent_available', 'origin',
+    'timespan_scalar', 'timespan_unit', 'tag', 'start_millis', 'end_millis'
+)
+
+# Getters for the interval attributes stored column-wise by AggregateResponse._columns(), keyed by column name
+_COLUMN_GETTERS: dict[str, Callable[[Any], Any]] = {name: attrgetter(attribute) for name, attribute in {
+    'start_millis': 'start_millis_since_epoch',
+    'end_millis': 'end_millis_since_epoch',
+    'statistic_type': 'statistic_type',
+    'value': 'value',
+    'key': 'key',
+    'quality_code': 'quality_code',
+    'start_date': 'start_date',
+    'end_date': 'end_date',
+    'key_type': 'key_type',
+    'percent_available': 'percent_available',
+    'origin': 'origin',
+}.items()}
+# The timespan and tag objects may be null in the response, so their fields are read None-safely
+_COLUMN_GETTERS.update({
+    'timespan_scalar': lambda interval: interval.timespan.scalar if interval.timespan is not None else None,
+    'timespan_unit': lambda interval: interval.timespan.unit_of_time if interval.timespan is not None else None,
+    'tag': lambda interval: interval.tag.tag if interval.tag is not None else None,
+})
+
 
-@dataclass
+@lru_cache(maxsize=2)
+def _empty_dataframe(include_metadata: bool) -> 'pd.DataFrame':
+    """Build the typed empty DataFrame returned for responses without intervals.
+    
+    Cached so repeated empty responses skip the construction and dtype conversion;
+    callers must return a copy.
+    
+    Args:
+        include_metadata (bool): Whether to include the metadata columns.
+    """
+    import pandas as pd
+    
+    columns = _BASIC_COLUMNS + _METADATA_COLUMNS if include_metadata else _BASIC_COLUMNS
+    return pd.DataFrame(columns=list(columns)).astype({
+        'start_datetime': 'datetime64[ns]',
+        'end_datetime': 'datetime64[ns]',
+        'statistic_type': 'object',
+        'value': 'float64',
+        'key': 'object',
+        'quality_code': 'object'
+    })
+
+
+def _millis_to_datetime(millis: tuple) -> 'pd.DatetimeIndex':
+    """Convert a column of epoch milliseconds to datetimes in one call.
+    
+    Packing the column into an int64 array first lets pandas convert the buffer directly
+    instead of inspecting each Python int; columns with missing values take the generic path.
+    """
+    import pandas as pd
+    
+    try:
+        return pd.to_datetime(np.fromiter(millis, dtype=np.int64, count=len(millis)), unit='ms')
+    except TypeError:
+        return pd.to_datetime(millis, unit='ms')
+
+
+@dataclass(slots=True)
 class Tag:
     """Tag information for aggregate data."""
     tag: Optional[str] = field(metadata={'json_key': 'tag'})
@@ -45,22 +120,23 @@ class Tag:
     @classmethod
     def from_dict(cls, data: dict) -> 'Tag':
         """Create Tag from dictionary."""
-        return dataclass_from_dict(cls, data)  # type: ignore
+        return cls(data.get('tag'))
 
 
-@dataclass
+@dataclass(slots=True)
 class Timespan:
     """Timespan definition for aggregate calculations."""
     scalar: int = field(metadata={'json_key': 'scalar'})
     unit_of_time: str = field(metadata={'json_key': 'unitOfTime'})
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'Timespan':
+    def from_dict(cls, data: dict[str, Any]) -> 'Timespan':
         """Create Timespan from dictionary."""
-        return dataclass_from_dict(cls, data)  # type: ignore
+        get: Callable[[str], Any] = data.get
+        return cls(get('scalar'), get('unitOfTime'))
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateInterval:
     """Single aggregate interval with statistical calculation."""
     end_millis_since_epoch: int = field(metadata={'json_key': 'endMilliSinceEpoch'})
@@ -79,22 +155,90 @@ class AggregateInterval:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'AggregateInterval':
-        """Create AggregateInterval from dictionary."""
-        # Use dataclass_from_dict directly - it will handle nested objects properly
-        return dataclass_from_dict(cls, data)  # type: ignore
+        """Create AggregateInterval from dictionary.
+        
+        Written out by hand rather than generated by `dataclass_from_dict`: responses can hold
+        thousands of intervals, and building the nested Timespan and Tag inline avoids two extra
+        calls per interval. Missing keys become None, as with `dataclass_from_dict`.
+        """
+        get: Callable[[str], Any] = data.get
+        timespan = get('timespan')
+        if timespan is not None:
+            timespan = Timespan(timespan.get('scalar'), timespan.get('unitOfTime'))
+        tag = get('tag')
+        if tag is not None:
+            tag = Tag(tag.get('tag'))
+        return cls(
+            get('endMilliSinceEpoch'),
+            get('statisticType'),
+            timespan,
+            get('startMilliSinceEpoch'),
+            get('value'),
+            get('key'),
+            tag,
+            get('endDate'),
+            get('startDate'),
+            get('keyType'),
+            get('qualityCode'),
+            get('percentAvailable'),
+            get('origin')
+        )
 
 
-@dataclass
-class AggregateResponse:
-    """Response from the aggregate endpoint containing statistical intervals."""
+class _AggregateResponseCaches:
+    """Slots for the derived data cached by `AggregateResponse`.
+    
+    Declared on a plain base class rather than as dataclass fields, so `fields()`, `asdict()`
+    and `astuple()` only see the response data.
+    """
+    # Hidden from mypy, whose dataclass plugin only counts a slots=True subclass's own fields
+    # as slots and would reject every cache assignment
+    if not TYPE_CHECKING:
+        __slots__ = ('_summary_cache', '_groups_cache', '_key_values_cache', '_columns_cache')
+    # Sorted unique values of the intervals, built on first use; see _summary()
+    _summary_cache: Optional[tuple[list, int, dict[str, list]]]
+    # Intervals grouped by key, built on first use; see _group_by_key()
+    _groups_cache: Optional[tuple[list, int, dict[str, list[AggregateInterval]]]]
+    # Values of each key group, built on first use; see _values_by_key()
+    _key_values_cache: Optional[tuple[list, int, dict[str, list[float]]]]
+    # Interval attributes as parallel columns, built on first use; see _columns()
+    _columns_cache: Optional[tuple[list, int, dict[str, tuple]]]
+
+
+@dataclass(slots=True)
+class AggregateResponse(_AggregateResponseCaches):
+    """Response from the aggregate endpoint containing statistical intervals.
+    
+    Derived data (unique values, interval groups by key, attribute columns) is cached on first
+    use and rebuilt automatically when `intervals` is replaced or changes length. Replacing
+    an interval in place or editing its fields is not detected; call `clear_cache()` afterwards.
+    """
     intervals: list[AggregateInterval] = field(default_factory=list, metadata={'json_key': 'intervals'})
     
+    def __post_init__(self) -> None:
+        # The cache slots live outside the dataclass fields, so they start out empty here
+        self.clear_cache()
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'AggregateResponse':
         """Create AggregateResponse from dictionary."""
-        # Use dataclass_from_dict - intervals will always be a list due to default_factory
-        result: AggregateResponse = dataclass_from_dict(cls, data)
-        return result
+        # Build the intervals straight from the parsed JSON; a missing or null list becomes empty
+        intervals = data.get('intervals')
+        if not intervals:
+            return cls()
+        interval_from_dict = AggregateInterval.from_dict
+        return cls([interval_from_dict(interval) for interval in intervals])
+    
+    def clear_cache(self) -> None:
+        """Discard the cached derived data so the next getter rebuilds it from `intervals`.
+        
+        Needed after replacing an interval in place (e.g. `intervals[0] = ...`) or editing an
+        interval's fields; appending, removing or assigning a new list is picked up automatically.
+        """
+        self._summary_cache = None
+        self._groups_cache = None
+        self._key_values_cache = None
+        self._columns_cache = None
     
     def to_dataframe(self, include_metadata: bool = False) -> 'pd.DataFrame':
         """Convert aggregate data to pandas DataFrame.
@@ -124,69 +268,74 @@ class AggregateResponse:
                 'pandas is required for to_dataframe(). Install with: pip install pandas'
             )
         
-        # Collect all data from intervals
-        records = []
-        for interval in self.intervals:
-            # Convert milliseconds to datetime
-            start_datetime = pd.to_datetime(interval.start_millis_since_epoch, unit='ms')
-            end_datetime = pd.to_datetime(interval.end_millis_since_epoch, unit='ms')
-            
-            record = {
-                'start_datetime': start_datetime,
-                'end_datetime': end_datetime,
-                'statistic_type': interval.statistic_type,
-                'value': interval.value,
-                'key': interval.key,
-                'quality_code': interval.quality_code,
-            }
-            
-            # Add metadata if requested
-            if include_metadata:
-                record.update({
-                    'start_date': interval.start_date,
-                    'end_date': interval.end_date,
-                    'key_type': interval.key_type,
-                    'percent_available': interval.percent_available,
-                    'origin': interval.origin,
-                    'timespan_scalar': interval.timespan.scalar,
-                    'timespan_unit': interval.timespan.unit_of_time,
-                    'tag': interval.tag.tag,
-                    'start_millis': interval.start_millis_since_epoch,
-                    'end_millis': interval.end_millis_since_epoch,
-                })
-            
-            records.append(record)
+        # Ensure consistent DataFrame structure even when empty
+        intervals = self.intervals
+        if not intervals:
+            return _empty_dataframe(include_metadata).copy()
+        
+        # Assemble the frame from the stored columns, converting timestamps in one vectorized call each
+        stored = self._columns()
+        columns = {
+            'start_datetime': _millis_to_datetime(stored['start_millis']),
+            'end_datetime': _millis_to_datetime(stored['end_millis']),
+        }
+        for name in _BASIC_COLUMNS[2:] + (_METADATA_COLUMNS if include_metadata else ()):
+            columns[name] = stored[name]
+        
+        # Create DataFrame, sorted by start time for chronological order
+        return pd.DataFrame(columns).sort_values('start_datetime').reset_index(drop=True)
+    
+    def _columns(self) -> dict[str, tuple]:
+        """Extract one tuple per interval attribute.
         
-        # Create DataFrame
-        df = pd.DataFrame(records)
+        Methods that only read one or two attributes scan these columns instead of every
+        interval object. The result is cached and rebuilt when `intervals` is replaced or
+        changes length; callers must not rely on it reflecting in-place edits of an interval.
         
-        # Ensure consistent DataFrame structure even when empty
-        if df.empty:
-            # Define the basic columns that will always be present
-            basic_columns = ['start_datetime', 'end_datetime', 'statistic_type', 'value', 'key', 'quality_code']
-            
-            # Add metadata columns if requested
-            if include_metadata:
-                basic_columns.extend([
-                    'start_date', 'end_date', 'key_type', 'percent_available', 'origin',
-                    'timespan_scalar', 'timespan_unit', 'tag', 'start_millis', 'end_millis'
-                ])
-            
-            # Create empty DataFrame with proper column types
-            df = pd.DataFrame(columns=basic_columns)
-            df = df.astype({
-                'start_datetime': 'datetime64[ns]',
-                'end_datetime': 'datetime64[ns]',
-                'statistic_type': 'object',
-                'value': 'float64',
-                'key': 'object',
-                'quality_code': 'object'
-            })
-        else:
-            # Sort by start time for chronological order
-            df = df.sort_values('start_datetime').reset_index(drop=True)
-        
-        return df
+        Returns:
+            dict[str, tuple]: Attribute values in interval order, keyed by DataFrame column name.
+        """
+        intervals = self.intervals
+        cache = self._columns_cache
+        if cache is not None and cache[0] is intervals and cache[1] == len(intervals):
+            return cache[2]
+        
+        # map() drives each getter over the list in C, without a per-interval Python frame or row tuple
+        columns = {name: tuple(map(getter, intervals)) for name, getter in _COLUMN_GETTERS.items()}
+        self._columns_cache = (intervals, len(intervals), columns)
+        return columns
+    
+    def _summary(self) -> dict[str, list]:
+        """Collect the sorted unique keys, statistic types, quality codes and origins in one pass.
+        
+        The result is cached and rebuilt when `intervals` is replaced or changes length.
+        
+        Returns:
+            dict[str, list]: Sorted unique values by attribute name.
+        """
+        intervals = self.intervals
+        cache = self._summary_cache
+        if cache is not None and cache[0] is intervals and cache[1] == len(intervals):
+            return cache[2]
+        
+        keys = set()
+        statistic_types = set()
+        quality_codes = set()
+        origins = set()
+        for interval in intervals:
+            keys.add(interval.key)
+            statistic_types.add(interval.statistic_type)
+            quality_codes.add(interval.quality_code)
+            origins.add(interval.origin)
+        
+        summary: dict[str, list] = {
+            'keys': sorted(keys),
+            'statistic_types': sorted(statistic_types),
+            'quality_codes': sorted(quality_codes),
+            'origins': sorted(origins),
+        }
+        self._summary_cache = (intervals, len(intervals), summary)
+        return summary
     
     def get_keys(self) -> list[str]:
         """Get list of all unique keys in the response.
@@ -194,8 +343,7 @@ class AggregateResponse:
         Returns:
             list[str]: List of unique keys, sorted.
         """
-        keys = set(interval.key for interval in self.intervals)
-        return sorted(keys)
+        return list(self._summary()['keys'])
     
     def get_statistic_types(self) -> list[str]:
         """Get list of all unique statistic types in the response.
@@ -203,8 +351,7 @@ class AggregateResponse:
         Returns:
             list[str]: List of unique statistic types, sorted.
         """
-        stat_types = set(interval.statistic_type for interval in self.intervals)
-        return sorted(stat_types)
+        return list(self._summary()['statistic_types'])
     
     def get_values(self) -> list[float]:
         """Get list of all aggregated values in the response.
@@ -212,7 +359,29 @@ class AggregateResponse:
         Returns:
             list[float]: List of all aggregate values.
         """
-        return [interval.value for interval in self.intervals]
+        return list(self._columns()['value'])
+    
+    def get_values_array(self) -> 'np.ndarray':
+        """Get all aggregated values as a float64 NumPy array.
+        
+        Returns:
+            np.ndarray: All aggregate values, in interval order.
+            
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError('numpy is required for get_values_array(). Install with: pip install numpy')
+        values = self._columns()['value']
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    
+    def iter_values(self) -> Iterator[float]:
+        """Iterate over all aggregated values without copying them into a new list.
+        
+        Returns:
+            Iterator[float]: All aggregate values, in interval order.
+        """
+        return iter(self._columns()['value'])
     
     def get_quality_codes(self) -> list[str]:
         """Get list of all unique quality codes in the response.
@@ -220,8 +389,7 @@ class AggregateResponse:
         Returns:
             list[str]: List of unique quality codes, sorted.
         """
-        quality_codes = set(interval.quality_code for interval in self.intervals)
-        return sorted(quality_codes)
+        return list(self._summary()['quality_codes'])
     
     def get_origins(self) -> list[str]:
         """Get list of all unique data origins in the response.
@@ -229,8 +397,7 @@ class AggregateResponse:
         Returns:
             list[str]: List of unique origins, sorted.
         """
-        origins = set(interval.origin for interval in self.intervals)
-        return sorted(origins)
+        return list(self._summary()['origins'])
     
     def get_timespans(self) -> list[tuple[int, str]]:
         """Get list of all unique timespan definitions.
@@ -238,8 +405,9 @@ class AggregateResponse:
         Returns:
             list[tuple[int, str]]: List of (scalar, unit_of_time) tuples, sorted.
         """
-        timespans = set((interval.timespan.scalar, interval.timespan.unit_of_time) for interval in self.intervals)
-        return sorted(timespans)
+        # Read from the intervals rather than _summary(), so the other unique-value getters
+        # do not depend on every interval having a timespan
+        return sorted({(interval.timespan.scalar, interval.timespan.unit_of_time) for interval in self.intervals})
     
     def get_timestamp_range(self) -> tuple[int, int] | None:
         """Get overall timestamp range across all intervals.
@@ -250,9 +418,8 @@ class AggregateResponse:
         if not self.intervals:
             return None
         
-        starts = [interval.start_millis_since_epoch for interval in self.intervals]
-        ends = [interval.end_millis_since_epoch for interval in self.intervals]
-        return (min(starts), max(ends))
+        columns = self._columns()
+        return (min(columns['start_millis']), max(columns['end_millis']))
     
     def get_value_range(self) -> tuple[float, float] | None:
         """Get min/max value range across all intervals.
@@ -260,8 +427,49 @@ class AggregateResponse:
         Returns:
             tuple[float, float] | None: (min, max) values or None if no data.
         """
-        values = self.get_values()
-        return (min(values), max(values)) if values else None
+        if not self.intervals:
+            return None
+        
+        # The builtins reduce the stored column in C and keep the values' own type
+        values = self._columns()['value']
+        return (min(values), max(values))
+    
+    def filter(
+        self,
+        *,
+        keys: list[str] | None = None,
+        statistic_types: list[str] | None = None,
+        quality_codes: list[str] | None = None,
+        origins: list[str] | None = None
+    ) -> 'AggregateResponse':
+        """Filter intervals on several attributes in a single pass.
+        
+        Equivalent to chaining the `filter_by_*` methods, without the intermediate responses.
+        Criteria left as None are not applied.
+        
+        Args:
+            keys (list[str] | None): Keys to include.
+            statistic_types (list[str] | None): Statistic types to include (e.g., ['MAX', 'MIN']).
+            quality_codes (list[str] | None): Quality codes to include.
+            origins (list[str] | None): Origins to include.
+            
+        Returns:
+            AggregateResponse: New response containing only intervals matching every given criterion.
+        """
+        # Sets make each membership test O(1) regardless of how many values are given
+        key_set = None if keys is None else frozenset(keys)
+        statistic_set = None if statistic_types is None else frozenset(statistic_types)
+        quality_set = None if quality_codes is None else frozenset(quality_codes)
+        origin_set = None if origins is None else frozenset(origins)
+        
+        filtered_intervals = [
+            interval for interval in self.intervals
+            if (key_set is None or interval.key in key_set)
+            and (statistic_set is None or interval.statistic_type in statistic_set)
+            and (quality_set is None or interval.quality_code in quality_set)
+            and (origin_set is None or interval.origin in origin_set)
+        ]
+        return AggregateResponse(intervals=filtered_intervals)
     
     def filter_by_key(self, keys: list[str]) -> 'AggregateResponse':
         """Filter intervals by specific keys.
@@ -272,8 +480,7 @@ class AggregateResponse:
         Returns:
             AggregateResponse: New response containing only intervals with specified keys.
         """
-        filtered_intervals = [interval for interval in self.intervals if interval.key in keys]
-        return AggregateResponse(intervals=filtered_intervals)
+        return self.filter(keys=keys)
     
     def filter_by_statistic(self, statistic_types: list[str]) -> 'AggregateResponse':
         """Filter intervals by statistic types.
@@ -284,8 +491,7 @@ class AggregateResponse:
         Returns:
             AggregateResponse: New response containing only intervals with specified statistic types.
         """
-        filtered_intervals = [interval for interval in self.intervals if interval.statistic_type in statistic_types]
-        return AggregateResponse(intervals=filtered_intervals)
+        return self.filter(statistic_types=statistic_types)
     
     def filter_by_quality(self, quality_codes: list[str]) -> 'AggregateResponse':
         """Filter intervals by quality codes.
@@ -296,8 +502,7 @@ class AggregateResponse:
         Returns:
             AggregateResponse: New response containing only intervals with specified quality codes.
         """
-        filtered_intervals = [interval for interval in self.intervals if interval.quality_code in quality_codes]
-        return AggregateResponse(intervals=filtered_intervals)
+        return self.filter(quality_codes=quality_codes)
     
     def filter_by_origin(self, origins: list[str]) -> 'AggregateResponse':
         """Filter intervals by origins.
@@ -308,8 +513,7 @@ class AggregateResponse:
         Returns:
             AggregateResponse: New response containing only intervals from specified origins.
         """
-        filtered_intervals = [interval for interval in self.intervals if interval.origin in origins]
-        return AggregateResponse(intervals=filtered_intervals)
+        return self.filter(origins=origins)
     
     def get_intervals_for_key(self, key: str) -> list[AggregateInterval]:
         """Get all intervals for a specific key.
@@ -320,8 +524,60 @@ class AggregateResponse:
         Returns:
             list[AggregateInterval]: List of intervals for the specified key, sorted by start time.
         """
-        key_intervals = [interval for interval in self.intervals if interval.key == key]
-        return sorted(key_intervals, key=lambda i: i.start_millis_since_epoch)
+        return list(self._group_by_key().get(key, ()))
+    
+    def iter_intervals_for_key(self, key: str) -> Iterator[AggregateInterval]:
+        """Iterate over the intervals for a specific key without copying them into a new list.
+        
+        Args:
+            key (str): The key to retrieve intervals for.
+            
+        Returns:
+            Iterator[AggregateInterval]: Intervals for the specified key, sorted by start time.
+        """
+        return iter(self._group_by_key().get(key, ()))
+    
+    def _group_by_key(self) -> dict[str, list[AggregateInterval]]:
+        """Group intervals by key with one sort by (key, start time).
+        
+        The result is cached and rebuilt when `intervals` is replaced or changes length;
+        callers must not modify the returned lists.
+        
+        Returns:
+            dict[str, list[AggregateInterval]]: Intervals for each key sorted by start time, in sorted key order.
+                Intervals with equal start times keep their original order.
+        """
+        intervals = self.intervals
+        cache = self._groups_cache
+        if cache is not None and cache[0] is intervals and cache[1] == len(intervals):
+            return cache[2]
+        
+        ordered = sorted(intervals, key=attrgetter('key', 'start_millis_since_epoch'))
+        groups = {key: list(group) for key, group in groupby(ordered, key=attrgetter('key'))}
+        self._groups_cache = (intervals, len(intervals), groups)
+        return groups
+    
+    def _values_by_key(self) -> dict[str, list[float]]:
+        """Get the values of each key group from `_group_by_key()`.
+        
+        The per-key statistics reduce these lists with the C builtins, so repeated calls
+        skip the attribute reads. Cached like `_group_by_key()`; callers must not modify
+        the returned lists.
+        
+        Returns:
+            dict[str, list[float]]: Values for each key, in the same order as its group.
+        """
+        intervals = self.intervals
+        cache = self._key_values_cache
+        if cache is not None and cache[0] is intervals and cache[1] == len(intervals):
+            return cache[2]
+        
+        values = {
+            key: [interval.value for interval in key_intervals]
+            for key, key_intervals in self._group_by_key().items()
+        }
+        self._key_values_cache = (intervals, len(intervals), values)
+        return values
     
     def get_intervals_by_statistic(self, statistic_type: str) -> list[AggregateInterval]:
         """Get all intervals for a specific statistic type.
@@ -340,13 +596,10 @@ class AggregateResponse:
         Returns:
             dict[str, float]: Dictionary mapping keys to their latest values.
         """
-        latest_values = {}
-        for key in self.get_keys():
-            key_intervals = self.get_intervals_for_key(key)
-            if key_intervals:
-                latest_interval = max(key_intervals, key=lambda i: i.end_millis_since_epoch)
-                latest_values[key] = latest_interval.value
-        return latest_values
+        return {
+            key: max(key_intervals, key=attrgetter('end_millis_since_epoch')).value
+            for key, key_intervals in self._group_by_key().items()
+        }
     
     def get_earliest_values_by_key(self) -> dict[str, float]:
         """Get the earliest value for each key.
@@ -354,13 +607,8 @@ class AggregateResponse:
         Returns:
             dict[str, float]: Dictionary mapping keys to their earliest values.
         """
-        earliest_values = {}
-        for key in self.get_keys():
-            key_intervals = self.get_intervals_for_key(key)
-            if key_intervals:
-                earliest_interval = min(key_intervals, key=lambda i: i.start_millis_since_epoch)
-                earliest_values[key] = earliest_interval.value
-        return earliest_values
+        # Each group is sorted by start time, so its first interval is the earliest
+        return {key: key_intervals[0].value for key, key_intervals in self._group_by_key().items()}
     
     def get_value_ranges_by_key(self) -> dict[str, tuple[float, float]]:
         """Get value range for each key.
@@ -368,13 +616,7 @@ class AggregateResponse:
         Returns:
             dict[str, tuple[float, float]]: Dictionary mapping keys to (min, max) tuples.
         """
-        ranges = {}
-        for key in self.get_keys():
-            key_intervals = self.get_intervals_for_key(key)
-            if key_intervals:
-                values = [interval.value for interval in key_intervals]
-                ranges[key] = (min(values), max(values))
-        return ranges
+        return {key: (min(values), max(values)) for key, values in self._values_by_key().items()}
     
     def get_average_values_by_key(self) -> dict[str, float]:
         """Get average value for each key across all its intervals.
@@ -382,13 +624,7 @@ class AggregateResponse:
         Returns:
             dict[str, float]: Dictionary mapping keys to their average values.
         """
-        averages = {}
-        for key in self.get_keys():
-            key_intervals = self.get_intervals_for_key(key)
-            if key_intervals:
-                values = [interval.value for interval in key_intervals]
-                averages[key] = sum(values) / len(values)
-        return averages
+        return {key: sum(values) / len(values) for key, values in self._values_by_key().items()}
     
     def get_quality_summary(self) -> dict[str, int]:
         """Get count of intervals by quality code.
@@ -396,10 +632,7 @@ class AggregateResponse:
         Returns:
             dict[str, int]: Dictionary mapping quality codes to their counts.
         """
-        quality_counts: dict[str, int] = {}
-        for interval in self.intervals:
-            quality_counts[interval.quality_code] = quality_counts.get(interval.quality_code, 0) + 1
-        return quality_counts
+        return dict(Counter(self._columns()['quality_code']))
     
     def get_statistic_summary(self) -> dict[str, int]:
         """Get count of intervals by statistic type.
@@ -407,10 +640,7 @@ class AggregateResponse:
         Returns:
             dict[str, int]: Dictionary mapping statistic types to their counts.
         """
-        stat_counts: dict[str, int] = {}
-        for interval in self.intervals:
-            stat_counts[interval.statistic_type] = stat_counts.get(interval.statistic_type, 0) + 1
-        return stat_counts
+        return dict(Counter(self._columns()['statistic_type']))
     
     def get_data_count(self) -> int:
         """Get total number of aggregate intervals.
@@ -426,7 +656,8 @@ class AggregateResponse:
         Returns:
             dict[str, int]: Dictionary mapping keys to their interval counts.
         """
-        return {key: len(self.get_intervals_for_key(key)) for key in self.get_keys()}
+        counts = Counter(self._columns()['key'])
+        return {key: counts[key] for key in sorted(counts)}
     
     def has_data(self) -> bool:
         """Check if the response contains any data.
@@ -443,15 +674,11 @@ class AggregateResponse:
             dict[str, dict[str, list[AggregateInterval]]]: Nested dictionary with key -> statistic_type -> intervals.
         """
         result = {}
-        for key in self.get_keys():
+        for key, key_intervals in self._group_by_key().items():
             key_data: dict[str, list[AggregateInterval]] = {}
-            key_intervals = self.get_intervals_for_key(key)
             for interval in key_intervals:
-                if interval.statistic_type not in key_data:
-                    key_data[interval.statistic_type] = []
-                key_data[interval.statistic_type].append(interval)
-            if key_data:
-                result[key] = key_data
+                key_data.setdefault(interval.statistic_type, []).append(interval)
+            result[key] = key_data
         return result
     
     def get_tagged_intervals(self) -> list[AggregateInterval]:
@@ -468,11 +695,8 @@ class AggregateResponse:
         Returns:
             dict[str, tuple[int, int]]: Dictionary mapping keys to (earliest_start, latest_end) timestamps.
         """
-        coverage = {}
-        for key in self.get_keys():
-            key_intervals = self.get_intervals_for_key(key)
-            if key_intervals:
-                starts = [interval.start_millis_since_epoch for interval in key_intervals]
-                ends = [interval.end_millis_since_epoch for interval in key_intervals]
-                coverage[key] = (min(starts), max(ends))
-        return coverage
+        # Each group is sorted by start time, so only the ends need scanning
+        return {
+            key: (key_intervals[0].start_millis_since_epoch, max(interval.end_millis_since_epoch for interval in key_intervals))
+            for key, key_intervals in self._group_by_key().items()
+        }
@@ -4,14 +4,14 @@ from dataclasses import dataclass, field
 # Local imports
 from dbhydro_py.utils import dataclass_from_dict
 
-@dataclass
+@dataclass(slots=True)
 class Status:
     """Common status information for API responses."""
     status_code: int = field(metadata={'json_key': 'statusCode'})
     message: str = field(metadata={'json_key': 'statusMessage'})
     elapsed_time: float = field(metadata={'json_key': 'elapsedTime'})
 
-@dataclass
+@dataclass(slots=True)
 class ApiResponseBase:
     """Base class for all API responses containing common status information."""
     status: Status
@@ -1,10 +1,11 @@
 """Response models for DBHydro interpolate endpoint."""
 
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
-
-# Local imports
-from dbhydro_py.utils import dataclass_from_dict
+from operator import attrgetter
+from sys import intern
+from typing import Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -29,8 +30,16 @@ InterpolateResponse
             └── date
 """
 
+# DataFrame columns produced by InterpolateResponse.to_dataframe
+_BASIC_COLUMNS = ('key', 'value', 'quality_code', 'origin')
+_METADATA_COLUMNS = ('key_type', 'ms_since_epoch', 'percent_available', 'time', 'date', 'tag')
+
+# Getters for the entry attributes stored column-wise by InterpolateResponse._columns(); the
+# optional tag is extracted separately
+_COLUMN_GETTERS = {name: attrgetter(name) for name in _BASIC_COLUMNS + _METADATA_COLUMNS if name != 'tag'}
+
 
-@dataclass
+@dataclass(slots=True)
 class InterpolateTag:
     """Tag information for interpolated data."""
     tag: Optional[str] = field(metadata={'json_key': 'tag'})
@@ -38,10 +47,10 @@ class InterpolateTag:
     @classmethod
     def from_dict(cls, data: dict) -> 'InterpolateTag':
         """Create InterpolateTag from dictionary."""
-        return dataclass_from_dict(cls, data)  # type: ignore
+        return cls(data.get('tag'))
 
 
-@dataclass
+@dataclass(slots=True)
 class InterpolateEntry:
     """Single interpolated data point."""
     origin: str = field(metadata={'json_key': 'origin'})
@@ -56,22 +65,86 @@ class InterpolateEntry:
     date: int = field(metadata={'json_key': 'date'})
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'InterpolateEntry':
-        """Create InterpolateEntry from dictionary."""
-        return dataclass_from_dict(cls, data)  # type: ignore
+    def from_dict(cls, data: dict[str, Any]) -> 'InterpolateEntry':
+        """Create InterpolateEntry from dictionary.
+        
+        Written out by hand rather than generated by `dataclass_from_dict`, building the nested
+        InterpolateTag inline. Missing keys become None, as with `dataclass_from_dict`.
+        
+        The origin, key, key type and quality code repeat across entries, so they are interned:
+        every entry shares one string object per distinct value instead of holding its own copy
+        from the JSON parser, and grouping or counting on them compares by identity.
+        """
+        get: Callable[[str], Any] = data.get
+        tag = get('tag')
+        if tag is not None:
+            tag = InterpolateTag(tag.get('tag'))
+        origin = get('origin')
+        key = get('key')
+        key_type = get('keyType')
+        quality_code = get('qualityCode')
+        return cls(
+            intern(origin) if type(origin) is str else origin,
+            intern(key) if type(key) is str else key,
+            intern(key_type) if type(key_type) is str else key_type,
+            get('msSinceEpoch'),
+            get('value'),
+            tag,
+            intern(quality_code) if type(quality_code) is str else quality_code,
+            get('percentAvailable'),
+            get('time'),
+            get('date')
+        )
 
 
-@dataclass
-class InterpolateResponse:
-    """Response from the interpolate endpoint containing interpolated data points."""
+class _InterpolateResponseCaches:
+    """Cache slots of `InterpolateResponse`, declared outside the dataclass so `fields()` and `asdict()` skip them."""
+    if not TYPE_CHECKING:  # see aggregate._AggregateResponseCaches
+        __slots__ = ('_summary_cache', '_groups_cache', '_key_values_cache', '_columns_cache')
+    # Sorted unique values of the entries, built on first use; see _summary()
+    _summary_cache: Optional[tuple[list, int, dict[str, list[str]]]]
+    # Entries grouped by key, built on first use; see _group_by_key()
+    _groups_cache: Optional[tuple[list, int, dict[str, list[InterpolateEntry]]]]
+    # Values of each key group, built on first use; see _values_by_key()
+    _key_values_cache: Optional[tuple[list, int, dict[str, list[float]]]]
+    # Entry attributes as parallel columns, built on first use; see _columns()
+    _columns_cache: Optional[tuple[list, int, dict[str, tuple]]]
+
+
+@dataclass(slots=True)
+class InterpolateResponse(_InterpolateResponseCaches):
+    """Response from the interpolate endpoint containing interpolated data points.
+    
+    Derived data (unique values, entry groups by key, attribute columns) is cached on first
+    use and rebuilt automatically when `entries` is replaced or changes length. Replacing
+    an entry in place or editing its fields is not detected; call `clear_cache()` afterwards.
+    """
     entries: list[InterpolateEntry] = field(default_factory=list, metadata={'json_key': 'list'})
     
+    def __post_init__(self) -> None:
+        # Cache slots get no dataclass default
+        self.clear_cache()
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'InterpolateResponse':
         """Create InterpolateResponse from dictionary."""
-        # Use dataclass_from_dict - entries will always be a list due to default_factory
-        result: InterpolateResponse = dataclass_from_dict(cls, data)
-        return result
+        # Build the entries straight from the parsed JSON; a missing or null list becomes empty
+        entries = data.get('list')
+        if not entries:
+            return cls()
+        entry_from_dict = InterpolateEntry.from_dict
+        return cls([entry_from_dict(entry) for entry in entries])
+    
+    def clear_cache(self) -> None:
+        """Discard the cached derived data so the next getter rebuilds it from `entries`.
+        
+        Needed after replacing an entry in place (e.g. `entries[0] = ...`) or editing an
+        entry's fields; appending, removing or assigning a new list is picked up automatically.
+        """
+        self._summary_cache = None
+        self._groups_cache = None
+        self._key_values_cache = None
+        self._columns_cache = None
     
     def to_dataframe(self, include_metadata: bool = False) -> 'pd.DataFrame':
         """Convert interpolated data to pandas DataFrame.
@@ -102,36 +175,67 @@ class InterpolateResponse:
                 'Install it with: pip install pandas'
             )
         
+        names = _BASIC_COLUMNS + _METADATA_COLUMNS if include_metadata else _BASIC_COLUMNS
         if not self.entries:
             # Return empty DataFrame with expected columns
-            columns = ['key', 'value', 'quality_code', 'origin']
-            if include_metadata:
-                columns.extend(['key_type', 'ms_since_epoch', 'percent_available', 'time', 'date', 'tag'])
-            return pd.DataFrame(columns=columns)
-        
-        # Convert entries to list of dictionaries
-        data_rows = []
-        for entry in self.entries:
-            row = {
-                'key': entry.key,
-                'value': entry.value,
-                'quality_code': entry.quality_code,
-                'origin': entry.origin
-            }
-            
-            if include_metadata:
-                row.update({
-                    'key_type': entry.key_type,
-                    'ms_since_epoch': entry.ms_since_epoch,
-                    'percent_available': entry.percent_available,
-                    'time': entry.time,
-                    'date': entry.date,
-                    'tag': entry.tag.tag if entry.tag else None
-                })
-            
-            data_rows.append(row)
+            return pd.DataFrame(columns=list(names))
         
-        return pd.DataFrame(data_rows)
+        # Assemble the frame from the stored columns rather than one dict per row
+        stored = self._columns()
+        return pd.DataFrame({name: stored[name] for name in names})
+    
+    def _columns(self) -> dict[str, tuple]:
+        """Extract one tuple per entry attribute.
+        
+        Methods that only read one or two attributes scan these columns instead of every
+        entry object. The result is cached and rebuilt when `entries` is replaced or
+        changes length; callers must not rely on it reflecting in-place edits of an entry.
+        
+        Returns:
+            dict[str, tuple]: Attribute values in entry order, keyed by DataFrame column name.
+        """
+        entries = self.entries
+        cache = self._columns_cache
+        if cache is not None and cache[0] is entries and cache[1] == len(entries):
+            return cache[2]
+        
+        # map() drives each getter over the list in C, without a per-entry Python frame
+        columns = {name: tuple(map(getter, entries)) for name, getter in _COLUMN_GETTERS.items()}
+        columns['tag'] = tuple(entry.tag.tag if entry.tag else None for entry in entries)
+        self._columns_cache = (entries, len(entries), columns)
+        return columns
+    
+    def _summary(self) -> dict[str, list[str]]:
+        """Collect the sorted unique keys, quality codes, origins and key types in one pass.
+        
+        The result is cached and rebuilt when `entries` is replaced or changes length.
+        
+        Returns:
+            dict[str, list[str]]: Sorted unique values by attribute name.
+        """
+        entries = self.entries
+        cache = self._summary_cache
+        if cache is not None and cache[0] is entries and cache[1] == len(entries):
+            return cache[2]
+        
+        keys = set()
+        quality_codes = set()
+        origins = set()
+        key_types = set()
+        for entry in entries:
+            keys.add(entry.key)
+            quality_codes.add(entry.quality_code)
+            origins.add(entry.origin)
+            key_types.add(entry.key_type)
+        
+        summary = {
+            'keys': sorted(keys),
+            'quality_codes': sorted(quality_codes),
+            'origins': sorted(origins),
+            'key_types': sorted(key_types),
+        }
+        self._summary_cache = (entries, len(entries), summary)
+        return summary
     
     def get_keys(self) -> list[str]:
         """Get list of all unique keys in the response.
@@ -139,8 +243,7 @@ class InterpolateResponse:
         Returns:
             list[str]: List of unique keys, sorted.
         """
-        keys = set(entry.key for entry in self.entries)
-        return sorted(keys)
+        return list(self._summary()['keys'])
     
     def get_values(self) -> list[float]:
         """Get list of all values in the response.
@@ -148,7 +251,7 @@ class InterpolateResponse:
         Returns:
             list[float]: List of all interpolated values.
         """
-        return [entry.value for entry in self.entries]
+        return list(self._columns()['value'])
     
     def get_quality_codes(self) -> list[str]:
         """Get list of all unique quality codes in the response.
@@ -156,8 +259,7 @@ class InterpolateResponse:
         Returns:
             list[str]: List of unique quality codes, sorted.
         """
-        quality_codes = set(entry.quality_code for entry in self.entries)
-        return sorted(quality_codes)
+        return list(self._summary()['quality_codes'])
     
     def get_origins(self) -> list[str]:
         """Get list of all unique data origins in the response.
@@ -165,8 +267,7 @@ class InterpolateResponse:
         Returns:
             list[str]: List of unique origins, sorted.
         """
-        origins = set(entry.origin for entry in self.entries)
-        return sorted(origins)
+        return list(self._summary()['origins'])
     
     def get_key_types(self) -> list[str]:
         """Get list of all unique key types in the response.
@@ -174,8 +275,7 @@ class InterpolateResponse:
         Returns:
             list[str]: List of unique key types, sorted.
         """
-        key_types = set(entry.key_type for entry in self.entries)
-        return sorted(key_types)
+        return list(self._summary()['key_types'])
     
     def get_timestamps(self) -> list[int]:
         """Get list of all timestamps in the response, sorted.
@@ -183,7 +283,7 @@ class InterpolateResponse:
         Returns:
             list[int]: List of ms_since_epoch timestamps, sorted.
         """
-        return sorted(entry.ms_since_epoch for entry in self.entries)
+        return sorted(self._columns()['ms_since_epoch'])
     
     def get_value_range(self) -> tuple[float, float] | None:
         """Get min/max value range.
@@ -191,7 +291,7 @@ class InterpolateResponse:
         Returns:
             tuple[float, float] | None: (min, max) values or None if no data.
         """
-        values = self.get_values()
+        values = self._columns()['value']
         return (min(values), max(values)) if values else None
     
     def get_timestamp_range(self) -> tuple[int, int] | None:
@@ -200,7 +300,7 @@ class InterpolateResponse:
         Returns:
             tuple[int, int] | None: (earliest, latest) timestamp or None if no data.
         """
-        timestamps = self.get_timestamps()
+        timestamps = self._columns()['ms_since_epoch']
         return (min(timestamps), max(timestamps)) if timestamps else None
     
     def filter_by_key(self, keys: list[str]) -> 'InterpolateResponse':
@@ -212,7 +312,8 @@ class InterpolateResponse:
         Returns:
             InterpolateResponse: New response containing only entries with specified keys.
         """
-        filtered_entries = [entry for entry in self.entries if entry.key in keys]
+        key_set = frozenset(keys)
+        filtered_entries = [entry for entry in self.entries if entry.key in key_set]
         return InterpolateResponse(entries=filtered_entries)
     
     def filter_by_quality(self, quality_codes: list[str]) -> 'InterpolateResponse':
@@ -224,7 +325,8 @@ class InterpolateResponse:
         Returns:
             InterpolateResponse: New response containing only entries with specified quality codes.
         """
-        filtered_entries = [entry for entry in self.entries if entry.quality_code in quality_codes]
+        quality_set = frozenset(quality_codes)
+        filtered_entries = [entry for entry in self.entries if entry.quality_code in quality_set]
         return InterpolateResponse(entries=filtered_entries)
     
     def filter_by_origin(self, origins: list[str]) -> 'InterpolateResponse':
@@ -236,7 +338,8 @@ class InterpolateResponse:
         Returns:
             InterpolateResponse: New response containing only entries from specified origins.
         """
-        filtered_entries = [entry for entry in self.entries if entry.origin in origins]
+        origin_set = frozenset(origins)
+        filtered_entries = [entry for entry in self.entries if entry.origin in origin_set]
         return InterpolateResponse(entries=filtered_entries)
     
     def get_entries_for_key(self, key: str) -> list[InterpolateEntry]:
@@ -248,7 +351,50 @@ class InterpolateResponse:
         Returns:
             list[InterpolateEntry]: List of entries for the specified key.
         """
-        return [entry for entry in self.entries if entry.key == key]
+        return list(self._group_by_key().get(key, ()))
+    
+    def _group_by_key(self) -> dict[str, list[InterpolateEntry]]:
+        """Group entries by key in a single pass.
+        
+        The result is cached and rebuilt when `entries` is replaced or changes length;
+        callers must not modify the returned lists.
+        
+        Returns:
+            dict[str, list[InterpolateEntry]]: Entries for each key, in sorted key order and original entry order.
+        """
+        entries = self.entries
+        cache = self._groups_cache
+        if cache is not None and cache[0] is entries and cache[1] == len(entries):
+            return cache[2]
+        
+        groups: dict[str, list[InterpolateEntry]] = {}
+        for entry in entries:
+            groups.setdefault(entry.key, []).append(entry)
+        groups = {key: groups[key] for key in sorted(groups)}
+        self._groups_cache = (entries, len(entries), groups)
+        return groups
+    
+    def _values_by_key(self) -> dict[str, list[float]]:
+        """Get the values of each key group from `_group_by_key()`.
+        
+        The per-key statistics reduce these lists with the C builtins, so repeated calls
+        skip the attribute reads. Cached like `_group_by_key()`; callers must not modify
+        the returned lists.
+        
+        Returns:
+            dict[str, list[float]]: Values for each key, in the same order as its group.
+        """
+        entries = self.entries
+        cache = self._key_values_cache
+        if cache is not None and cache[0] is entries and cache[1] == len(entries):
+            return cache[2]
+        
+        values = {
+            key: [entry.value for entry in key_entries]
+            for key, key_entries in self._group_by_key().items()
+        }
+        self._key_values_cache = (entries, len(entries), values)
+        return values
     
     def get_latest_value_by_key(self) -> dict[str, float]:
         """Get the most recent value for each key.
@@ -256,13 +402,10 @@ class InterpolateResponse:
         Returns:
             dict[str, float]: Dictionary mapping keys to their latest values.
         """
-        latest_values = {}
-        for key in self.get_keys():
-            key_entries = self.get_entries_for_key(key)
-            if key_entries:
-                latest_entry = max(key_entries, key=lambda e: e.ms_since_epoch)
-                latest_values[key] = latest_entry.value
-        return latest_values
+        return {
+            key: max(key_entries, key=attrgetter('ms_since_epoch')).value
+            for key, key_entries in self._group_by_key().items()
+        }
     
     def get_earliest_value_by_key(self) -> dict[str, float]:
         """Get the earliest value for each key.
@@ -270,13 +413,10 @@ class InterpolateResponse:
         Returns:
             dict[str, float]: Dictionary mapping keys to their earliest values.
         """
-        earliest_values = {}
-        for key in self.get_keys():
-            key_entries = self.get_entries_for_key(key)
-            if key_entries:
-                earliest_entry = min(key_entries, key=lambda e: e.ms_since_epoch)
-                earliest_values[key] = earliest_entry.value
-        return earliest_values
+        return {
+            key: min(key_entries, key=attrgetter('ms_since_epoch')).value
+            for key, key_entries in self._group_by_key().items()
+        }
     
     def get_average_values_by_key(self) -> dict[str, float]:
         """Get average value for each key.
@@ -284,13 +424,7 @@ class InterpolateResponse:
         Returns:
             dict[str, float]: Dictionary mapping keys to their average values.
         """
-        averages = {}
-        for key in self.get_keys():
-            key_entries = self.get_entries_for_key(key)
-            if key_entries:
-                values = [entry.value for entry in key_entries]
-                averages[key] = sum(values) / len(values)
-        return averages
+        return {key: sum(values) / len(values) for key, values in self._values_by_key().items()}
     
     def get_value_ranges_by_key(self) -> dict[str, tuple[float, float]]:
         """Get value range for each key.
@@ -298,13 +432,7 @@ class InterpolateResponse:
         Returns:
             dict[str, tuple[float, float]]: Dictionary mapping keys to (min, max) tuples.
         """
-        ranges = {}
-        for key in self.get_keys():
-            key_entries = self.get_entries_for_key(key)
-            if key_entries:
-                values = [entry.value for entry in key_entries]
-                ranges[key] = (min(values), max(values))
-        return ranges
+        return {key: (min(values), max(values)) for key, values in self._values_by_key().items()}
     
     def get_quality_summary(self) -> dict[str, int]:
         """Get count of entries by quality code.
@@ -312,10 +440,7 @@ class InterpolateResponse:
         Returns:
             dict[str, int]: Dictionary mapping quality codes to their counts.
         """
-        quality_counts: dict[str, int] = {}
-        for entry in self.entries:
-            quality_counts[entry.quality_code] = quality_counts.get(entry.quality_code, 0) + 1
-        return quality_counts
+        return dict(Counter(self._columns()['quality_code']))
     
     def get_data_count(self) -> int:
         """Get total number of interpolated data points.
@@ -331,7 +456,7 @@ class InterpolateResponse:
         Returns:
             dict[str, int]: Dictionary mapping keys to their entry counts.
         """
-        return {key: len(self.get_entries_for_key(key)) for key in self.get_keys()}
+        return {key: len(key_entries) for key, key_entries in self._group_by_key().items()}
     
     def has_data(self) -> bool:
         """Check if the response contains any data.
@@ -348,15 +473,11 @@ class InterpolateResponse:
             dict[str, dict[str, list[InterpolateEntry]]]: Nested dictionary with key -> quality_code -> entries.
         """
         result = {}
-        for key in self.get_keys():
+        for key, key_entries in self._group_by_key().items():
             key_data: dict[str, list[InterpolateEntry]] = {}
-            key_entries = self.get_entries_for_key(key)
             for entry in key_entries:
-                if entry.quality_code not in key_data:
-                    key_data[entry.quality_code] = []
-                key_data[entry.quality_code].append(entry)
-            if key_data:
-                result[key] = key_data
+                key_data.setdefault(entry.quality_code, []).append(entry)
+            result[key] = key_data
         return result
     
     def get_tagged_entries(self) -> list[InterpolateEntry]:
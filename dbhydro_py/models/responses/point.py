@@ -1,10 +1,12 @@
 """Response models for DBHydro tsarithmetic endpoint."""
 
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING, cast
 
 from dbhydro_py.models.responses.base import Status
-from dbhydro_py.utils import dataclass_from_dict
+from dbhydro_py.utils import dataclass_constructor, dataclass_from_dict
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -27,8 +29,12 @@ PointResponse
             └── quality_code (optional)
 """
 
+# DataFrame columns produced by PointResponse.to_dataframe
+_BASIC_COLUMNS = ('value', 'timestamp')
+_METADATA_COLUMNS = ('ms_since_epoch', 'quality_code')
 
-@dataclass
+
+@dataclass(slots=True)
 class Point:
     """Single point data from tsarithmetic endpoint."""
     # The actual structure will depend on what a valid response looks like
@@ -47,7 +53,7 @@ class Point:
         return dataclass_from_dict(cls, data)  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class PointResponse:
     """Response from the tsarithmetic endpoint."""
     status: Status = field(metadata={'json_key': 'status'})
@@ -56,24 +62,24 @@ class PointResponse:
     @classmethod
     def from_dict(cls, data: dict) -> 'PointResponse':
         """Create PointResponse from dictionary."""
-        # Use dataclass_from_dict but handle point conversion
-        result: PointResponse = dataclass_from_dict(cls, data)
+        # A missing status is passed through as None, as dataclass_from_dict does
+        status_data = data.get('status')
+        status = cast(Status, None if status_data is None else dataclass_from_dict(Status, status_data))
         
-        # Convert dictionary points to Point objects if needed
-        if result.points:
-            converted_points: list[Point | None] = []
-            for point_item in result.points:
-                if point_item is None:
-                    converted_points.append(None)
-                elif isinstance(point_item, dict):
-                    # Convert dictionary to Point object
-                    converted_points.append(Point.from_dict(point_item))
-                elif isinstance(point_item, Point):
-                    # Already a Point object
-                    converted_points.append(point_item)
-            result.points = converted_points
+        # Convert the points straight from the parsed JSON in one pass
+        points: list[Point | None] = []
+        append = points.append
+        point_from_dict = dataclass_constructor(Point)
+        for point_item in data.get('points') or ():
+            if point_item is None:
+                append(None)
+            elif isinstance(point_item, dict):
+                append(point_from_dict(point_item))
+            elif isinstance(point_item, Point):
+                # Already a Point object
+                append(point_item)
         
-        return result
+        return cls(status, points)
     
     def to_dataframe(self, include_metadata: bool = False) -> 'pd.DataFrame':
         """Convert point data to pandas DataFrame.
@@ -106,26 +112,21 @@ class PointResponse:
         
         if not valid_points:
             # Return empty DataFrame with expected columns
-            columns = ['value', 'timestamp'] if not include_metadata else ['value', 'timestamp', 'ms_since_epoch', 'quality_code']
-            return pd.DataFrame(columns=columns)
+            names = _BASIC_COLUMNS + _METADATA_COLUMNS if include_metadata else _BASIC_COLUMNS
+            return pd.DataFrame(columns=list(names))
         
-        # Convert points to records
-        records = []
-        for point in valid_points:
-            record: dict[str, Any] = {}
-            
-            # Essential columns
-            record['value'] = point.value
-            record['timestamp'] = point.timestamp
-            
-            # Additional metadata if requested
-            if include_metadata:
-                record['ms_since_epoch'] = point.ms_since_epoch
-                record['quality_code'] = point.quality_code
-            
-            records.append(record)
+        # Build one column per attribute rather than one dict per row
+        columns: dict[str, list] = {
+            'value': [point.value for point in valid_points],
+            'timestamp': [point.timestamp for point in valid_points],
+        }
         
-        return pd.DataFrame(records)
+        # Additional metadata if requested
+        if include_metadata:
+            columns['ms_since_epoch'] = [point.ms_since_epoch for point in valid_points]
+            columns['quality_code'] = [point.quality_code for point in valid_points]
+        
+        return pd.DataFrame(columns)
     
     def get_valid_points(self) -> list[Point]:
         """Get list of valid (non-None) points.
@@ -141,7 +142,15 @@ class PointResponse:
         Returns:
             list[float]: List of values, excluding None values.
         """
-        return [point.value for point in self.get_valid_points() if point.value is not None]
+        return [point.value for point in self.points if point is not None and point.value is not None]
+    
+    def iter_values(self) -> Iterator[float]:
+        """Iterate over all non-null values without collecting them into a list.
+        
+        Returns:
+            Iterator[float]: Values in point order, excluding None values.
+        """
+        return (point.value for point in self.points if point is not None and point.value is not None)
     
     def get_quality_codes(self) -> list[str]:
         """Get list of all unique quality codes.
@@ -149,11 +158,10 @@ class PointResponse:
         Returns:
             list[str]: List of unique quality codes, sorted.
         """
-        quality_codes = set()
-        for point in self.get_valid_points():
-            if point.quality_code is not None:
-                quality_codes.add(point.quality_code)
-        return sorted(quality_codes)
+        return sorted({
+            point.quality_code for point in self.points
+            if point is not None and point.quality_code is not None
+        })
     
     def get_timestamps(self) -> list[int]:
         """Get list of all timestamps.
@@ -162,7 +170,9 @@ class PointResponse:
             list[int]: List of timestamps, excluding None values.
         """
         timestamps = []
-        for point in self.get_valid_points():
+        for point in self.points:
+            if point is None:
+                continue
             if point.timestamp is not None:
                 timestamps.append(point.timestamp)
             elif point.ms_since_epoch is not None:
@@ -175,8 +185,17 @@ class PointResponse:
         Returns:
             tuple[float, float] | None: (min, max) values or None if no data.
         """
-        values = self.get_values()
-        return (min(values), max(values)) if values else None
+        # Track both ends in one pass, skipping null points and values
+        low = high = None
+        for point in self.points:
+            if point is None or point.value is None:
+                continue
+            value = point.value
+            if low is None or value < low:
+                low = value
+            if high is None or value > high:
+                high = value
+        return None if low is None or high is None else (low, high)
     
     def get_timestamp_range(self) -> tuple[int, int] | None:
         """Get timestamp range.
@@ -184,8 +203,19 @@ class PointResponse:
         Returns:
             tuple[int, int] | None: (earliest, latest) timestamp or None if no data.
         """
-        timestamps = self.get_timestamps()
-        return (min(timestamps), max(timestamps)) if timestamps else None
+        # Track both ends in one pass instead of sorting, with the same fallback as get_timestamps()
+        earliest = latest = None
+        for point in self.points:
+            if point is None:
+                continue
+            timestamp = point.timestamp if point.timestamp is not None else point.ms_since_epoch
+            if timestamp is None:
+                continue
+            if earliest is None or timestamp < earliest:
+                earliest = timestamp
+            if latest is None or timestamp > latest:
+                latest = timestamp
+        return None if earliest is None or latest is None else (earliest, latest)
     
     def filter_by_quality(self, quality_codes: list[str]) -> 'PointResponse':
         """Filter points by quality codes.
@@ -196,12 +226,11 @@ class PointResponse:
         Returns:
             PointResponse: New response containing only points with specified quality codes.
         """
-        filtered_points: list[Point | None] = []
-        for point in self.points:
-            if point is None:
-                continue
-            if point.quality_code in quality_codes:
-                filtered_points.append(point)
+        quality_set = frozenset(quality_codes)
+        filtered_points: list[Point | None] = [
+            point for point in self.points
+            if point is not None and point.quality_code in quality_set
+        ]
         
         return PointResponse(status=self.status, points=filtered_points)
     
@@ -211,8 +240,13 @@ class PointResponse:
         Returns:
             float | None: Average value or None if no valid values.
         """
-        values = self.get_values()
-        return sum(values) / len(values) if values else None
+        # Accumulate in one pass rather than building the list of values first
+        total = 0.0
+        count = 0
+        for value in self.iter_values():
+            total += value
+            count += 1
+        return total / count if count else None
     
     def get_quality_summary(self) -> dict[str, int]:
         """Get count of points by quality code.
@@ -220,11 +254,10 @@ class PointResponse:
         Returns:
             dict[str, int]: Dictionary mapping quality codes to their counts.
         """
-        quality_counts: dict[str, int] = {}
-        for point in self.get_valid_points():
-            if point.quality_code is not None:
-                quality_counts[point.quality_code] = quality_counts.get(point.quality_code, 0) + 1
-        return quality_counts
+        return dict(Counter(
+            point.quality_code for point in self.points
+            if point is not None and point.quality_code is not None
+        ))
     
     def get_data_count(self) -> int:
         """Get total number of valid data points.
@@ -232,7 +265,9 @@ class PointResponse:
         Returns:
             int: Count of valid (non-None) points.
         """
-        return len(self.get_valid_points())
+        # list.count compares in C, without building the list of valid points
+        points = self.points
+        return len(points) - points.count(None)
     
     def get_null_count(self) -> int:
         """Get count of null/None points.
@@ -240,7 +275,7 @@ class PointResponse:
         Returns:
             int: Count of None points in the response.
         """
-        return sum(1 for point in self.points if point is None)
+        return self.points.count(None)
     
     def has_data(self) -> bool:
         """Check if the response contains any valid data points.
@@ -248,7 +283,8 @@ class PointResponse:
         Returns:
             bool: True if there are valid data points, False otherwise.
         """
-        return len(self.get_valid_points()) > 0
+        points = self.points
+        return points.count(None) < len(points)
     
     def has_null_points(self) -> bool:
         """Check if the response contains any null points.
@@ -256,7 +292,7 @@ class PointResponse:
         Returns:
             bool: True if there are null points, False otherwise.
         """
-        return self.get_null_count() > 0
+        return None in self.points
     
     def get_latest_value(self) -> float | None:
         """Get the value from the point with the latest timestamp.
@@ -264,16 +300,17 @@ class PointResponse:
         Returns:
             float | None: Latest value or None if no valid data.
         """
-        valid_points = self.get_valid_points()
-        if not valid_points:
-            return None
-        
-        # Find point with latest timestamp
-        latest_point = max(
-            valid_points,
-            key=lambda p: p.timestamp or p.ms_since_epoch or 0
-        )
-        return latest_point.value
+        # Track the latest point in one pass; points without a timestamp count as 0 and ties keep the first
+        latest_point: Point | None = None
+        latest = 0
+        for point in self.points:
+            if point is None:
+                continue
+            timestamp = point.timestamp or point.ms_since_epoch or 0
+            if latest_point is None or timestamp > latest:
+                latest_point = point
+                latest = timestamp
+        return None if latest_point is None else latest_point.value
     
     def get_earliest_value(self) -> float | None:
         """Get the value from the point with the earliest timestamp.
@@ -281,16 +318,17 @@ class PointResponse:
         Returns:
             float | None: Earliest value or None if no valid data.
         """
-        valid_points = self.get_valid_points()
-        if not valid_points:
-            return None
-        
-        # Find point with earliest timestamp
-        earliest_point = min(
-            valid_points,
-            key=lambda p: p.timestamp or p.ms_since_epoch or float('inf')
-        )
-        return earliest_point.value
+        # Track the earliest point in one pass; points without a timestamp sort last and ties keep the first
+        earliest_point: Point | None = None
+        earliest: float = 0
+        for point in self.points:
+            if point is None:
+                continue
+            timestamp = point.timestamp or point.ms_since_epoch or float('inf')
+            if earliest_point is None or timestamp < earliest:
+                earliest_point = point
+                earliest = timestamp
+        return None if earliest_point is None else earliest_point.value
     
     def get_points_by_quality(self) -> dict[str, list[Point]]:
         """Group points by quality code.
@@ -299,9 +337,7 @@ class PointResponse:
             dict[str, list[Point]]: Dictionary mapping quality codes to their points.
         """
         result: dict[str, list[Point]] = {}
-        for point in self.get_valid_points():
-            if point.quality_code is not None:
-                if point.quality_code not in result:
-                    result[point.quality_code] = []
-                result[point.quality_code].append(point)
+        for point in self.points:
+            if point is not None and point.quality_code is not None:
+                result.setdefault(point.quality_code, []).append(point)
         return result
\ No newline at end of file
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from itertools import chain
+from operator import attrgetter
+from sys import intern
+from typing import Any, Optional, TYPE_CHECKING
 
 # Local imports
 from dbhydro_py.models.responses.base import ApiResponseBase
-from dbhydro_py.utils import dataclass_from_dict
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -32,8 +36,35 @@ SynchronizeResponse
                         └── tag (dict)
 """
 
+# Getters for the value attributes stored column-wise by SynchronizeEntry._column(), keyed by DataFrame column name
+_COLUMN_GETTERS = {name: attrgetter(name) for name in (
+    'ms_since_epoch', 'value', 'quality_code', 'origin', 'key_type', 'tag', 'percent_available'
+)}
 
-@dataclass
+
+def _typed_columns(columns: dict[str, list]) -> dict[str, Any]:
+    """Pack the timestamp and value columns into int64 and float64 arrays.
+    
+    pandas takes typed arrays as they are instead of inspecting every Python object to
+    infer a dtype. A column with missing values is left as a list for pandas to infer,
+    as before.
+    
+    Args:
+        columns (dict[str, list]): DataFrame columns as lists.
+    """
+    import numpy as np
+    
+    typed: dict[str, Any] = dict(columns)
+    for name, dtype in (('ms_since_epoch', np.int64), ('value', np.float64)):
+        column = columns[name]
+        try:
+            typed[name] = np.fromiter(column, dtype=dtype, count=len(column))
+        except TypeError:
+            pass
+    return typed
+
+
+@dataclass(slots=True)
 class SynchronizeValue:
     """Single data point for a station in synchronized data."""
     ms_since_epoch: int = field(metadata={'json_key': 'msSinceEpoch'})
@@ -45,22 +76,78 @@ class SynchronizeValue:
     tag: dict = field(metadata={'json_key': 'tag'})
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'SynchronizeValue':
-        """Create SynchronizeValue from dictionary."""
-        return dataclass_from_dict(cls, data)  # type: ignore
+    def from_dict(cls, data: dict[str, Any]) -> 'SynchronizeValue':
+        """Create SynchronizeValue from dictionary.
+        
+        Written out by hand rather than generated by `dataclass_from_dict`, since it runs once
+        per data point. Missing keys become None, as with `dataclass_from_dict`.
+        
+        The quality code, origin and key type take only a few distinct values, so they are
+        interned: all values share one string object per code instead of a copy each.
+        """
+        get: Callable[[str], Any] = data.get
+        quality_code = get('qualityCode')
+        origin = get('origin')
+        key_type = get('keyType')
+        return cls(
+            get('msSinceEpoch'),
+            get('value'),
+            intern(quality_code) if type(quality_code) is str else quality_code,
+            get('percentAvailable'),
+            intern(origin) if type(origin) is str else origin,
+            intern(key_type) if type(key_type) is str else key_type,
+            get('tag')
+        )
+
+
+@dataclass(slots=True)
+class _StationSummary:
+    """Aggregates over one station's values, computed together by SynchronizeEntry._summary()."""
+    quality_counts: Counter
+    origins: set
+    timestamp_range: Optional[tuple[int, int]]
+    value_range: Optional[tuple[float, float]]
+    value_sum: float
+    value_count: int
+    earliest_value: Optional[float]
+    latest_value: Optional[float]
+
 
+class _SynchronizeEntryCaches:
+    """Cache slots of `SynchronizeEntry`, kept off its dataclass fields so `asdict()` only sees station data."""
+    # Hidden from mypy, whose dataclass plugin only counts a slots=True subclass's own fields
+    # as slots and would reject every cache assignment
+    if not TYPE_CHECKING:
+        __slots__ = ('_columns_cache', '_summary_cache', '_index_cache')
+    # Value attributes as parallel columns, each built on first use; see _column()
+    _columns_cache: Optional[tuple[list, int, dict[str, tuple]]]
+    # Aggregates over the values, built on first use; see _summary()
+    _summary_cache: Optional[tuple[list, int, _StationSummary]]
+    # Values keyed by timestamp, built on first use; see _timestamp_index()
+    _index_cache: Optional[tuple[list, int, dict[int, SynchronizeValue]]]
 
-@dataclass
-class SynchronizeEntry:
-    """Station data containing metadata and list of synchronized values."""
+
+@dataclass(slots=True)
+class SynchronizeEntry(_SynchronizeEntryCaches):
+    """Station data containing metadata and list of synchronized values.
+    
+    Columns, aggregates and the timestamp index over `values` are cached on first use and
+    rebuilt automatically when `values` is replaced or changes length. Replacing a value in
+    place or editing its fields is not detected; call `clear_cache()` afterwards.
+    """
     station_id: str
     key: str = field(metadata={'json_key': 'key'})
     values: list[SynchronizeValue] = field(default_factory=list)
     
+    def __post_init__(self) -> None:
+        self.clear_cache()
+    
     @classmethod
     def from_dict(cls, station_id: str, station_data: dict[str, dict]) -> 'SynchronizeEntry':
         """Create SynchronizeEntry from station data grouped by timestamp."""
-        values = []
+        values: list[SynchronizeValue] = []
+        append = values.append
+        value_from_dict = SynchronizeValue.from_dict
         key = None
         
         # Extract values from each timestamp
@@ -70,42 +157,223 @@ class SynchronizeEntry:
                 if key is None:
                     key = timestamp_data.get('key', station_id)
                 
-                value = SynchronizeValue.from_dict(timestamp_data)
-                values.append(value)
+                append(value_from_dict(timestamp_data))
         
         return cls(station_id=station_id, key=key or station_id, values=values)
+    
+    def clear_cache(self) -> None:
+        """Discard the cached columns, aggregates and timestamp index of `values`.
+        
+        Needed after replacing a value in place (e.g. `values[0] = ...`) or editing a
+        value's fields; appending, removing or assigning a new list is picked up automatically.
+        """
+        self._columns_cache = None
+        self._summary_cache = None
+        self._index_cache = None
+    
+    def _column(self, name: str) -> tuple:
+        """Extract one value attribute as a tuple.
+        
+        Response methods that only read one or two attributes scan these columns instead
+        of every value object. Each column is built on first use and cached until `values`
+        is replaced or changes length; callers must not rely on it reflecting in-place
+        edits of a value.
+        
+        Args:
+            name (str): Column name, one of the keys of `_COLUMN_GETTERS`.
+        
+        Returns:
+            tuple: The attribute of each value, in value order.
+        """
+        values = self.values
+        cache = self._columns_cache
+        if cache is None or cache[0] is not values or cache[1] != len(values):
+            cache = self._columns_cache = (values, len(values), {})
+        
+        columns = cache[2]
+        column = columns.get(name)
+        if column is None:
+            # map() drives the getter over the list in C, without a per-value Python frame
+            column = columns[name] = tuple(map(_COLUMN_GETTERS[name], values))
+        return column
+    
+    def _summary(self) -> _StationSummary:
+        """Compute every per-station aggregate the response reports, in one go.
+        
+        The response-wide getters combine these per-station results instead of each
+        walking all of the values again. Cached like `_column()`.
+        
+        Returns:
+            _StationSummary: Aggregates over this station's values.
+        """
+        values = self.values
+        cache = self._summary_cache
+        if cache is not None and cache[0] is values and cache[1] == len(values):
+            return cache[2]
+        
+        timestamps = self._column('ms_since_epoch')
+        value_column = self._column('value')
+        present = [value for value in value_column if value is not None]
+        
+        # Values without a timestamp still count towards the other aggregates, but are left
+        # out of the timestamp range and the earliest/latest lookups
+        known_timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+        timestamp_range = earliest_value = latest_value = None
+        if known_timestamps:
+            first, last = min(known_timestamps), max(known_timestamps)
+            timestamp_range = (first, last)
+            # index() finds the first of any tied timestamps, with no key function called per value
+            earliest_value = value_column[timestamps.index(first)]
+            latest_value = value_column[timestamps.index(last)]
+        
+        summary = _StationSummary(
+            quality_counts=Counter(self._column('quality_code')),
+            origins=set(self._column('origin')),
+            timestamp_range=timestamp_range,
+            value_range=(min(present), max(present)) if present else None,
+            value_sum=sum(present),
+            value_count=len(present),
+            earliest_value=earliest_value,
+            latest_value=latest_value,
+        )
+        self._summary_cache = (values, len(values), summary)
+        return summary
+    
+    def _timestamp_index(self) -> dict[int, SynchronizeValue]:
+        """Index the values by timestamp, keeping the first value of any repeated timestamp.
+        
+        Cached like `_column()`, so repeated lookups by timestamp are O(1) instead of a scan.
+        
+        Returns:
+            dict[int, SynchronizeValue]: Value for each ms_since_epoch timestamp.
+        """
+        values = self.values
+        cache = self._index_cache
+        if cache is not None and cache[0] is values and cache[1] == len(values):
+            return cache[2]
+        
+        # Built back to front so the first value of a repeated timestamp is the one kept
+        index = dict(zip(reversed(self._column('ms_since_epoch')), reversed(values)))
+        self._index_cache = (values, len(values), index)
+        return index
 
 
-@dataclass
-class SynchronizeResponse:
-    """Response from the synchronize endpoint containing synchronized data points across multiple stations."""
+class _SynchronizeResponseCaches:
+    """Cache slot of `SynchronizeResponse`; see `_SynchronizeEntryCaches`."""
+    if not TYPE_CHECKING:  # see _SynchronizeEntryCaches
+        __slots__ = ('_timestamps_cache',)
+    # Sorted unique timestamps with the value lists they were built from; see get_timestamps()
+    _timestamps_cache: Optional[tuple[list[tuple[list, int]], list[int]]]
+
+
+@dataclass(slots=True)
+class SynchronizeResponse(_SynchronizeResponseCaches):
+    """Response from the synchronize endpoint containing synchronized data points across multiple stations.
+    
+    The getters read per-station data cached on each `SynchronizeEntry`, which follows the
+    entry's value list being replaced or changing length but not values edited in place;
+    call `clear_cache()` after such edits.
+    """
     stations: dict[str, SynchronizeEntry] = field(default_factory=dict)
     
+    def __post_init__(self) -> None:
+        # Only this response's own slot; the entries start out with empty caches of their own
+        self._timestamps_cache = None
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'SynchronizeResponse':
         """Create SynchronizeResponse from dictionary."""
         # The data is a nested dictionary: timestamp -> station_id -> entry_data
         # We need to restructure it to: station_id -> list of values
         
-        # Group data by station
-        station_data: dict[str, dict[str, dict]] = {}
-        for timestamp_key, stations_at_time in data.items():
+        # Convert and group the values by station in a single pass, as SynchronizeEntry.from_dict
+        # would after regrouping the raw entries by station
+        station_values: dict[str, list[SynchronizeValue]] = {}
+        station_keys: dict[str, str | None] = {}
+        value_from_dict = SynchronizeValue.from_dict
+        for stations_at_time in data.values():
             if not isinstance(stations_at_time, dict):
                 continue
                 
             for station_id, entry_data in stations_at_time.items():
                 if isinstance(entry_data, dict):
-                    if station_id not in station_data:
-                        station_data[station_id] = {}
-                    station_data[station_id][timestamp_key] = entry_data
-        
-        # Convert to SynchronizeEntry objects
-        stations = {}
-        for station_id, timestamps_data in station_data.items():
-            stations[station_id] = SynchronizeEntry.from_dict(station_id, timestamps_data)
+                    # Get the key from the first entry that has one (should be same for all)
+                    if station_keys.get(station_id) is None:
+                        station_keys[station_id] = entry_data.get('key', station_id)
+                    station_values.setdefault(station_id, []).append(value_from_dict(entry_data))
         
+        stations = {
+            station_id: SynchronizeEntry(station_id=station_id, key=station_keys[station_id] or station_id, values=values)
+            for station_id, values in station_values.items()
+        }
         return cls(stations=stations)
     
+    def clear_cache(self) -> None:
+        """Discard the cached timestamps and the cached data of every station entry.
+        
+        Needed after replacing or editing a station's values in place; see `SynchronizeEntry.clear_cache()`.
+        """
+        self._timestamps_cache = None
+        for entry in self.stations.values():
+            entry.clear_cache()
+    
+    @classmethod
+    def dataframe_from_dict(cls, data: dict, include_metadata: bool = False) -> 'pd.DataFrame':
+        """Build the same DataFrame as `to_dataframe()` directly from a response dictionary.
+        
+        Skips creating a SynchronizeValue per data point, building each column in a single pass.
+        
+        Args:
+            data (dict): The synchronize response data, as passed to `from_dict`.
+            include_metadata (bool): If True, includes additional metadata columns.
+        
+        Returns:
+            pd.DataFrame: DataFrame with columns for station_id, timestamp, value, and quality_code.
+            
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                'pandas is required for dataframe_from_dict(). Install with: pip install pandas'
+            ) from e
+        
+        # Group the timestamp -> station_id -> entry structure by station, as from_dict does
+        station_entries: dict[str, list[dict]] = {}
+        for stations_at_time in data.values():
+            if not isinstance(stations_at_time, dict):
+                continue
+            for station_id, entry_data in stations_at_time.items():
+                if isinstance(entry_data, dict):
+                    station_entries.setdefault(station_id, []).append(entry_data)
+        
+        if not station_entries:
+            return cls(stations={}).to_dataframe(include_metadata)
+        
+        columns: dict[str, list] = {'station_id': [], 'ms_since_epoch': [], 'value': [], 'quality_code': []}
+        if include_metadata:
+            columns.update({'key': [], 'origin': [], 'key_type': [], 'tag': [], 'percent_available': []})
+        
+        for station_id, entries in station_entries.items():
+            count = len(entries)
+            columns['station_id'].extend([station_id] * count)
+            columns['ms_since_epoch'].extend([entry.get('msSinceEpoch') for entry in entries])
+            columns['value'].extend([entry.get('value') for entry in entries])
+            columns['quality_code'].extend([entry.get('qualityCode') for entry in entries])
+            
+            if include_metadata:
+                # The station key comes from its first entry, as in SynchronizeEntry.from_dict
+                key = entries[0].get('key', station_id) or station_id
+                columns['key'].extend([key] * count)
+                columns['origin'].extend([entry.get('origin') for entry in entries])
+                columns['key_type'].extend([entry.get('keyType') for entry in entries])
+                columns['tag'].extend([entry.get('tag') for entry in entries])
+                columns['percent_available'].extend([entry.get('percentAvailable') for entry in entries])
+        
+        return pd.DataFrame(_typed_columns(columns))
+    
     def to_dataframe(self, include_metadata: bool = False) -> 'pd.DataFrame':
         """Convert synchronize response to a pandas DataFrame.
         
@@ -136,34 +404,31 @@ class SynchronizeResponse:
         
         if not self.stations:
             # Return empty DataFrame with expected columns
-            columns = ['station_id', 'ms_since_epoch', 'value', 'quality_code']
+            empty_columns = ['station_id', 'ms_since_epoch', 'value', 'quality_code']
             if include_metadata:
-                columns.extend(['key', 'origin', 'key_type', 'tag', 'percent_available'])
-            return pd.DataFrame(columns=columns)
+                empty_columns.extend(['key', 'origin', 'key_type', 'tag', 'percent_available'])
+            return pd.DataFrame(columns=empty_columns)
+        
+        # Build each column by extending it with the cached per-station columns rather than one dict per row
+        columns: dict[str, list] = {'station_id': [], 'ms_since_epoch': [], 'value': [], 'quality_code': []}
+        if include_metadata:
+            columns.update({'key': [], 'origin': [], 'key_type': [], 'tag': [], 'percent_available': []})
         
-        # Flatten the station-grouped structure for DataFrame
-        rows = []
         for station_id, entry in self.stations.items():
-            for value in entry.values:
-                row = {
-                    'station_id': station_id,
-                    'ms_since_epoch': value.ms_since_epoch,
-                    'value': value.value,
-                    'quality_code': value.quality_code
-                }
-                
-                if include_metadata:
-                    row.update({
-                        'key': entry.key,
-                        'origin': value.origin,
-                        'key_type': value.key_type,
-                        'tag': value.tag,
-                        'percent_available': value.percent_available
-                    })
-                
-                rows.append(row)
+            count = len(entry.values)
+            columns['station_id'].extend([station_id] * count)
+            columns['ms_since_epoch'].extend(entry._column('ms_since_epoch'))
+            columns['value'].extend(entry._column('value'))
+            columns['quality_code'].extend(entry._column('quality_code'))
+            
+            if include_metadata:
+                columns['key'].extend([entry.key] * count)
+                columns['origin'].extend(entry._column('origin'))
+                columns['key_type'].extend(entry._column('key_type'))
+                columns['tag'].extend(entry._column('tag'))
+                columns['percent_available'].extend(entry._column('percent_available'))
         
-        return pd.DataFrame(rows)
+        return pd.DataFrame(_typed_columns(columns))
     
     def get_stations(self) -> set[str]:
         """Get all station IDs in the response.
@@ -179,11 +444,28 @@ class SynchronizeResponse:
         Returns:
             list[int]: List of ms_since_epoch timestamps, sorted.
         """
-        timestamps = set()
-        for entry in self.stations.values():
-            for value in entry.values:
-                timestamps.add(value.ms_since_epoch)
-        return sorted(timestamps)
+        # Cached until any station's value list is replaced or changes length, or stations change
+        state = [(entry.values, len(entry.values)) for entry in self.stations.values()]
+        cache = self._timestamps_cache
+        if cache is not None and len(cache[0]) == len(state) and all(
+            values is cached_values and count == cached_count
+            for (values, count), (cached_values, cached_count) in zip(state, cache[0])
+        ):
+            return list(cache[1])
+        
+        timestamps = sorted(set().union(*(entry._column('ms_since_epoch') for entry in self.stations.values())))
+        self._timestamps_cache = (state, timestamps)
+        return list(timestamps)
+    
+    def iter_timestamps(self) -> Iterator[int]:
+        """Iterate over the timestamp of every value, station by station.
+        
+        Unlike `get_timestamps()`, duplicates are not removed and nothing is sorted.
+        
+        Returns:
+            Iterator[int]: ms_since_epoch timestamps in station and value order.
+        """
+        return chain.from_iterable(entry._column('ms_since_epoch') for entry in self.stations.values())
     
     def get_station_data(self, station_id: str) -> SynchronizeEntry | None:
         """Get all data for a specific station.
@@ -207,10 +489,9 @@ class SynchronizeResponse:
         """
         result = {}
         for station_id, entry in self.stations.items():
-            for value in entry.values:
-                if value.ms_since_epoch == ms_since_epoch:
-                    result[station_id] = value
-                    break
+            value = entry._timestamp_index().get(ms_since_epoch)
+            if value is not None:
+                result[station_id] = value
         return result
     
     def get_station_values(self, station_id: str) -> list[SynchronizeValue]:
@@ -239,11 +520,7 @@ class SynchronizeResponse:
         Returns:
             list[str]: List of unique quality codes.
         """
-        quality_codes = set()
-        for entry in self.stations.values():
-            for value in entry.values:
-                quality_codes.add(value.quality_code)
-        return sorted(quality_codes)
+        return sorted(set().union(*(entry._summary().quality_counts for entry in self.stations.values())))
     
     def get_origins(self) -> list[str]:
         """Get list of all unique data origins in the response.
@@ -251,11 +528,7 @@ class SynchronizeResponse:
         Returns:
             list[str]: List of unique origins.
         """
-        origins = set()
-        for entry in self.stations.values():
-            for value in entry.values:
-                origins.add(value.origin)
-        return sorted(origins)
+        return sorted(set().union(*(entry._summary().origins for entry in self.stations.values())))
     
     def get_value_ranges(self) -> dict[str, tuple[float, float]]:
         """Get min/max value ranges for each station.
@@ -265,9 +538,9 @@ class SynchronizeResponse:
         """
         ranges = {}
         for station_id, entry in self.stations.items():
-            values = [v.value for v in entry.values if v.value is not None]
-            if values:
-                ranges[station_id] = (min(values), max(values))
+            value_range = entry._summary().value_range
+            if value_range is not None:
+                ranges[station_id] = value_range
         return ranges
     
     def get_latest_values(self) -> dict[str, float]:
@@ -278,11 +551,10 @@ class SynchronizeResponse:
         """
         latest_values = {}
         for station_id, entry in self.stations.items():
-            if entry.values:
-                # Find the value with the latest timestamp
-                latest_value = max(entry.values, key=lambda v: v.ms_since_epoch)
-                if latest_value.value is not None:
-                    latest_values[station_id] = latest_value.value
+            # Value at the latest timestamp, skipped when that value is null
+            latest_value = entry._summary().latest_value
+            if latest_value is not None:
+                latest_values[station_id] = latest_value
         return latest_values
     
     def get_earliest_values(self) -> dict[str, float]:
@@ -293,11 +565,10 @@ class SynchronizeResponse:
         """
         earliest_values = {}
         for station_id, entry in self.stations.items():
-            if entry.values:
-                # Find the value with the earliest timestamp
-                earliest_value = min(entry.values, key=lambda v: v.ms_since_epoch)
-                if earliest_value.value is not None:
-                    earliest_values[station_id] = earliest_value.value
+            # Value at the earliest timestamp, skipped when that value is null
+            earliest_value = entry._summary().earliest_value
+            if earliest_value is not None:
+                earliest_values[station_id] = earliest_value
         return earliest_values
     
     def filter_by_quality(self, quality_codes: list[str]) -> 'SynchronizeResponse':
@@ -309,9 +580,10 @@ class SynchronizeResponse:
         Returns:
             SynchronizeResponse: New response containing only data with specified quality codes.
         """
+        quality_set = frozenset(quality_codes)
         filtered_stations = {}
         for station_id, entry in self.stations.items():
-            filtered_values = [v for v in entry.values if v.quality_code in quality_codes]
+            filtered_values = [v for v in entry.values if v.quality_code in quality_set]
             if filtered_values:
                 filtered_stations[station_id] = SynchronizeEntry(
                     station_id=station_id,
@@ -329,9 +601,10 @@ class SynchronizeResponse:
         Returns:
             SynchronizeResponse: New response containing only data from specified origins.
         """
+        origin_set = frozenset(origins)
         filtered_stations = {}
         for station_id, entry in self.stations.items():
-            filtered_values = [v for v in entry.values if v.origin in origins]
+            filtered_values = [v for v in entry.values if v.origin in origin_set]
             if filtered_values:
                 filtered_stations[station_id] = SynchronizeEntry(
                     station_id=station_id,
@@ -346,8 +619,14 @@ class SynchronizeResponse:
         Returns:
             tuple[int, int] | None: (earliest_ms, latest_ms) or None if no data.
         """
-        timestamps = self.get_timestamps()
-        return (timestamps[0], timestamps[-1]) if timestamps else None
+        # Combine the per-station ranges rather than scanning every timestamp again
+        ranges = [
+            summary.timestamp_range for summary in (entry._summary() for entry in self.stations.values())
+            if summary.timestamp_range is not None
+        ]
+        if not ranges:
+            return None
+        return (min(start for start, _ in ranges), max(end for _, end in ranges))
     
     def get_quality_summary(self) -> dict[str, int]:
         """Get count of observations by quality code.
@@ -355,11 +634,10 @@ class SynchronizeResponse:
         Returns:
             dict[str, int]: Dictionary mapping quality codes to their counts.
         """
-        quality_counts: dict[str, int] = {}
+        counts: Counter = Counter()
         for entry in self.stations.values():
-            for value in entry.values:
-                quality_counts[value.quality_code] = quality_counts.get(value.quality_code, 0) + 1
-        return quality_counts
+            counts.update(entry._summary().quality_counts)
+        return dict(counts)
     
     def get_data_count(self) -> int:
         """Get total number of data points across all stations.
@@ -393,9 +671,9 @@ class SynchronizeResponse:
         """
         averages = {}
         for station_id, entry in self.stations.items():
-            values = [v.value for v in entry.values if v.value is not None]
-            if values:
-                averages[station_id] = sum(values) / len(values)
+            summary = entry._summary()
+            if summary.value_count:
+                averages[station_id] = summary.value_sum / summary.value_count
         return averages
     
     def get_values_by_station_and_quality(self) -> dict[str, dict[str, list[float]]]:
@@ -409,9 +687,7 @@ class SynchronizeResponse:
             station_data: dict[str, list[float]] = {}
             for value in entry.values:
                 if value.value is not None:
-                    if value.quality_code not in station_data:
-                        station_data[value.quality_code] = []
-                    station_data[value.quality_code].append(value.value)
+                    station_data.setdefault(value.quality_code, []).append(value.value)
             if station_data:
                 result[station_id] = station_data
         return result
\ No newline at end of file
@@ -1,6 +1,7 @@
 # Standard library imports
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Only import pandas for type checking (optional import at runtime)
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
 from dbhydro_py.models.responses.base import ApiResponseBase, Status
 from dbhydro_py.utils import dataclass_from_dict
 
+# Observation timestamp format returned by the API, e.g. "2023-01-01T00:00:00:000"
+_API_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S:%f'
+
 # Hierarchy of dataclasses representing the Time Series Response structure
 """
 TimeSeriesResponse
@@ -84,7 +88,7 @@ TimeSeriesResponse
 # GeoLocation Models
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GeogLocation:
     type: str
     srs: str
@@ -92,7 +96,7 @@ class GeogLocation:
     longitude: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GeoLocation:
     geog_location: GeogLocation = field(metadata={'json_key': 'geogLocation'})
 
@@ -101,14 +105,14 @@ class GeoLocation:
 # Source Info Models
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SiteCode:
     network: str
     agency_code: str = field(metadata={'json_key': 'agencyCode'})
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceInfo:
     site_name: str = field(metadata={'json_key': 'siteName'})
     site_code: SiteCode = field(metadata={'json_key': 'siteCode'})
@@ -119,7 +123,7 @@ class SourceInfo:
 # Period of Record
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PeriodOfRecord:
     por_begin_date: Optional[str] = field(metadata={'json_key': 'porBeginDate'})
     por_last_date: Optional[str] = field(metadata={'json_key': 'porLastDate'})
@@ -133,18 +137,18 @@ class PeriodOfRecord:
 # Parameter Models
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ParameterCode:
     parameter_id: str = field(metadata={'json_key': 'parameterID'})
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     unit_code: str = field(metadata={'json_key': 'unitCode'})
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     parameter_code: ParameterCode = field(metadata={'json_key': 'parameterCode'})
     parameter_name: str = field(metadata={'json_key': 'parameterName'})
@@ -157,7 +161,7 @@ class Parameter:
 # Observation Value
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ObservationValue:
     qualifier: Optional[str]
     quality_code: Optional[str] = field(metadata={'json_key': 'qualityCode'})
@@ -170,7 +174,7 @@ class ObservationValue:
 # Summary Statistics (for real-time data)
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     min: Optional[float]
     max: Optional[float]
@@ -184,12 +188,12 @@ class Summary:
 # Time Series (One Timeseries Entry)
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ReferenceElevation:
     values: list[float] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSeriesEntry:
     source_info: SourceInfo = field(metadata={'json_key': 'sourceInfo'})
     period_of_record: PeriodOfRecord = field(metadata={'json_key': 'periodOfRecord'})
@@ -236,7 +240,7 @@ class TimeSeriesEntry:
 # Root Response
 # -------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TimeSeriesResponse(ApiResponseBase):
     time_series: list[TimeSeriesEntry] = field(metadata={'json_key': 'timeSeries'}, default_factory=list)
 
@@ -258,6 +262,85 @@ class TimeSeriesResponse(ApiResponseBase):
         
         return dataclass_from_dict(cls, data)  # type: ignore
     
+    @classmethod
+    def dataframe_from_dict(cls, data: dict, include_metadata: bool = False) -> 'pd.DataFrame':
+        """Build the same DataFrame as `to_dataframe()` directly from a response dictionary.
+        
+        Skips creating a dataclass per observation and parses all timestamps in one
+        vectorized call, which is much faster for long series.
+        
+        Args:
+            data (dict): The time series response data, as passed to `from_dict`.
+            include_metadata (bool): If True, includes site info and parameter details as columns.
+        
+        Returns:
+            pd.DataFrame: DataFrame with time series data.
+            
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        # Import pandas here allowing it to be an optional dependency
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                'pandas is required for dataframe_from_dict(). Install with: pip install pandas'
+            )
+        
+        time_series = data.get('timeSeries') or []
+        
+        # Without observations only the small series metadata is involved, so reuse the regular path
+        if not any(ts.get('values') for ts in time_series):
+            return cls.from_dict(data).to_dataframe(include_metadata)
+        
+        # Build each column in one pass; absent quality information is NaN as in to_dataframe()
+        missing = float('nan')
+        columns: dict[str, list] = {'datetime': [], 'value': [], 'site_code': [], 'quality_code': [], 'qualifier': []}
+        metadata_columns: dict[str, list] = {'site_name': [], 'parameter_code': [], 'parameter_name': [], 'unit_code': []}
+        for time_series_data in time_series:
+            observations = time_series_data.get('values') or []
+            count = len(observations)
+            source_info = time_series_data['sourceInfo']
+            
+            columns['datetime'].extend([observation['dateTime'] for observation in observations])
+            columns['value'].extend([observation.get('value') for observation in observations])
+            columns['site_code'].extend([source_info['siteCode']['value']] * count)
+            columns['quality_code'].extend([observation.get('qualityCode') or missing for observation in observations])
+            columns['qualifier'].extend([observation.get('qualifier') or missing for observation in observations])
+            
+            if include_metadata:
+                parameter = time_series_data['parameter']
+                metadata_columns['site_name'].extend([source_info['siteName']] * count)
+                metadata_columns['parameter_code'].extend([parameter['parameterCode']['value']] * count)
+                metadata_columns['parameter_name'].extend([parameter['parameterName']] * count)
+                metadata_columns['unit_code'].extend([parameter['unit']['unitCode']] * count)
+        
+        # Quality columns only appear when some observation has a value, as in to_dataframe()
+        for name in ('quality_code', 'qualifier'):
+            if all(value is missing for value in columns[name]):
+                del columns[name]
+        if include_metadata:
+            columns.update(metadata_columns)
+        
+        # Parse all timestamps at once, trying the API's own format before general parsing
+        date_times = columns['datetime']
+        try:
+            columns['datetime'] = pd.to_datetime(date_times, format=_API_DATETIME_FORMAT, cache=True)
+        except ValueError:
+            try:
+                columns['datetime'] = pd.to_datetime(date_times, cache=True)
+            except (ValueError, pd.errors.ParserError):
+                # Fix the non-standard milliseconds format (:000 -> .000)
+                columns['datetime'] = pd.to_datetime([date_time.replace(':000', '.000') for date_time in date_times], cache=True)
+        
+        df = pd.DataFrame(columns).sort_values('datetime').reset_index(drop=True)
+        
+        # For single site, can make datetime the index for easier time series analysis
+        if len(time_series) == 1:
+            df = df.set_index('datetime')
+        
+        return df
+    
     def to_dataframe(self, include_metadata: bool = False) -> 'pd.DataFrame':
         """Convert time series data to pandas DataFrame.
         
@@ -287,8 +370,11 @@ class TimeSeriesResponse(ApiResponseBase):
                 'pandas is required for to_dataframe(). Install with: pip install pandas'
             )
         
-        # Collect all data points from all time series
-        records = []
+        # Collect all data points from all time series; bind hot lookups to locals for the inner loop
+        records: list[dict[str, Any]] = []
+        append = records.append
+        to_datetime = pd.to_datetime
+        parse_errors = (ValueError, pd.errors.ParserError)
         for time_series in self.time_series:
             # Get site identifier and parameter info
             site_code = time_series.source_info.site_code.value
@@ -301,11 +387,11 @@ class TimeSeriesResponse(ApiResponseBase):
             for observation in time_series.values:
                 # Handle the non-standard datetime format (colon before milliseconds)
                 try:
-                    datetime_value = pd.to_datetime(observation.date_time)
-                except (ValueError, pd.errors.ParserError):
+                    datetime_value = to_datetime(observation.date_time)
+                except parse_errors:
                     # Fix the non-standard milliseconds format (:000 -> .000)
                     fixed_datetime = observation.date_time.replace(':000', '.000')
-                    datetime_value = pd.to_datetime(fixed_datetime)
+                    datetime_value = to_datetime(fixed_datetime)
                 
                 record = {
                     'datetime': datetime_value,
@@ -328,7 +414,7 @@ class TimeSeriesResponse(ApiResponseBase):
                         'unit_code': unit_code,
                     })
                 
-                records.append(record)
+                append(record)
         
         # Create DataFrame and set datetime as index
         df = pd.DataFrame(records)
@@ -451,18 +537,18 @@ class TimeSeriesResponse(ApiResponseBase):
         Returns:
             tuple[str, str] | None: Tuple of (earliest_date, latest_date) or None if no data.
         """
-        all_dates = []
+        all_dates: list[str] = []
+        append = all_dates.append
         for ts in self.time_series:
             for obs in ts.values:
                 if obs.date_time:
-                    all_dates.append(obs.date_time)
+                    append(obs.date_time)
         
         if not all_dates:
             return None
         
-        # Sort dates (they're in string format but should sort correctly if ISO format)
-        all_dates.sort()
-        return (all_dates[0], all_dates[-1])
+        # String dates compare correctly in ISO format, so min/max avoid a full sort
+        return (min(all_dates), max(all_dates))
 
     def get_quality_summary(self) -> dict[str, dict[str, int]]:
         """Get summary of quality codes by site.
@@ -473,11 +559,7 @@ class TimeSeriesResponse(ApiResponseBase):
         quality_summary = {}
         for ts in self.time_series:
             site_code = ts.source_info.site_code.value
-            quality_counts: dict[str, int] = {}
-            
-            for obs in ts.values:
-                if obs.quality_code:
-                    quality_counts[obs.quality_code] = quality_counts.get(obs.quality_code, 0) + 1
+            quality_counts = dict(Counter(obs.quality_code for obs in ts.values if obs.quality_code))
             
             if quality_counts:
                 quality_summary[site_code] = quality_counts
@@ -493,13 +575,15 @@ class TimeSeriesResponse(ApiResponseBase):
         Returns:
             TimeSeriesResponse: New response with filtered data.
         """
+        # A set makes each membership test O(1) regardless of how many codes are given
+        quality_set = frozenset(quality_codes)
         filtered_time_series = []
         
         for ts in self.time_series:
             # Filter values for this time series
             filtered_values = [
                 obs for obs in ts.values 
-                if obs.quality_code in quality_codes
+                if obs.quality_code in quality_set
             ]
             
             if filtered_values:
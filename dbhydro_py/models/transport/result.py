@@ -1,10 +1,13 @@
 # Standard library imports
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import IO, Any
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Generic result wrapper for REST adapter responses."""
     status_code: int
     message: str
-    data: dict[str, Any]
\ No newline at end of file
+    data: dict[str, Any]
+    headers: Mapping[str, str] = field(default_factory=dict)
+    raw: IO[bytes] | None = None  # Unparsed response body, only set for streamed requests
@@ -14,13 +14,40 @@ class RestAdapterBase(ABC):
         Args:
             endpoint (str): The API endpoint to send the GET request to.
             params (dict, optional): Query parameters for the request.
-            headers (dict, optional): Headers for the request.
+            headers (dict, optional): Headers for the request. Callers may share this dict between requests, so implementations must not modify it.
 
         Returns:
             Result: The raw response data from the GET request.
         """
         pass
 
+    def get_stream(self, endpoint: str, params: dict | None = None, headers: dict | None = None) -> Result:
+        """Perform a GET request whose successful response body is left unread for incremental parsing.
+
+        Adapters that support streaming return the decompressed body as a binary file-like
+        object in `Result.raw`; unsuccessful responses are returned parsed in `Result.data`
+        as with `get`. The default implementation does not support streaming.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            params (dict, optional): Query parameters for the request.
+            headers (dict, optional): Headers for the request. Implementations must not modify it.
+
+        Returns:
+            Result: The response, with the unread body in `raw`.
+            
+        Raises:
+            NotImplementedError: If the adapter does not support streaming.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support streamed responses.')
+
+    def close(self) -> None:
+        """Release any resources held by the adapter, such as pooled connections.
+
+        The default implementation holds no resources and does nothing.
+        """
+        pass
+
     @abstractmethod
     def post(self, endpoint: str, headers: dict | None = None, params: dict | None = None, data: dict | None = None) -> Result:
         """Perform a POST request to the specified endpoint.
@@ -1,14 +1,73 @@
+# Standard library imports
+from types import TracebackType
+
 # Third-party imports
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 # Local imports
 from dbhydro_py.models.transport import Result
 from dbhydro_py.rest_adapters.rest_adapter_base import RestAdapterBase
+from dbhydro_py.utils import json_loads
+
+# Connection pool sizing: pools kept per host, and connections kept per pool for parallel requests
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 32
+
+# Transient gateway/server failures retried with exponential backoff; POST is never retried
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.3
+_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Default (connect, read) timeout in seconds; long date ranges can take a while to serve
+_DEFAULT_TIMEOUT = (10.0, 300.0)
 
 
 class RestAdapterRequests(RestAdapterBase):
-    """REST adapter implementation using the requests library."""
+    """REST adapter implementation using the requests library.
+    
+    A single requests.Session is shared by all requests made through the adapter so
+    TCP/TLS connections are pooled and reused, including across threads. Idempotent
+    requests failing with a transient server error are retried with backoff.
+    
+    Args:
+        timeout (float | tuple[float, float] | None, optional): Request timeout in seconds, or a
+            (connect, read) pair. None waits indefinitely. Defaults to 10 seconds to connect and 300 to read.
+    
+    Examples:
+        >>> with RestAdapterRequests() as adapter:
+        ...     api = DbHydroApi(adapter, "client_id", "secret")
+    """
+    
+    def __init__(self, timeout: float | tuple[float, float] | None = _DEFAULT_TIMEOUT) -> None:
+        self._timeout = timeout
+        self._session = requests.Session()
+        retry = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF_FACTOR,
+            status_forcelist=_RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        pool_adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+        self._session.mount('https://', pool_adapter)
+        self._session.mount('http://', pool_adapter)
+    
+    def __enter__(self) -> 'RestAdapterRequests':
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the session and release its pooled connections."""
+        self._session.close()
     
     def get(self, endpoint: str, params: dict | None = None, headers: dict | None = None) -> Result:
         """Perform a GET request to the specified endpoint.
@@ -23,6 +82,18 @@ class RestAdapterRequests(RestAdapterBase):
         """
         return self._perform_request('GET', endpoint, params, headers=headers)
 
+    def get_stream(self, endpoint: str, params: dict | None = None, headers: dict | None = None) -> Result:
+        """Perform a GET request, leaving a successful response body unread.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            params (dict, optional): Query parameters for the request.
+            headers (dict, optional): Headers for the request.
+
+        Returns:
+            Result: The response with the decompressed body available from `raw`.
+        """
+        return self._perform_request('GET', endpoint, params, headers=headers, stream=True)
 
     def post(self, endpoint: str, headers: dict | None = None, params: dict | None = None, data: dict | None = None) -> Result:
         """Perform a POST request to the specified endpoint.
@@ -51,7 +122,7 @@ class RestAdapterRequests(RestAdapterBase):
         """
         return self._perform_request('DELETE', endpoint, params, headers=headers, data=None)
 
-    def _perform_request(self, http_method: str, endpoint: str, endpoint_params: dict | None, headers: dict | None = None, data: dict | None = None) -> Result:
+    def _perform_request(self, http_method: str, endpoint: str, endpoint_params: dict | None, headers: dict | None = None, data: dict | None = None, stream: bool = False) -> Result:
         """Helper method to perform HTTP requests.
 
         Args:
@@ -60,6 +131,7 @@ class RestAdapterRequests(RestAdapterBase):
             endpoint_params (dict): Parameters or data for the request.
             headers (dict, optional): Headers for the request.
             data (dict, optional): The data to include in the request body.
+            stream (bool): If True, a successful response body is returned unread in `raw` instead of parsed.
 
         Returns:
             Result: The raw response data from the request.
@@ -70,19 +142,24 @@ class RestAdapterRequests(RestAdapterBase):
             if headers is None:
                 headers = {}
             
-            response = requests.request(method=http_method, url=endpoint, verify=True, headers=headers, params=endpoint_params, json=data)
+            response = self._session.request(method=http_method, url=endpoint, verify=True, headers=headers, params=endpoint_params, json=data, stream=stream, timeout=self._timeout)
             
         except RequestException as e:
             # Return a Result with error information instead of raising exception
             # This keeps the adapter generic and lets the API layer handle errors
             return Result(status_code=0, message=f'Request failed: {e}', data={})
         
-        # Get the response data
+        # Hand back the undecoded body for the caller to parse incrementally; error bodies are small and parsed below
+        if stream and response.ok:
+            response.raw.decode_content = True
+            return Result(status_code=response.status_code, message=response.reason, data={}, headers=response.headers, raw=response.raw)
+        
+        # Get the response data from the raw (already decompressed) body bytes
         try:
-            response_data_json = response.json()
+            response_data_json = json_loads(response.content)
         except ValueError:
             # If JSON parsing fails, fall back to basic HTTP error
             response_data_json = {}
         
         # Return the Result for all responses - let the API layer decide what constitutes an error
-        return Result(status_code=response.status_code, message=response.reason, data=response_data_json)
+        return Result(status_code=response.status_code, message=response.reason, data=response_data_json, headers=response.headers)
@@ -1,9 +1,37 @@
 """Utility functions for data processing and dataclass operations."""
 
 # Standard library imports
+from collections.abc import Callable, Iterator
 from dataclasses import fields, is_dataclass
 from datetime import datetime
-from typing import Any, get_args, get_origin
+from functools import lru_cache
+import json
+from typing import IO, Any, cast, get_args, get_origin
+
+# Optional incremental JSON parser used for streamed responses
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional fast JSON parsers, preferred in this order over the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# All three accept the raw response bytes; orjson and ujson skip the separate UTF-8 decode json.loads needs
+# The preferred parser is checked last so it overrides the others
+json_loads: Callable[[bytes | str], Any] = json.loads
+if ujson is not None:
+    json_loads = ujson.loads
+if orjson is not None:
+    json_loads = orjson.loads
 
 
 def dataclass_from_dict(cls: type, data: dict[str, Any]) -> Any:
@@ -19,20 +47,51 @@ def dataclass_from_dict(cls: type, data: dict[str, Any]) -> Any:
     if not is_dataclass(cls):
         raise TypeError(f'{cls} is not a dataclass')
 
-    kwargs: dict[str, Any] = {}
+    return _build_constructor(cls)(data)
 
-    for f in fields(cls):
-        field_name = f.name
-        field_type = f.type
-        
-        # Check for json_key in field metadata, otherwise use field name
-        json_key = f.metadata.get('json_key', field_name)
-        value = data.get(json_key)
 
-        if value is None:
-            kwargs[field_name] = None if get_origin(field_type) is not list else []
+def dataclass_constructor(cls: type) -> Callable[[dict[str, Any]], Any]:
+    """Return the generated constructor `dataclass_from_dict` uses for a dataclass.
+    
+    Binding it once lets per-item loops skip the dataclass check and cache lookup
+    that `dataclass_from_dict` repeats on every call.
+    
+    Args:
+        cls: The dataclass type to build a constructor for.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f'{cls} is not a dataclass')
+
+    return _build_constructor(cls)
+
+
+@lru_cache(maxsize=None)
+def _build_constructor(cls: type) -> Callable[[dict[str, Any]], Any]:
+    """Generate a constructor function specialized for a dataclass.
+    
+    The field reflection is done once per class and compiled into a plain function
+    that reads each key from the dict and converts it, so repeated conversions of the
+    same type skip `fields()`, `get_origin()` and `is_dataclass()` entirely. Values are
+    passed to `__init__` positionally, and primitive fields are read inline in the call.
+    
+    Args:
+        cls: The dataclass type to build a constructor for.
+    """
+    namespace: dict[str, Any] = {'cls': cls}
+    lines = ['def constructor(data):', '    get = data.get']
+    args = []
+    kwargs = []
+
+    for index, f in enumerate(fields(cls)):
+        # Fields outside __init__ (e.g. derived caches) are never read from the response
+        if not f.init:
             continue
 
+        field_type = f.type
+        json_key = f.metadata.get('json_key', f.name)
+        value_name = f'value_{index}'
+        value = f'get({json_key!r})'
+
         origin = get_origin(field_type)
 
         # Case 1: field is a list[Something]
@@ -40,31 +99,95 @@ def dataclass_from_dict(cls: type, data: dict[str, Any]) -> Any:
             inner_type = get_args(field_type)[0]
 
             if is_dataclass(inner_type):
-                kwargs[field_name] = [
-                    _create_dataclass_instance(inner_type, item) for item in value  # type: ignore
-                ]
+                namespace[f'create_{index}'] = _instance_factory(inner_type)  # type: ignore
+                conversion = f'[create_{index}(item) for item in {value_name}]'
             else:
-                kwargs[field_name] = list(value)
-            continue
+                conversion = f'list({value_name})'
+            lines.append(f'    {value_name} = {value}')
+            lines.append(f'    {value_name} = [] if {value_name} is None else {conversion}')
+            value = value_name
 
         # Case 2: field is a nested dataclass
-        if is_dataclass(field_type):
-            kwargs[field_name] = _create_dataclass_instance(field_type, value)  # type: ignore
-            continue
+        elif is_dataclass(field_type):
+            namespace[f'create_{index}'] = _instance_factory(field_type)  # type: ignore
+            lines.append(f'    {value_name} = {value}')
+            lines.append(f'    {value_name} = None if {value_name} is None else create_{index}({value_name})')
+            value = value_name
 
-        # Case 3: primitive types (str, int, float, etc)
-        kwargs[field_name] = value
+        # Case 3: primitive types (str, int, float, etc) are passed through unchanged
 
-    return cls(**kwargs)
+        # Keyword-only fields must be named and go after the positional ones
+        if f.kw_only:
+            kwargs.append(f'{f.name}={value}')
+        else:
+            args.append(value)
 
+    lines.append(f'    return cls({", ".join(args + kwargs)})')
+    exec('\n'.join(lines), namespace)
+    return cast(Callable[[dict[str, Any]], Any], namespace['constructor'])
 
-def _create_dataclass_instance(cls: type, data: dict) -> Any:
-    """Create a dataclass instance, using custom from_dict if available.
+
+def _instance_factory(cls: type) -> Callable[[dict], Any]:
+    """Return the callable used to build nested dataclass instances of a type.
     
     Args:
         cls: The dataclass type to instantiate.
-        data: The dictionary containing the data.
     """
     if hasattr(cls, 'from_dict') and callable(getattr(cls, 'from_dict')):
-        return cls.from_dict(data)
-    return dataclass_from_dict(cls, data)
+        return cast(Callable[[dict], Any], cls.from_dict)
+    # Use the generated constructor directly, skipping the per-item dataclass check and cache lookup
+    return _build_constructor(cls)
+
+
+# ijson events that open and close a nested container
+_START_EVENTS = frozenset(('start_map', 'start_array'))
+_END_EVENTS = frozenset(('end_map', 'end_array'))
+
+
+def iter_json_items(stream: IO[bytes], item_prefix: str, document: dict[str, Any]) -> Iterator[Any]:
+    """Incrementally parse a JSON document, yielding the items of one array as they are read.
+    
+    Only one array item is held in memory at a time. Everything outside the array is
+    collected into `document` (with the streamed array left empty) once the stream
+    has been fully consumed.
+    
+    Args:
+        stream: Binary file-like object containing the JSON document.
+        item_prefix: ijson prefix of the array items, e.g. 'timeSeriesResponse.timeSeries.item'.
+        document: Dict updated with the rest of the document after the last item.
+        
+    Raises:
+        ImportError: If ijson is not installed.
+    """
+    if ijson is None:
+        raise ImportError('ijson is required for streamed responses. Install with: pip install ijson')
+
+    rest = ijson.ObjectBuilder()
+    item: Any = None
+    depth = 0
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        # Outside an array item: either start a new item or add to the rest of the document
+        if depth == 0:
+            if prefix != item_prefix:
+                rest.event(event, value)
+            elif event in _START_EVENTS:
+                item = ijson.ObjectBuilder()
+                item.event(event, value)
+                depth = 1
+            else:
+                yield value
+            continue
+
+        # Inside an array item: build it until its closing event
+        item.event(event, value)
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if depth == 0:
+                yield item.value
+                item = None
+
+    if isinstance(rest.value, dict):
+        document.update(rest.value)
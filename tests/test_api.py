@@ -1,7 +1,7 @@
 """Tests for DbHydroApi class."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from datetime import datetime
 
 from dbhydro_py.api import DbHydroApi
@@ -40,6 +40,15 @@ class TestDbHydroApi:
         from dbhydro_py.rest_adapters.rest_adapter_requests import RestAdapterRequests
         assert isinstance(api.rest_adapter, RestAdapterRequests)
     
+    def test_close_and_context_manager(self, api_client):
+        """Test that closing the client, directly or on leaving a with block, closes its adapter."""
+        with api_client as client:
+            assert client is api_client
+        api_client.rest_adapter.close.assert_called_once()
+        
+        api_client.close()
+        assert api_client.rest_adapter.close.call_count == 2
+    
     def test_with_default_adapter_custom_version(self):
         """Test factory method with custom API version."""
         api = DbHydroApi.with_default_adapter(
@@ -60,6 +69,12 @@ class TestDbHydroApi:
         result = api_client._parse_date(dt)
         assert result == "2023-01-0112:30:45:123"
     
+    def test_parse_date_datetime_truncates_microseconds(self, api_client):
+        """Test that datetime microseconds are truncated, not rounded, to milliseconds."""
+        assert api_client._parse_date(datetime(2023, 1, 1, 0, 0, 0, 999999)) == "2023-01-0100:00:00:999"
+        assert api_client._parse_date(datetime(2023, 1, 1, 0, 0, 0, 4999)) == "2023-01-0100:00:00:004"
+        assert api_client._parse_date(datetime(2023, 1, 1)) == "2023-01-0100:00:00:000"
+    
     def test_parse_date_string_formats(self, api_client):
         """Test date parsing with various string formats."""
         test_cases = [
@@ -78,6 +93,83 @@ class TestDbHydroApi:
         with pytest.raises(ValueError, match="Invalid date format"):
             api_client._parse_date("")
     
+    def test_parse_date_partial_times(self, api_client):
+        """Test that missing time components are filled in."""
+        test_cases = [
+            ("2023-01-01T12", "2023-01-0112:00:00:000"),
+            ("2023-01-01 12:30:45", "2023-01-0112:30:45:000"),
+            ("2023-01-0112:30", "2023-01-0112:30:00:000"),
+            ("  2023-01-01  ", "2023-01-0100:00:00:000"),
+        ]
+        
+        for input_date, expected in test_cases:
+            assert api_client._parse_date(input_date) == expected
+    
+    def test_parse_date_malformed_strings(self, api_client):
+        """Test that malformed date strings are rejected instead of passed through."""
+        for input_date in [
+            "2023-1-1", "not-a-date-string", "2023-01-01T", "2023-01-01T12:30:00+05:00",
+            "2023-01-01T12:30:45:12", "2023-01-01 12:30:45:1234", "20230101",
+            "2023-01-01 12:30:45.123+05:00", "2023-13-01 12:30:45.123"
+        ]:
+            with pytest.raises(ValueError, match="Invalid date format"):
+                api_client._parse_date(input_date)
+    
+    def test_parse_date_out_of_range_components(self, api_client):
+        """Test that well-shaped dates with invalid months, days or times are rejected."""
+        for input_date in [
+            "2023-13-45", "2023-14-01", "2023-00-10", "2023-02-30", "2023-04-31",
+            "2023-01-01 25:99", "2023-01-01T24:00", "2023-01-01 12:60", "2023-01-01 12:30:61",
+            "2023-02-3012:00:00:000", "2023-01-0125:00:00:000"
+        ]:
+            with pytest.raises(ValueError, match="Invalid date format"):
+                api_client._parse_date(input_date)
+        
+        assert api_client._parse_date("2024-02-29") == "2024-02-2900:00:00:000"
+        with pytest.raises(ValueError, match="Invalid date format"):
+            api_client.get_time_series(['X'], '2023-13-45', '2023-14-01')
+    
+    def test_parse_date_iso_fractional_seconds(self, api_client):
+        """Test that ISO 8601 strings with fractional seconds are truncated to milliseconds."""
+        assert api_client._parse_date("2023-01-01 12:30:45.123") == "2023-01-0112:30:45:123"
+        assert api_client._parse_date("2023-01-01T12:30:45.123999") == "2023-01-0112:30:45:123"
+        assert api_client._parse_date("2023-01-01 12:30:45,5") == "2023-01-0112:30:45:500"
+        assert api_client._parse_date("2023-01-01 12:30:45.1234567") == "2023-01-0112:30:45:123"
+    
+    def test_parse_date_string_results_cached(self, api_client):
+        """Test that repeated date strings are served from the parse cache."""
+        from dbhydro_py.api import _parse_date_string
+        
+        _parse_date_string.cache_clear()
+        api_client._parse_date("2023-06-15 08:00")
+        api_client._parse_date("2023-06-15 08:00")
+        
+        cache_info = _parse_date_string.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+    
+    def test_parse_date_canonical_passthrough(self, api_client):
+        """Test that dates already in API format are returned unchanged, and round-trip."""
+        from dbhydro_py.api import _parse_date_string
+        
+        _parse_date_string.cache_clear()
+        canonical = "2023-06-15" + "08:00:00:000"
+        assert api_client._parse_date(canonical) is canonical
+        assert api_client._parse_date(api_client._parse_date("2023-06-15 08:00")) == canonical
+    
+    def test_parse_date_shorthand_skips_iso_parser(self, api_client):
+        """Test that shorthand formats are resolved by the regex alone, and other ISO forms still parse."""
+        from dbhydro_py.api import _parse_date_string
+        
+        _parse_date_string.cache_clear()
+        with patch('dbhydro_py.api.datetime') as mock_datetime:
+            assert _parse_date_string("2023-06-15 08:30:15") == "2023-06-1508:30:15:000"
+            mock_datetime.fromisoformat.assert_not_called()
+        
+        assert api_client._parse_date("2023-06-15T08:30:15.250") == "2023-06-1508:30:15:250"
+        with pytest.raises(ValueError, match="Invalid date format"):
+            api_client._parse_date("2023-06-15T08:30:15+05:00")
+    
     def test_handle_date_parameters_valid_range(self, api_client):
         """Test date parameter handling with valid date range."""
         start, end = api_client._handle_date_parameters("2023-01-01", "2023-01-02")
@@ -95,6 +187,18 @@ class TestDbHydroApi:
         with pytest.raises(ValueError, match="'date_start' must be earlier or equal to 'date_end'"):
             api_client._handle_date_parameters("2023-01-02", "2023-01-01")
 
+    def test_handle_date_parameters_mixed_formats(self, api_client):
+        """Test that ranges are compared chronologically across input formats."""
+        start, end = api_client._handle_date_parameters(datetime(2023, 1, 1, 12), "2023-01-01 12:00:00:001")
+        assert start == "2023-01-0112:00:00:000"
+        assert end == "2023-01-0112:00:00:001"
+        
+        with pytest.raises(ValueError, match="'date_start' must be earlier or equal to 'date_end'"):
+            api_client._handle_date_parameters("2023-01-01 12:00", "2023-01-01T11:59")
+        
+        with pytest.raises(ValueError, match="'date_start' must be earlier or equal to 'date_end'"):
+            api_client._handle_date_parameters("2024-01-01", datetime(2023, 12, 31, 23, 59, 59))
+
     def test_validate_calculation_parameters(self, api_client):
         """Test calculation parameter validation helper method."""
         # Valid parameters should pass
@@ -156,6 +260,31 @@ class TestDbHydroApi:
                 'AVERAGE', 'DAY', 1, custom_calcs, custom_units
             )
     
+    def test_validate_calculation_parameters_remembers_accepted(self, api_client):
+        """Test that accepted combinations are remembered and rejected ones are not."""
+        from dbhydro_py import api as api_module
+        api_module._validated_calculations.clear()
+        
+        api_client._validate_calculation_parameters('MAX', 'WEEK', 2)
+        assert len(api_module._validated_calculations) == 1
+        
+        # Repeat calls hit the remembered verdict
+        api_client._validate_calculation_parameters('MAX', 'WEEK', 2)
+        assert len(api_module._validated_calculations) == 1
+        
+        # Failures are never remembered, and a float equal to an accepted int is still rejected
+        with pytest.raises(ValueError, match="Invalid timespan_value"):
+            api_client._validate_calculation_parameters('MAX', 'WEEK', 2.0)
+        with pytest.raises(ValueError, match="Invalid calculation type"):
+            api_client._validate_calculation_parameters('MEDI', 'WEEK', 2)
+        assert len(api_module._validated_calculations) == 1
+        
+        # Aggregate calculations are keyed by their own allowed set
+        api_client._validate_calculation_parameters(
+            'MEDI', 'WEEK', 2, api_module._VALID_AGGREGATE_CALCULATIONS
+        )
+        assert len(api_module._validated_calculations) == 2
+    
     def test_network_error_handling(self, api_client):
         """Test that network errors from REST adapter are properly handled."""
         from dbhydro_py.models.transport import Result
@@ -193,4 +322,221 @@ class TestDbHydroApi:
         
         assert 'User-Agent' in headers
         assert headers['User-Agent'].startswith('dbhydro-py/')
-        assert 'unknown' in headers['User-Agent'] or '.' in headers['User-Agent']  # Version format
\ No newline at end of file
+        assert 'unknown' in headers['User-Agent'] or '.' in headers['User-Agent']  # Version format
+
+    def test_accept_encoding_header_added(self, api_client):
+        """Test that compressed responses are requested from the API."""
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={"timeSeriesResponse": {"status": {"statusCode": 200}}}
+        )
+        
+        api_client._perform_request("https://test.com/api", {"param": "value"})
+        
+        headers = api_client.rest_adapter.get.call_args[1]['headers']
+        assert headers['Accept-Encoding'].startswith('gzip, deflate')
+    
+    def test_accept_encoding_brotli_only_when_decodable(self):
+        """Test that brotli is advertised exactly when a brotli decoder is installed."""
+        from importlib.util import find_spec
+        from dbhydro_py.api import _ACCEPT_ENCODING
+        
+        has_brotli = find_spec('brotli') is not None or find_spec('brotlicffi') is not None
+        assert _ACCEPT_ENCODING == ('gzip, deflate, br' if has_brotli else 'gzip, deflate')
+    
+    def test_conditional_request_returns_cached_data_on_304(self, api_client):
+        """Test that a 304 Not Modified response reuses the previously parsed data."""
+        from dbhydro_py.models.transport import Result
+        
+        response_data = {"timeSeriesResponse": {"status": {"statusCode": 200}, "timeSeries": []}}
+        api_client.rest_adapter.get.side_effect = [
+            Result(status_code=200, message="OK", data=response_data, headers={"ETag": '"abc123"'}),
+            Result(status_code=304, message="Not Modified", data={}),
+        ]
+        
+        first = api_client._perform_request("https://test.com/api", {"param": "value"})
+        second = api_client._perform_request("https://test.com/api", {"param": "value"})
+        
+        assert first == response_data
+        assert second == response_data
+        
+        # The first request is unconditional, the second revalidates with the stored ETag
+        first_headers = api_client.rest_adapter.get.call_args_list[0][1]['headers']
+        second_headers = api_client.rest_adapter.get.call_args_list[1][1]['headers']
+        assert 'If-None-Match' not in first_headers
+        assert second_headers['If-None-Match'] == '"abc123"'
+    
+    def test_conditional_request_uses_last_modified(self, api_client):
+        """Test that Last-Modified validators are sent back as If-Modified-Since."""
+        from dbhydro_py.models.transport import Result
+        
+        last_modified = "Wed, 21 Oct 2025 07:28:00 GMT"
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={"periodOfRecord": {}},
+            headers={"Last-Modified": last_modified}
+        )
+        
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        
+        headers = api_client.rest_adapter.get.call_args[1]['headers']
+        assert headers['If-Modified-Since'] == last_modified
+        assert 'If-None-Match' not in headers
+    
+    def test_conditional_request_not_sent_for_different_params(self, api_client):
+        """Test that validators are only reused for identical requests."""
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={"periodOfRecord": {}},
+            headers={"ETag": '"abc123"'}
+        )
+        
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        api_client._perform_request("https://test.com/api", {"stationId": "S124-R"})
+        
+        headers = api_client.rest_adapter.get.call_args[1]['headers']
+        assert 'If-None-Match' not in headers
+    
+    def test_conditional_headers_do_not_leak_into_base_headers(self, api_client):
+        """Test that validators are added to a copy of the shared default headers."""
+        from dbhydro_py.api import _DEFAULT_HEADERS
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={"periodOfRecord": {}},
+            headers={"ETag": '"abc123"'}
+        )
+        
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        
+        first_headers = api_client.rest_adapter.get.call_args_list[0][1]['headers']
+        second_headers = api_client.rest_adapter.get.call_args_list[1][1]['headers']
+        assert first_headers is _DEFAULT_HEADERS
+        assert second_headers is not _DEFAULT_HEADERS
+        assert 'If-None-Match' not in _DEFAULT_HEADERS
+    
+    def test_response_reused_within_ttl(self, api_client):
+        """Test that responses are served from the TTL cache without another request."""
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(status_code=200, message="OK", data={"periodOfRecord": {}})
+        
+        first = api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60)
+        second = api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60)
+        
+        assert first is second
+        api_client.rest_adapter.get.assert_called_once()
+    
+    def test_response_cache_refresh_and_expiry(self, api_client):
+        """Test that refresh=True and expired entries both go back to the server."""
+        from unittest.mock import patch
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(status_code=200, message="OK", data={"periodOfRecord": {}})
+        
+        with patch('dbhydro_py.api.time.monotonic', return_value=1000.0):
+            api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60)
+            api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60, refresh=True)
+        assert api_client.rest_adapter.get.call_count == 2
+        
+        with patch('dbhydro_py.api.time.monotonic', return_value=1061.0):
+            api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60)
+        assert api_client.rest_adapter.get.call_count == 3
+    
+    def test_response_cache_honors_cache_control(self, api_client):
+        """Test that Cache-Control max-age overrides the default TTL and no-store disables caching."""
+        from unittest.mock import patch
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200, message="OK", data={"periodOfRecord": {}},
+            headers={"Cache-Control": "public, max-age=5"}
+        )
+        with patch('dbhydro_py.api.time.monotonic', return_value=1000.0):
+            api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=3600)
+        with patch('dbhydro_py.api.time.monotonic', return_value=1006.0):
+            api_client._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=3600)
+        assert api_client.rest_adapter.get.call_count == 2
+        
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200, message="OK", data={"periodOfRecord": {}},
+            headers={"Cache-Control": "no-store"}
+        )
+        api_client._perform_request("https://test.com/api", {"stationId": "S124-R"}, cache_ttl=3600)
+        api_client._perform_request("https://test.com/api", {"stationId": "S124-R"}, cache_ttl=3600)
+        assert api_client.rest_adapter.get.call_count == 4
+    
+    def test_response_not_reused_without_ttl(self, api_client):
+        """Test that endpoints without a TTL always make a request."""
+        from dbhydro_py.models.transport import Result
+        
+        api_client.rest_adapter.get.return_value = Result(status_code=200, message="OK", data={"periodOfRecord": {}})
+        
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        api_client._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        
+        assert api_client.rest_adapter.get.call_count == 2
+    
+    def test_client_cache_ttl_applies_to_all_endpoints(self, mock_rest_adapter):
+        """Test that a client-level cache_ttl reuses responses from endpoints without their own TTL."""
+        from dbhydro_py.models.transport import Result
+        
+        api = DbHydroApi(mock_rest_adapter, "test_id", "test_secret", cache_ttl=300)
+        mock_rest_adapter.get.return_value = Result(status_code=200, message="OK", data={"periodOfRecord": {}})
+        
+        api._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        api._perform_request("https://test.com/api", {"stationId": "S123-R"})
+        
+        mock_rest_adapter.get.assert_called_once()
+    
+    def test_cache_disabled(self, mock_rest_adapter):
+        """Test that cache_enabled=False neither reuses nor revalidates responses."""
+        from dbhydro_py.models.transport import Result
+        
+        api = DbHydroApi(mock_rest_adapter, "test_id", "test_secret", cache_ttl=300, cache_enabled=False)
+        mock_rest_adapter.get.return_value = Result(
+            status_code=200, message="OK", data={"periodOfRecord": {}},
+            headers={"ETag": '"abc123"'}
+        )
+        
+        api._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60)
+        api._perform_request("https://test.com/api", {"stationId": "S123-R"}, cache_ttl=60)
+        
+        assert mock_rest_adapter.get.call_count == 2
+        assert 'If-None-Match' not in mock_rest_adapter.get.call_args[1]['headers']
+    
+    def test_extract_api_error_known_and_unknown_wrappers(self, api_client):
+        """Test that errors are found in known wrappers and, failing that, in any wrapper."""
+        error_status = {"statusCode": 400, "statusMessage": "Bad request", "elapsedTime": 0.1}
+        
+        known = api_client._extract_api_error({"timeSeriesResponse": {"status": error_status}})
+        assert known["status_code"] == 400
+        
+        unknown = api_client._extract_api_error({"someOtherResponse": {"status": error_status}})
+        assert unknown["message"] == "Bad request"
+        
+        ok = api_client._extract_api_error({"timeSeriesResponse": {"status": {"statusCode": 200, "statusMessage": "Success"}}})
+        assert ok is None
+    
+    def test_base_params_and_endpoints_precomputed(self, api_client):
+        """Test that credentials, format and endpoint URLs are built once at construction."""
+        assert api_client._base_params == {
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'format': 'json'
+        }
+        assert api_client._endpoints['timeseries'] == f'{api_client.base_url}timeseries'
+        assert api_client._endpoints['por'] == f'{api_client.base_url}por'
+        for name in ('tsarithmetic', 'synchronize', 'waterquality'):
+            assert api_client._endpoints[name] == f'{api_client.base_url}{name}'
@@ -51,7 +51,7 @@ class TestDailyDataEndpoint:
             )
         
         # Test invalid identifier_type
-        with pytest.raises(ValueError, match="Invalid identifier_type: 'invalid'"):
+        with pytest.raises(ValueError, match="Invalid identifier_type: 'invalid'. Must be one of: id, station, timeseries."):
             api_client.get_daily_data(
                 identifiers=["S123-R"],
                 identifier_type="invalid",
@@ -60,7 +60,7 @@ class TestDailyDataEndpoint:
             )
         
         # Test invalid requested_datum
-        with pytest.raises(ValueError, match="Invalid requested_datum: 'INVALID'"):
+        with pytest.raises(ValueError, match="Invalid requested_datum: 'INVALID'. Must be one of: NAVD88, NGVD29."):
             api_client.get_daily_data(
                 identifiers=["S123-R"],
                 identifier_type="station",
@@ -93,6 +93,30 @@ class TestDailyDataEndpoint:
         call_args = api_client.rest_adapter.get.call_args
         assert call_args is not None
     
+    def test_get_daily_data_include_summary_warns_once(self, api_client, sample_time_series_response):
+        """Test that the include_summary warning is only issued once per client."""
+        import warnings
+        
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_time_series_response
+        )
+        
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                api_client.get_daily_data(
+                    identifiers=["S123-R"],
+                    identifier_type="station",
+                    date_start="2023-01-01",
+                    date_end="2023-01-02",
+                    include_summary=True
+                )
+        
+        assert len(caught) == 1
+        assert api_client.rest_adapter.get.call_args[1]['params']['includeSummary'] == 'N'
+    
     def test_get_daily_data_success_with_timeseries_identifier(self, api_client, sample_time_series_response):
         """Test successful daily time series request with timeseries identifier."""
         # Setup mock
@@ -1,5 +1,7 @@
 """Tests for NEXRAD API methods."""
 
+import io
+import json
 import pytest
 from unittest.mock import Mock
 from datetime import datetime
@@ -22,17 +24,6 @@ class TestNexradApi:
             client_secret="test_client_secret"
         )
     
-    def test_get_nexrad_pixel_data_validation_errors(self, api_client):
-        """Test parameter validation in get_nexrad_pixel_data."""
-        # Test empty pixel_ids list
-        with pytest.raises(ValueError, match="At least one pixel_id must be provided"):
-            api_client.get_nexrad_pixel_data(
-                pixel_ids=[],
-                date_start="2023-01-01",
-                date_end="2023-01-02",
-                frequency="D"
-            )
-    
     def test_get_nexrad_polygon_data_validation_errors(self, api_client):
         """Test parameter validation in get_nexrad_polygon_data."""
         # Test empty identifiers list
@@ -126,7 +117,7 @@ class TestNexradApi:
             )
         
         # Test invalid frequency
-        with pytest.raises(ValueError, match="Invalid frequency: 'INVALID'"):
+        with pytest.raises(ValueError, match=r"Invalid frequency: 'INVALID'\. Must be one of: D, E, H, M, Y\."):
             api_client.get_nexrad_pixel_data(
                 pixel_ids=["PIXEL-123"],
                 date_start="2023-01-01",
@@ -169,6 +160,62 @@ class TestNexradApi:
         assert params['incZero'] == "N"
         assert params['polygonType'] == 0
 
+    def test_get_nexrad_pixel_data_exact_params(self, api_client, sample_nexrad_response):
+        """Test that the pixel request sends exactly the expected parameters."""
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_nexrad_response
+        )
+        
+        api_client.get_nexrad_pixel_data(
+            pixel_ids=["PIXEL-123"],
+            date_start="2023-01-01",
+            date_end="2023-01-02",
+            frequency="D",
+            include_zero=True
+        )
+        
+        assert api_client.rest_adapter.get.call_args[1]['params'] == {
+            'client_id': "test_client_id",
+            'client_secret': "test_client_secret",
+            'format': "json",
+            'pixelId': "PIXEL-123",
+            'polygonType': 0,
+            'beginDateTime': "2023-01-0100:00:00:000",
+            'endDateTime': "2023-01-0200:00:00:000",
+            'frequency': "D",
+            'incZero': "Y"
+        }
+
+    def test_nexrad_duplicate_ids_are_dropped(self, api_client, sample_nexrad_response):
+        """Test that repeated pixel and polygon IDs are requested once, in first-seen order."""
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_nexrad_response
+        )
+        
+        with pytest.warns(UserWarning, match="Removed 1 duplicate value\\(s\\) from 'pixel_ids'"):
+            api_client.get_nexrad_pixel_data(
+                pixel_ids=["PIXEL-2", "PIXEL-1", "PIXEL-2"],
+                date_start="2023-01-01",
+                date_end="2023-01-02",
+                frequency="D"
+            )
+        assert api_client.rest_adapter.get.call_args[1]['params']['pixelId'] == "PIXEL-2,PIXEL-1"
+        
+        with pytest.warns(UserWarning, match="from 'identifiers'"):
+            api_client.get_nexrad_polygon_data(
+                identifiers=["WCA1", "WCA1"],
+                identifier_type="polygonName",
+                polygon_type=1,
+                date_start="2023-01-01",
+                date_end="2023-01-02",
+                frequency="D"
+            )
+        assert api_client.rest_adapter.get.call_args[1]['params']['polygonName'] == "WCA1"
+
     def test_get_nexrad_pixel_data_with_multiple_pixels(self, api_client, sample_nexrad_response):
         """Test NEXRAD pixel data request with multiple pixel IDs."""
         # Setup mock
@@ -263,7 +310,7 @@ class TestNexradApi:
             )
         
         # Test invalid identifier_type
-        with pytest.raises(ValueError, match=r"Invalid identifier_type: 'invalid'\. Must be one of: .*"):
+        with pytest.raises(ValueError, match=r"Invalid identifier_type: 'invalid'\. Must be one of: polygonId, polygonName\."):
             api_client.get_nexrad_polygon_data(
                 identifiers=["POLYGON-123"],
                 identifier_type="invalid",
@@ -296,7 +343,7 @@ class TestNexradApi:
             )
         
         # Test invalid frequency
-        with pytest.raises(ValueError, match="Invalid frequency: 'INVALID'"):
+        with pytest.raises(ValueError, match=r"Invalid frequency: 'INVALID'\. Must be one of: 15, D, E, H, M, Y\."):
             api_client.get_nexrad_polygon_data(
                 identifiers=["POLYGON-123"],
                 identifier_type="polygonId",
@@ -549,4 +596,49 @@ class TestNexradApi:
                 date_start="2023-01-01",
                 date_end="2023-01-02",
                 frequency="H"
-            )
\ No newline at end of file
+            )
+
+    def test_stream_nexrad_polygon_data(self, api_client, sample_time_series_response):
+        """Test that streamed polygon data yields the same time series as a buffered request."""
+        pytest.importorskip("ijson")
+        body = io.BytesIO(json.dumps(sample_time_series_response).encode())
+        api_client.rest_adapter.get_stream.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={},
+            raw=body
+        )
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_time_series_response
+        )
+        kwargs = dict(
+            identifiers=["POLYGON-123"],
+            identifier_type="polygonId",
+            polygon_type=1,
+            date_start="2023-01-01",
+            date_end="2023-01-02",
+            frequency="15"
+        )
+        
+        streamed = api_client.stream_nexrad_polygon_data(**kwargs)
+        # Nothing is requested until iteration starts
+        api_client.rest_adapter.get_stream.assert_not_called()
+        
+        assert list(streamed) == api_client.get_nexrad_polygon_data(**kwargs).time_series
+        assert body.closed
+        assert api_client.rest_adapter.get_stream.call_args[1]['params'] == api_client.rest_adapter.get.call_args[1]['params']
+
+    def test_stream_nexrad_polygon_data_validates_eagerly(self, api_client):
+        """Test that invalid arguments are rejected when the stream is created."""
+        with pytest.raises(ValueError, match="Invalid frequency"):
+            api_client.stream_nexrad_polygon_data(
+                identifiers=["POLYGON-123"],
+                identifier_type="polygonId",
+                polygon_type=1,
+                date_start="2023-01-01",
+                date_end="2023-01-02",
+                frequency="X"
+            )
+        api_client.rest_adapter.get_stream.assert_not_called()
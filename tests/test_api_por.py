@@ -276,4 +276,21 @@ class TestApiPeriodOfRecord:
         sig = inspect.signature(api.get_period_of_record)
         assert 'station_id' in sig.parameters
         assert sig.parameters['station_id'].annotation == str
-        assert sig.return_annotation == PeriodOfRecord
\ No newline at end of file
+        assert sig.return_annotation == PeriodOfRecord
+
+    def test_get_period_of_record_reuses_recent_response(self, api, mock_rest_adapter):
+        """Test that repeated lookups within the TTL are served without a new request."""
+        mock_result = Mock()
+        mock_result.data = {"periodOfRecord": {"porBeginDate": "1997-03-18T00:00:00:000"}}
+        mock_result.status_code = 200
+        mock_result.headers = {}
+        mock_rest_adapter.get.return_value = mock_result
+
+        first = api.get_period_of_record("S123-R")
+        second = api.get_period_of_record("S123-R")
+        assert first == second
+        mock_rest_adapter.get.assert_called_once()
+
+        # refresh=True bypasses the cached response
+        api.get_period_of_record("S123-R", refresh=True)
+        assert mock_rest_adapter.get.call_count == 2
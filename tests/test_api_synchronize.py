@@ -111,6 +111,25 @@ class TestSynchronizeEndpoint:
         params = call_args.kwargs["params"]
         assert params["requestedDatum"] == "NAVD88"
 
+    def test_get_synchronize_duplicate_names(self, api_client, sample_synchronize_response):
+        """Test that repeated time series names are requested once, with a warning."""
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="Success",
+            data=sample_synchronize_response
+        )
+        
+        with pytest.warns(UserWarning, match="Removed 2 duplicate value\\(s\\) from 'time_series_names'") as record:
+            api_client.get_synchronize(
+                time_series_names=["S6-H", "S5-H", "S6-H", "S6-H"],
+                date_start="2023-01-01",
+                date_end="2023-01-02"
+            )
+        
+        # The warning points at the caller, not library internals
+        assert record[0].filename == __file__
+        assert api_client.rest_adapter.get.call_args.kwargs["params"]["timeseries"] == "S6-H,S5-H"
+
     def test_get_synchronize_empty_time_series_names(self, api_client):
         """Test that empty time_series_names raises ValueError."""
         with pytest.raises(ValueError, match="The 'time_series_names' cannot be empty"):
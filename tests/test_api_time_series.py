@@ -1,5 +1,7 @@
 """Tests for time series endpoint of DbHydroApi class."""
 
+import io
+import json
 import pytest
 from unittest.mock import Mock
 from datetime import datetime
@@ -176,4 +178,135 @@ class TestTimeSeriesEndpoint:
             
             # Verify response is returned successfully
             assert response is not None
-            assert hasattr(response, 'time_series')
\ No newline at end of file
+            assert hasattr(response, 'time_series')
+
+    def test_get_time_series_parallel_chunks(self, api_client, sample_time_series_response):
+        """Test that large site ID lists are split into parallel requests and merged."""
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_time_series_response
+        )
+        
+        site_ids = [f"S{i}-R" for i in range(25)]
+        response = api_client.get_time_series(
+            site_ids=site_ids,
+            date_start="2023-01-01",
+            date_end="2023-01-02",
+            max_parallel=4
+        )
+        
+        # 25 site IDs are sent as chunks of 10, 10 and 5
+        assert api_client.rest_adapter.get.call_count == 3
+        requested_names = sorted(
+            call[1]['params']['names'] for call in api_client.rest_adapter.get.call_args_list
+        )
+        assert requested_names == sorted([
+            ','.join(site_ids[0:10]),
+            ','.join(site_ids[10:20]),
+            ','.join(site_ids[20:25]),
+        ])
+        
+        # One time series per chunk response is merged into a single response
+        assert len(response.time_series) == 3
+        assert response.status.status_code == 200
+    
+    def test_get_time_series_parallel_single_request_for_small_lists(self, api_client, sample_time_series_response):
+        """Test that small site ID lists are fetched in one request even with max_parallel set."""
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_time_series_response
+        )
+        
+        api_client.get_time_series(
+            site_ids=["S123-R", "S124-R"],
+            date_start="2023-01-01",
+            date_end="2023-01-02",
+            max_parallel=4
+        )
+        
+        api_client.rest_adapter.get.assert_called_once()
+        assert api_client.rest_adapter.get.call_args[1]['params']['names'] == "S123-R,S124-R"
+    
+    def test_get_time_series_invalid_max_parallel(self, api_client):
+        """Test that a non-positive max_parallel is rejected."""
+        with pytest.raises(ValueError, match="Invalid max_parallel"):
+            api_client.get_time_series(
+                site_ids=["S123-R"],
+                date_start="2023-01-01",
+                date_end="2023-01-02",
+                max_parallel=0
+            )
+    
+    def test_get_time_series_stream(self, api_client, sample_time_series_response):
+        """Test that a streamed response is parsed into the same result as a buffered one."""
+        pytest.importorskip("ijson")
+        body = io.BytesIO(json.dumps(sample_time_series_response).encode())
+        api_client.rest_adapter.get_stream.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={},
+            raw=body
+        )
+        api_client.rest_adapter.get.return_value = Result(
+            status_code=200,
+            message="OK",
+            data=sample_time_series_response
+        )
+        
+        streamed = api_client.get_time_series(
+            site_ids=["S123-R"],
+            date_start="2023-01-01",
+            date_end="2023-01-02",
+            stream=True
+        )
+        buffered = api_client.get_time_series(
+            site_ids=["S123-R"],
+            date_start="2023-01-01",
+            date_end="2023-01-02"
+        )
+        
+        assert streamed == buffered
+        assert body.closed
+        api_client.rest_adapter.get_stream.assert_called_once()
+    
+    def test_get_time_series_stream_api_error(self, api_client):
+        """Test that API-level errors in a streamed response are raised after parsing."""
+        pytest.importorskip("ijson")
+        error_response = {
+            "timeSeriesResponse": {
+                "status": {"statusCode": 400, "statusMessage": "Invalid site", "elapsedTime": 0.01},
+                "timeSeries": []
+            }
+        }
+        api_client.rest_adapter.get_stream.return_value = Result(
+            status_code=200,
+            message="OK",
+            data={},
+            raw=io.BytesIO(json.dumps(error_response).encode())
+        )
+        
+        with pytest.raises(DbHydroException, match="Invalid site"):
+            api_client.get_time_series(
+                site_ids=["S123-R"],
+                date_start="2023-01-01",
+                date_end="2023-01-02",
+                stream=True
+            )
+    
+    def test_get_time_series_stream_http_error(self, api_client):
+        """Test that unsuccessful streamed requests are reported from the parsed error body."""
+        api_client.rest_adapter.get_stream.return_value = Result(
+            status_code=500,
+            message="Internal Server Error",
+            data={}
+        )
+        
+        with pytest.raises(DbHydroException, match="HTTP request failed with status 500"):
+            api_client.get_time_series(
+                site_ids=["S123-R"],
+                date_start="2023-01-01",
+                date_end="2023-01-02",
+                stream=True
+            )
@@ -0,0 +1,132 @@
+"""Tests for AsyncDbHydroApi class."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock
+
+pytest.importorskip("aiohttp")
+
+import aiohttp
+
+from dbhydro_py.async_api import AsyncDbHydroApi
+from dbhydro_py.exceptions import DbHydroException
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def read(self):
+        return self._body
+
+
+def _make_session(payload, status=200):
+    """Create a mock session whose get() returns the given JSON payload."""
+    session = Mock()
+    session.get = Mock(side_effect=lambda *args, **kwargs: _FakeResponse(status, json.dumps(payload).encode()))
+    return session
+
+
+class TestAsyncDbHydroApi:
+    """Test cases for AsyncDbHydroApi."""
+
+    def test_get_time_series_success(self, sample_time_series_response):
+        """Test that a time series response is requested and parsed."""
+        session = _make_session(sample_time_series_response)
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=session)
+
+        response = asyncio.run(api.get_time_series(["S123-R"], "2023-01-01", "2023-01-02"))
+
+        assert len(response.time_series) == 1
+        assert response.time_series[0].source_info.site_code.value == "S123-R"
+        session.get.assert_called_once()
+        args, kwargs = session.get.call_args
+        assert args[0] == api._endpoints["timeseries"]
+        assert kwargs['params']['names'] == "S123-R"
+        # None-valued parameters are dropped before sending
+        assert None not in kwargs['params'].values()
+
+    def test_get_time_series_parallel_chunks(self, sample_time_series_response):
+        """Test that large site ID lists are split into concurrent requests and merged."""
+        session = _make_session(sample_time_series_response)
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=session)
+
+        site_ids = [f"S{i}-R" for i in range(25)]
+        response = asyncio.run(api.get_time_series(site_ids, "2023-01-01", "2023-01-02", max_parallel=4))
+
+        assert session.get.call_count == 3
+        assert len(response.time_series) == 3
+
+    def test_validation_errors(self):
+        """Test that arguments are validated before any request is sent."""
+        session = _make_session({})
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=session)
+
+        with pytest.raises(ValueError, match="The 'site_ids' cannot be empty"):
+            asyncio.run(api.get_time_series([], "2023-01-01", "2023-01-02"))
+        session.get.assert_not_called()
+
+    def test_http_error(self):
+        """Test that unsuccessful responses raise DbHydroException."""
+        session = _make_session({}, status=500)
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=session)
+
+        with pytest.raises(DbHydroException, match="HTTP request failed with status 500"):
+            asyncio.run(api.get_period_of_record("S123-R"))
+
+    def test_client_error(self):
+        """Test that aiohttp client errors are wrapped in DbHydroException."""
+        session = Mock()
+        session.get = Mock(side_effect=aiohttp.ClientError("connection reset"))
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=session)
+
+        with pytest.raises(DbHydroException, match="Request failed: connection reset"):
+            asyncio.run(api.get_interpolate("S123-R", "2023-01-01"))
+
+    def test_close_leaves_provided_session_open(self):
+        """Test that a session passed in by the caller is not closed by the client."""
+        session = _make_session({})
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=session)
+
+        async def use_client():
+            async with api:
+                pass
+
+        asyncio.run(use_client())
+        session.close.assert_not_called()
+
+    def test_get_many_runs_calls_in_order(self):
+        """Test that get_many returns results in call order and bounds concurrency."""
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=_make_session({}))
+        in_flight = 0
+        peak = 0
+
+        async def call(value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return value
+
+        results = asyncio.run(api.get_many((call(i) for i in range(10)), max_concurrency=3))
+
+        assert results == list(range(10))
+        assert peak == 3
+
+    def test_get_many_invalid_max_concurrency(self):
+        """Test that a non-positive max_concurrency is rejected."""
+        api = AsyncDbHydroApi("test_client_id", "test_client_secret", session=_make_session({}))
+
+        with pytest.raises(ValueError, match="Invalid max_concurrency"):
+            asyncio.run(api.get_many([], max_concurrency=0))
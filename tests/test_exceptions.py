@@ -0,0 +1,31 @@
+"""Tests for DBHydro exception classes."""
+
+from dbhydro_py.exceptions import DbHydroException
+
+
+class TestDbHydroException:
+    """Test cases for DbHydroException."""
+
+    def test_str_message_only(self):
+        """Test that an exception without status details prints just the message."""
+        assert str(DbHydroException("Request failed")) == "Request failed"
+
+    def test_str_all_details(self):
+        """Test that every available detail is appended in order."""
+        exc = DbHydroException(
+            "API request failed",
+            http_status_code=200,
+            api_status_code=400,
+            api_status_message="Invalid site"
+        )
+        assert str(exc) == "API request failed | API Error: Invalid site | HTTP Status: 200 | API Status: 400"
+
+    def test_str_skips_matching_api_status(self):
+        """Test that an API status equal to the HTTP status is not repeated."""
+        exc = DbHydroException("HTTP request failed", http_status_code=500, api_status_code=500)
+        assert str(exc) == "HTTP request failed | HTTP Status: 500"
+
+    def test_str_skips_empty_message(self):
+        """Test that an empty message does not leave a leading separator."""
+        exc = DbHydroException("", api_status_message="Invalid site")
+        assert str(exc) == "API Error: Invalid site"
@@ -1,5 +1,6 @@
 """Tests for aggregate response models."""
 
+import dataclasses
 import pytest
 from unittest.mock import patch
 
@@ -56,6 +57,56 @@ class TestAggregateModels:
         assert timespan.scalar == 1
         assert timespan.unit_of_time == "DAY"
     
+    def test_instances_use_slots(self, sample_aggregate_response):
+        """Test that aggregate objects are slotted and carry no per-instance __dict__."""
+        response = AggregateResponse.from_dict(sample_aggregate_response)
+        interval = response.intervals[0]
+        
+        for obj in (response, interval, interval.timespan, interval.tag):
+            assert not hasattr(obj, '__dict__')
+    
+    def test_caches_stay_out_of_dataclass_fields(self, sample_aggregate_response):
+        """Test that the derived-data caches are not reported as dataclass fields."""
+        response = AggregateResponse.from_dict(sample_aggregate_response)
+        response.get_keys()
+        response.get_value_ranges_by_key()
+        
+        assert [f.name for f in dataclasses.fields(response)] == ['intervals']
+        assert list(dataclasses.asdict(response)) == ['intervals']
+        assert dataclasses.replace(response) == response
+    
+    def test_null_timespan_and_tag(self, sample_aggregate_response):
+        """Test that intervals with a null timespan or tag still work with the column-based getters."""
+        interval_data = {**sample_aggregate_response["intervals"][0], "timespan": None, "tag": None}
+        response = AggregateResponse.from_dict({"intervals": [interval_data]})
+        
+        assert response.get_values() == [0.03]
+        assert response.get_value_range() == (0.03, 0.03)
+        assert response.get_timestamp_range() is not None
+        assert response.get_quality_summary() == {"A": 1}
+        assert response.get_data_counts_by_key() == {"S123-R": 1}
+        assert response.get_keys() == ["S123-R"]
+        assert response.get_statistic_types() == [response.intervals[0].statistic_type]
+        assert response.get_quality_codes() == ["A"]
+        assert response.get_origins() == ["MANIPULATED"]
+        
+        pytest.importorskip("pandas")
+        df = response.to_dataframe(include_metadata=True)
+        assert df["timespan_scalar"].isna().all()
+        assert df["tag"].isna().all()
+
+    def test_hand_written_from_dict_matches_generic_conversion(self, sample_aggregate_response):
+        """Test that the hand-written constructors agree with dataclass_from_dict, including missing keys."""
+        from dbhydro_py.utils import _build_constructor
+        
+        interval_data = sample_aggregate_response["intervals"][0]
+        for data in (interval_data, {"key": "S123-R"}, {**interval_data, "tag": None, "timespan": None}):
+            assert AggregateInterval.from_dict(data) == _build_constructor(AggregateInterval)(data)
+        assert Timespan.from_dict({}) == Timespan(scalar=None, unit_of_time=None)
+        
+        for data in (sample_aggregate_response, {"intervals": None}, {}):
+            assert AggregateResponse.from_dict(data) == _build_constructor(AggregateResponse)(data)
+    
     def test_aggregate_interval_from_dict(self, sample_aggregate_response):
         """Test creating AggregateInterval from dictionary."""
         interval_data = sample_aggregate_response["intervals"][0]
@@ -127,6 +178,31 @@ class TestAggregateModels:
         assert df['timespan_scalar'].iloc[0] == 1
         assert df['timespan_unit'].iloc[0] == "DAY"
     
+    def test_to_dataframe_converts_and_sorts_timestamps(self, sample_aggregate_response):
+        """Test that millisecond timestamps become datetimes and rows are ordered by start time."""
+        pd = pytest.importorskip("pandas")
+        
+        first = sample_aggregate_response["intervals"][0]
+        later = {**first, "startMilliSinceEpoch": first["startMilliSinceEpoch"] + 86400000,
+                 "endMilliSinceEpoch": first["endMilliSinceEpoch"] + 86400000, "value": 0.5}
+        response = AggregateResponse.from_dict({"intervals": [later, first]})
+        df = response.to_dataframe(include_metadata=True)
+        
+        assert df['value'].tolist() == [first["value"], 0.5]
+        assert df['start_datetime'].iloc[0] == pd.Timestamp(first["startMilliSinceEpoch"], unit='ms')
+        assert pd.api.types.is_datetime64_any_dtype(df['end_datetime'])
+        assert df['start_millis'].tolist() == [first["startMilliSinceEpoch"], later["startMilliSinceEpoch"]]
+    
+    def test_to_dataframe_missing_timestamp_is_nat(self, sample_aggregate_response):
+        """Test that a missing millisecond timestamp converts to NaT instead of failing."""
+        pd = pytest.importorskip("pandas")
+        
+        first = sample_aggregate_response["intervals"][0]
+        response = AggregateResponse.from_dict({"intervals": [first, {**first, "endMilliSinceEpoch": None}]})
+        df = response.to_dataframe()
+        
+        assert df['end_datetime'].isna().tolist() == [False, True]
+    
     def test_to_dataframe_empty_data(self):
         """Test DataFrame conversion with empty data."""
         pytest.importorskip("pandas")
@@ -139,6 +215,19 @@ class TestAggregateModels:
         assert 'end_datetime' in df.columns
         assert 'statistic_type' in df.columns
         assert 'value' in df.columns
+    
+    def test_to_dataframe_empty_data_is_typed_and_independent(self):
+        """Test that empty frames carry the column dtypes and are fresh copies per call."""
+        pytest.importorskip("pandas")
+        
+        empty_response = AggregateResponse.from_dict({"intervals": []})
+        df = empty_response.to_dataframe(include_metadata=True)
+        df['extra'] = 1
+        
+        assert str(df['start_datetime'].dtype) == 'datetime64[ns]'
+        assert str(df['value'].dtype) == 'float64'
+        assert 'end_millis' in df.columns
+        assert 'extra' not in empty_response.to_dataframe(include_metadata=True).columns
 
 
 class TestAggregateResponseConvenienceMethods:
@@ -245,6 +334,66 @@ class TestAggregateResponseConvenienceMethods:
         expected = [(1, "DAY"), (7, "DAY")]
         assert timespans == expected
 
+    def test_unique_value_summary_is_cached(self, sample_response):
+        """Test that the unique-value getters share one cached pass that follows changes to the interval list."""
+        keys = sample_response.get_keys()
+        keys.append("caller-owned")
+        
+        # Returned lists are copies, and repeated calls reuse the cached summary
+        assert sample_response.get_keys() == ["S123-R", "S124-R"]
+        assert sample_response._summary() is sample_response._summary()
+        
+        sample_response.intervals.pop()
+        sample_response.intervals.pop()
+        assert sample_response.get_statistic_types() == sorted({i.statistic_type for i in sample_response.intervals})
+        
+        sample_response.intervals = sample_response.intervals[:1]
+        assert sample_response.get_keys() == ["S123-R"]
+
+    def test_columns_follow_intervals(self, sample_response):
+        """Test that the column store matches the intervals and is rebuilt when the list changes."""
+        columns = sample_response._columns()
+        assert columns is sample_response._columns()
+        assert columns['value'] == tuple(i.value for i in sample_response.intervals)
+        assert columns['timespan_unit'] == tuple(i.timespan.unit_of_time for i in sample_response.intervals)
+        
+        sample_response.intervals.append(sample_response.intervals[0])
+        assert sample_response.get_values() == [i.value for i in sample_response.intervals]
+        
+        sample_response.intervals = []
+        assert sample_response.get_values() == []
+        assert sample_response._columns()['key'] == ()
+
+    def test_clear_cache_picks_up_in_place_edits(self, sample_response):
+        """Test that clear_cache() refreshes cached results after intervals are edited in place."""
+        sample_response.get_values()
+        sample_response.get_value_ranges_by_key()
+        
+        sample_response.intervals[0].value = 99.0
+        sample_response.intervals[1].key = "S999-R"
+        sample_response.clear_cache()
+        assert sample_response.get_values()[0] == 99.0
+        assert sample_response.get_value_range()[1] == 99.0
+        assert "S999-R" in sample_response.get_keys()
+        assert "S999-R" in sample_response.get_value_ranges_by_key()
+
+    def test_key_statistics_follow_intervals(self, sample_response):
+        """Test that the per-key statistics are rebuilt when the intervals change."""
+        ranges = sample_response.get_value_ranges_by_key()
+        assert sample_response._values_by_key() is sample_response._values_by_key()
+        
+        sample_response.intervals = sample_response.intervals[:1]
+        only = sample_response.intervals[0]
+        assert sample_response.get_value_ranges_by_key() == {only.key: (only.value, only.value)}
+        assert sample_response.get_average_values_by_key() == {only.key: only.value}
+        assert ranges != sample_response.get_value_ranges_by_key()
+
+    def test_iterators_match_list_getters(self, sample_response):
+        """Test that the iterator variants yield the same items as the list getters."""
+        assert list(sample_response.iter_values()) == sample_response.get_values()
+        assert list(sample_response.iter_intervals_for_key("S123-R")) == sample_response.get_intervals_for_key("S123-R")
+        assert list(sample_response.iter_intervals_for_key("missing")) == []
+
     def test_get_timestamp_range(self, sample_response):
         """Test getting timestamp range."""
         timestamp_range = sample_response.get_timestamp_range()
@@ -269,6 +418,37 @@ class TestAggregateResponseConvenienceMethods:
         empty_response = AggregateResponse(intervals=[])
         assert empty_response.get_value_range() is None
 
+    def test_get_value_range_keeps_value_types(self, sample_response):
+        """Test that integer values stay integers and null values raise, as with the builtins."""
+        from dataclasses import replace
+        
+        template = sample_response.intervals[0]
+        response = AggregateResponse(intervals=[replace(template, value=value) for value in (3, 1, 2)])
+        value_range = response.get_value_range()
+        assert value_range == (1, 3)
+        assert all(type(value) is int for value in value_range)
+        
+        response = AggregateResponse(intervals=[replace(template, value=value) for value in (3, None)])
+        with pytest.raises(TypeError):
+            response.get_value_range()
+
+    def test_get_values_array(self, sample_response):
+        """Test that values can be returned as a float64 NumPy array."""
+        np = pytest.importorskip("numpy")
+        
+        values = sample_response.get_values_array()
+        
+        assert values.dtype == np.float64
+        assert values.tolist() == sample_response.get_values()
+
+    def test_get_value_range_without_numpy(self, sample_response):
+        """Test that the value range does not need numpy and get_values_array reports the missing dependency."""
+        with patch('dbhydro_py.models.responses.aggregate.np', None):
+            assert sample_response.get_value_range() == (8.2, 15.7)
+            
+            with pytest.raises(ImportError, match="numpy is required"):
+                sample_response.get_values_array()
+
     def test_filter_by_key(self, sample_response):
         """Test filtering by keys."""
         filtered = sample_response.filter_by_key(["S123-R"])
@@ -302,6 +482,27 @@ class TestAggregateResponseConvenienceMethods:
         assert len(filtered.intervals) == 2
         assert all(interval.origin == "MANIPULATED" for interval in filtered.intervals)
 
+    def test_key_groups_are_cached(self, sample_response):
+        """Test that per-key lookups share one cached grouping and hand out copies."""
+        intervals = sample_response.get_intervals_for_key("S123-R")
+        intervals.clear()
+        
+        assert len(sample_response.get_intervals_for_key("S123-R")) == 2
+        assert sample_response.get_intervals_for_key("missing") == []
+        assert sample_response._group_by_key() is sample_response._group_by_key()
+        
+        sample_response.intervals = [i for i in sample_response.intervals if i.key == "S124-R"]
+        assert sample_response.get_intervals_for_key("S123-R") == []
+    
+    def test_filter_combined_matches_chained_filters(self, sample_response):
+        """Test that one combined filter equals chaining the single-attribute filters."""
+        chained = sample_response.filter_by_key(["S123-R"]).filter_by_statistic(["MAX", "MIN"]).filter_by_origin(["MANIPULATED"])
+        combined = sample_response.filter(keys=["S123-R"], statistic_types=["MAX", "MIN"], origins=["MANIPULATED"])
+        
+        assert combined == chained
+        assert sample_response.filter() == sample_response
+        assert sample_response.filter(quality_codes=[]).intervals == []
+
     def test_get_intervals_for_key(self, sample_response):
         """Test getting intervals for a specific key."""
         intervals = sample_response.get_intervals_for_key("S124-R")
@@ -377,6 +578,19 @@ class TestAggregateResponseConvenienceMethods:
         assert counts["S123-R"] == 2
         assert counts["S124-R"] == 2
 
+    def test_by_key_results_match_get_intervals_for_key(self, sample_response):
+        """Test that per-key results follow sorted key order and start-time order regardless of input order."""
+        from dbhydro_py.models.responses.aggregate import AggregateResponse
+        
+        reversed_response = AggregateResponse(intervals=list(reversed(sample_response.intervals)))
+        grouped = reversed_response.get_intervals_by_key_and_statistic()
+        
+        assert list(grouped) == ["S123-R", "S124-R"]
+        for key, by_statistic in grouped.items():
+            flattened = [interval for intervals in by_statistic.values() for interval in intervals]
+            assert sorted(flattened, key=lambda i: i.start_millis_since_epoch) == reversed_response.get_intervals_for_key(key)
+        assert reversed_response.get_time_coverage_by_key() == sample_response.get_time_coverage_by_key()
+
     def test_has_data(self, sample_response):
         """Test checking if response has data."""
         assert sample_response.has_data() is True
@@ -54,6 +54,43 @@ class TestInterpolateModels:
         
         assert tag.tag is None
 
+    def test_repeated_strings_are_shared(self, sample_interpolate_data):
+        """Test that repeated keys and codes parsed from separate strings share one object."""
+        entry_data = sample_interpolate_data["list"][0]
+        key = entry_data["key"]
+        copies = [{**entry_data, "key": key[:1] + key[1:]} for _ in range(2)]
+        assert copies[0]["key"] is not copies[1]["key"]
+        first, second = InterpolateResponse.from_dict({"list": copies}).entries
+        
+        assert first.key is second.key
+        assert first.quality_code is second.quality_code
+        assert first.origin is second.origin
+
+    def test_instances_use_slots(self, sample_interpolate_data):
+        """Test that interpolate objects are slotted and carry no per-instance __dict__."""
+        response = InterpolateResponse.from_dict(sample_interpolate_data)
+        entry = response.entries[0]
+        
+        for obj in (response, entry, entry.tag):
+            assert not hasattr(obj, '__dict__')
+
+    def test_hand_written_from_dict_matches_generic_conversion(self, sample_interpolate_data):
+        """Test that the hand-written constructors agree with dataclass_from_dict, including missing keys."""
+        from dbhydro_py.utils import _build_constructor
+        
+        entry_data = sample_interpolate_data["list"][0]
+        for data in (entry_data, {"key": "S123-R"}, {**entry_data, "tag": None}):
+            assert InterpolateEntry.from_dict(data) == _build_constructor(InterpolateEntry)(data)
+        for data in (sample_interpolate_data, {"list": None}, {}):
+            assert InterpolateResponse.from_dict(data) == _build_constructor(InterpolateResponse)(data)
+
+    def test_interpolate_tag_matches_generic_conversion(self):
+        """Test that the hand-written InterpolateTag.from_dict agrees with dataclass_from_dict."""
+        from dbhydro_py.utils import _build_constructor
+        
+        for tag_data in ({"tag": "flow"}, {"tag": None}, {}):
+            assert InterpolateTag.from_dict(tag_data) == _build_constructor(InterpolateTag)(tag_data)
+
     def test_interpolate_entry_creation(self, sample_interpolate_data):
         """Test InterpolateEntry creation from dictionary."""
         entry_data = sample_interpolate_data["list"][0]
@@ -250,6 +287,50 @@ class TestInterpolateResponseConvenienceMethods:
         key_types = sample_response.get_key_types()
         assert key_types == ["station_id"]
 
+    def test_unique_values_and_groups_are_cached(self, sample_response):
+        """Test that unique-value getters and key groups are cached and follow changes to the entry list."""
+        keys = sample_response.get_keys()
+        keys.append("caller-owned")
+        
+        assert sample_response.get_keys() == ["S123-R", "S124-R"]
+        assert sample_response._summary() is sample_response._summary()
+        assert sample_response._group_by_key() is sample_response._group_by_key()
+        
+        sample_response.get_entries_for_key("S123-R").clear()
+        assert len(sample_response.get_entries_for_key("S123-R")) == 2
+        
+        sample_response.entries = [e for e in sample_response.entries if e.key == "S124-R"]
+        assert sample_response.get_keys() == ["S124-R"]
+        assert list(sample_response.get_data_counts_by_key()) == ["S124-R"]
+        assert list(sample_response.get_latest_value_by_key()) == ["S124-R"]
+
+    def test_columns_follow_entries(self, sample_response):
+        """Test that the column store matches the entries and is rebuilt when the list changes."""
+        columns = sample_response._columns()
+        assert columns is sample_response._columns()
+        assert columns['value'] == tuple(e.value for e in sample_response.entries)
+        assert columns['tag'] == tuple(e.tag.tag if e.tag else None for e in sample_response.entries)
+        
+        sample_response.entries.append(sample_response.entries[0])
+        assert sample_response.get_values() == [e.value for e in sample_response.entries]
+        
+        sample_response.entries = []
+        assert sample_response.get_values() == []
+        assert sample_response.get_value_range() is None
+
+    def test_clear_cache_picks_up_in_place_edits(self, sample_response):
+        """Test that clear_cache() refreshes cached results after entries are edited in place."""
+        sample_response.get_values()
+        sample_response.get_average_values_by_key()
+        
+        sample_response.entries[0].value = 99.0
+        sample_response.entries[1].quality_code = "Z"
+        sample_response.clear_cache()
+        assert sample_response.get_values()[0] == 99.0
+        assert sample_response.get_value_range()[1] == 99.0
+        assert "Z" in sample_response.get_quality_codes()
+        assert max(high for _, high in sample_response.get_value_ranges_by_key().values()) == 99.0
+
     def test_get_timestamps(self, sample_response):
         """Test getting all timestamps sorted."""
         timestamps = sample_response.get_timestamps()
@@ -365,6 +446,16 @@ class TestInterpolateResponseConvenienceMethods:
         assert counts["S123-R"] == 2
         assert counts["S124-R"] == 2
 
+    def test_by_key_results_are_sorted_by_key(self, sample_response):
+        """Test that per-key results follow sorted key order regardless of entry order."""
+        from dbhydro_py.models.responses.interpolate import InterpolateResponse
+        
+        reversed_response = InterpolateResponse(entries=list(reversed(sample_response.entries)))
+        
+        assert list(reversed_response.get_data_counts_by_key()) == ["S123-R", "S124-R"]
+        assert list(reversed_response.get_entries_by_key_and_quality()) == ["S123-R", "S124-R"]
+        assert reversed_response.get_latest_value_by_key() == sample_response.get_latest_value_by_key()
+
     def test_has_data(self, sample_response):
         """Test checking if response has data."""
         assert sample_response.has_data() is True
@@ -10,6 +10,16 @@ from dbhydro_py.models.responses.base import Status
 class TestPointModels:
     """Test cases for Point and PointResponse models."""
     
+    def test_instances_use_slots(self):
+        """Test that point objects are slotted and carry no per-instance __dict__."""
+        response = PointResponse.from_dict({
+            "status": {"statusCode": 200, "statusMessage": "Success", "elapsedTime": 0.01},
+            "points": [{"value": 1.5, "timestamp": 1672574400000}]
+        })
+        
+        for obj in (response, response.status, response.points[0]):
+            assert not hasattr(obj, '__dict__')
+    
     def test_point_from_dict(self):
         """Test Point creation from dictionary."""
         data = {
@@ -80,6 +90,17 @@ class TestPointModels:
         assert response.points[0].quality_code == "A"
         assert response.points[1] is None
     
+    def test_point_response_from_dict_counts_nulls(self):
+        """Test that from_dict keeps existing Point objects and null points."""
+        existing = Point(value=1.0)
+        response = PointResponse.from_dict({"points": [None, {"value": 2.0}, existing, None]})
+        
+        assert response.status is None
+        assert response.points[1] == Point(value=2.0)
+        assert response.points[2] is existing
+        assert response.get_null_count() == 2
+        assert response.get_data_count() == 2
+
     def test_point_response_with_empty_points(self):
         """Test PointResponse with empty points array."""
         data = {
@@ -129,15 +150,12 @@ class TestPointModels:
             mock_dataframe.assert_called_once()
             call_args = mock_dataframe.call_args[0][0]
             
-            assert len(call_args) == 2
-            assert call_args[0]['value'] == 15.75
-            assert call_args[0]['timestamp'] == 1672574400000
-            assert call_args[1]['value'] == 20.25
-            assert call_args[1]['timestamp'] == 1672574460000
+            assert call_args['value'] == [15.75, 20.25]
+            assert call_args['timestamp'] == [1672574400000, 1672574460000]
             
             # Should not include metadata columns by default
-            assert 'ms_since_epoch' not in call_args[0]
-            assert 'quality_code' not in call_args[0]
+            assert 'ms_since_epoch' not in call_args
+            assert 'quality_code' not in call_args
     
     def test_to_dataframe_with_metadata(self):
         """Test DataFrame conversion with metadata."""
@@ -155,11 +173,10 @@ class TestPointModels:
             mock_dataframe.assert_called_once()
             call_args = mock_dataframe.call_args[0][0]
             
-            record = call_args[0]
-            assert record['value'] == 15.75
-            assert record['timestamp'] == 1672574400000
-            assert record['ms_since_epoch'] == 1672574400000
-            assert record['quality_code'] == "A"
+            assert call_args['value'] == [15.75]
+            assert call_args['timestamp'] == [1672574400000]
+            assert call_args['ms_since_epoch'] == [1672574400000]
+            assert call_args['quality_code'] == ["A"]
     
     def test_to_dataframe_with_null_points(self):
         """Test DataFrame conversion with null points."""
@@ -179,9 +196,7 @@ class TestPointModels:
             mock_dataframe.assert_called_once()
             call_args = mock_dataframe.call_args[0][0]
             
-            assert len(call_args) == 2  # Null point should be filtered out
-            assert call_args[0]['value'] == 15.75
-            assert call_args[1]['value'] == 20.25
+            assert call_args['value'] == [15.75, 20.25]  # Null point should be filtered out
     
     def test_to_dataframe_empty_response(self):
         """Test DataFrame conversion with empty/null points."""
@@ -272,6 +287,23 @@ class TestPointResponseConvenienceMethods:
         timestamp_range = sample_response.get_timestamp_range()
         assert timestamp_range == (1672574400000, 1672574700000)
 
+    def test_ranges_match_sorted_getters(self):
+        """Test that the single-pass ranges agree with the sorted getters on unordered points."""
+        from dbhydro_py.models.responses.point import PointResponse, Point
+        from dbhydro_py.models.responses.base import Status
+        
+        points = [
+            Point(value=3.0, timestamp=None, ms_since_epoch=1672574700000),
+            None,
+            Point(value=-1.0, timestamp=1672574400000),
+            Point(value=None, timestamp=None, ms_since_epoch=None),
+        ]
+        response = PointResponse(status=Status(status_code=200, message="Success", elapsed_time=0.1), points=points)
+        
+        timestamps = response.get_timestamps()
+        assert response.get_timestamp_range() == (timestamps[0], timestamps[-1])
+        assert response.get_value_range() == (-1.0, 3.0)
+
     def test_get_timestamp_range_empty(self):
         """Test getting timestamp range with no data."""
         from dbhydro_py.models.responses.point import PointResponse
@@ -301,6 +333,10 @@ class TestPointResponseConvenienceMethods:
         expected = (10.5 + 12.3 + 15.7 + 18.2) / 4
         assert abs(avg - expected) < 0.01
 
+    def test_iter_values_matches_get_values(self, sample_response):
+        """Test that iter_values yields the same values as get_values."""
+        assert list(sample_response.iter_values()) == sample_response.get_values()
+
     def test_get_average_value_empty(self):
         """Test getting average value with no data."""
         from dbhydro_py.models.responses.point import PointResponse
@@ -327,6 +363,29 @@ class TestPointResponseConvenienceMethods:
         null_count = sample_response.get_null_count()
         assert null_count == 1  # 1 None point
 
+    def test_null_count_follows_points(self, sample_response):
+        """Test that the null count follows the points, including points replaced in place."""
+        assert sample_response.get_null_count() == 1
+        
+        sample_response.points.append(None)
+        assert sample_response.get_null_count() == 2
+        assert sample_response.get_data_count() == 5
+        
+        sample_response.points[0] = None
+        assert sample_response.get_null_count() == 3
+        assert sample_response.get_data_count() == 4
+        
+        response = PointResponse.from_dict({"points": [{"value": 1.0}]})
+        assert response.has_data()
+        response.points[0] = None
+        assert not response.has_data()
+        assert response.has_null_points()
+        assert response.get_valid_points() == []
+        
+        sample_response.points = [None]
+        assert sample_response.has_data() is False
+        assert sample_response.has_null_points() is True
+
     def test_has_data(self, sample_response):
         """Test checking if response has data."""
         assert sample_response.has_data() is True
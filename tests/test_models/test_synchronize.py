@@ -1,5 +1,6 @@
 """Tests for synchronize response models."""
 
+import dataclasses
 import pytest
 from unittest.mock import Mock
 
@@ -99,6 +100,41 @@ class TestSynchronizeModels:
         assert value.quality_code == "A"  # from qualityCode
         assert value.percent_available == 0  # from percentAvailable
 
+    def test_instances_use_slots(self, sample_synchronize_data):
+        """Test that synchronize objects are slotted and carry no per-instance __dict__."""
+        response = SynchronizeResponse.from_dict(sample_synchronize_data)
+        entry = response.stations["S6-H"]
+        
+        for obj in (response, entry, entry.values[0]):
+            assert not hasattr(obj, '__dict__')
+
+    def test_caches_stay_out_of_dataclass_fields(self, sample_synchronize_data):
+        """Test that the response and entry caches are not reported as dataclass fields."""
+        response = SynchronizeResponse.from_dict(sample_synchronize_data)
+        response.get_timestamps()
+        response.get_average_values()
+        
+        assert list(dataclasses.asdict(response)) == ['stations']
+        assert list(dataclasses.asdict(response.stations["S6-H"])) == ['station_id', 'key', 'values']
+
+    def test_repeated_strings_are_shared(self, sample_single_value_data):
+        """Test that repeated codes parsed from separate strings share one object."""
+        origin = sample_single_value_data["origin"]
+        copies = [{**sample_single_value_data, "origin": origin[:1] + origin[1:]} for _ in range(2)]
+        assert copies[0]["origin"] is not copies[1]["origin"]
+        first, second = (SynchronizeValue.from_dict(data) for data in copies)
+        
+        assert first.origin is second.origin
+        assert first.quality_code is second.quality_code
+        assert first.key_type is second.key_type
+
+    def test_hand_written_from_dict_matches_generic_conversion(self, sample_single_value_data):
+        """Test that the hand-written SynchronizeValue.from_dict agrees with dataclass_from_dict."""
+        from dbhydro_py.utils import _build_constructor
+        
+        for data in (sample_single_value_data, {"value": 1.5}, {}):
+            assert SynchronizeValue.from_dict(data) == _build_constructor(SynchronizeValue)(data)
+
     def test_synchronize_entry_creation(self, sample_synchronize_data):
         """Test SynchronizeEntry creation from grouped station data."""
         # Extract station data for S6-H
@@ -211,6 +247,18 @@ class TestSynchronizeModels:
         # Test non-existing timestamp
         empty_values = response.get_values_at_timestamp(9999999999999)
         assert len(empty_values) == 0
+    
+    def test_get_values_at_timestamp_follows_values(self, sample_synchronize_data):
+        """Test that the timestamp index keeps the first repeated value and tracks added values."""
+        response = SynchronizeResponse.from_dict(sample_synchronize_data)
+        entry = response.stations["S6-H"]
+        first = entry.values[0]
+        
+        entry.values.append(SynchronizeValue(first.ms_since_epoch, 1.0, "M", 0, "X", "station_id", {}))
+        entry.values.append(SynchronizeValue(1, 2.0, "M", 0, "X", "station_id", {}))
+        
+        assert response.get_values_at_timestamp(first.ms_since_epoch)["S6-H"] is first
+        assert response.get_values_at_timestamp(1) == {"S6-H": entry.values[-1]}
 
     def test_get_station_values(self, sample_synchronize_data):
         """Test getting all values for a specific station."""
@@ -264,6 +312,40 @@ class TestSynchronizeModels:
         assert first_row['key_type'] == 'station_id'
         assert first_row['percent_available'] == 0
 
+    def test_to_dataframe_numeric_dtypes(self, sample_synchronize_data):
+        """Test that timestamps and values are typed, with missing values falling back to inference."""
+        pytest.importorskip("pandas")
+        
+        response = SynchronizeResponse.from_dict(sample_synchronize_data)
+        df = response.to_dataframe()
+        assert str(df['ms_since_epoch'].dtype) == 'int64'
+        assert str(df['value'].dtype) == 'float64'
+        
+        response.stations["S6-H"].values[0].value = None
+        response.clear_cache()
+        df = response.to_dataframe()
+        assert str(df['value'].dtype) == 'float64'
+        assert df['value'].isna().sum() == 1
+
+    def test_clear_cache_picks_up_in_place_edits(self, sample_synchronize_data):
+        """Test that clear_cache() refreshes cached results after values are replaced or edited in place."""
+        response = SynchronizeResponse.from_dict(sample_synchronize_data)
+        entry = response.stations["S6-H"]
+        response.get_average_values()
+        response.get_value_ranges()
+        response.get_latest_values()
+        
+        for value in entry.values:
+            value.value = 50.0
+        entry.values[0] = SynchronizeValue.from_dict({
+            "msSinceEpoch": entry.values[0].ms_since_epoch, "value": 50.0, "qualityCode": "Z"
+        })
+        response.clear_cache()
+        assert response.get_average_values()["S6-H"] == 50.0
+        assert response.get_value_ranges()["S6-H"] == (50.0, 50.0)
+        assert response.get_latest_values()["S6-H"] == 50.0
+        assert "Z" in response.get_quality_codes()
+
     def test_to_dataframe_empty(self):
         """Test DataFrame conversion with empty response."""
         pytest.importorskip("pandas")
@@ -274,6 +356,18 @@ class TestSynchronizeModels:
         assert len(df) == 0
         assert list(df.columns) == ['station_id', 'ms_since_epoch', 'value', 'quality_code']
 
+    def test_dataframe_from_dict_matches_to_dataframe(self, sample_synchronize_data):
+        """Test that building the DataFrame from the raw dict matches the dataclass path."""
+        pd = pytest.importorskip("pandas")
+        
+        for include_metadata in (False, True):
+            expected = SynchronizeResponse.from_dict(sample_synchronize_data).to_dataframe(include_metadata)
+            actual = SynchronizeResponse.dataframe_from_dict(sample_synchronize_data, include_metadata)
+            pd.testing.assert_frame_equal(actual, expected)
+        
+        empty = SynchronizeResponse.dataframe_from_dict({})
+        assert list(empty.columns) == ['station_id', 'ms_since_epoch', 'value', 'quality_code']
+
     def test_to_dataframe_without_pandas(self, sample_synchronize_data):
         """Test DataFrame conversion raises error when pandas not available."""
         response = SynchronizeResponse.from_dict(sample_synchronize_data)
@@ -440,6 +534,66 @@ class TestSynchronizeResponseConvenienceMethods:
         range_result = multi_station_response.get_timestamp_range()
         assert range_result == (1449794818000, 1449794820000)
 
+    def test_columns_follow_values(self, multi_station_response):
+        """Test that the cached value columns match the values and are rebuilt when the list changes."""
+        entry = multi_station_response.stations["S6-H"]
+        column = entry._column("value")
+        assert column is entry._column("value")
+        assert column == tuple(v.value for v in entry.values)
+        
+        entry.values = entry.values[:1]
+        assert entry._column("value") == (entry.values[0].value,)
+        assert multi_station_response.get_value_ranges()["S6-H"] == (entry.values[0].value,) * 2
+
+    def test_summary_follows_values(self, multi_station_response):
+        """Test that the cached per-station summary is rebuilt when the values change."""
+        entry = multi_station_response.stations["S6-H"]
+        assert entry._summary() is entry._summary()
+        
+        entry.values = entry.values[-1:]
+        only = entry.values[0]
+        assert multi_station_response.get_latest_values()["S6-H"] == only.value
+        assert multi_station_response.get_earliest_values()["S6-H"] == only.value
+        assert multi_station_response.get_average_values()["S6-H"] == only.value
+
+    def test_null_timestamp(self):
+        """Test that a value without a timestamp does not break the per-station aggregates."""
+        response = SynchronizeResponse.from_dict({
+            "1449794818000": {
+                "S6-H": {"msSinceEpoch": None, "value": 4.0, "qualityCode": "A", "origin": "MANIPULATED"}
+            }
+        })
+        assert response.get_quality_codes() == ["A"]
+        assert response.get_quality_summary() == {"A": 1}
+        assert response.get_origins() == ["MANIPULATED"]
+        assert response.get_average_values() == {"S6-H": 4.0}
+        assert response.get_value_ranges() == {"S6-H": (4.0, 4.0)}
+        assert response.get_timestamp_range() is None
+        
+        response.stations["S6-H"].values.append(SynchronizeValue(1, 6.0, "P", 0, "MANIPULATED", "station_id", {}))
+        assert response.get_timestamp_range() == (1, 1)
+        assert response.get_latest_values() == {"S6-H": 6.0}
+        assert response.get_average_values() == {"S6-H": 5.0}
+
+    def test_timestamps_follow_stations(self, multi_station_response):
+        """Test that the cached timestamps are returned as copies and rebuilt when the data changes."""
+        timestamps = multi_station_response.get_timestamps()
+        timestamps.append(0)
+        assert 0 not in multi_station_response.get_timestamps()
+        
+        entry = multi_station_response.stations["S6-H"]
+        entry.values.append(SynchronizeValue(1, 1.0, "A", 0, "X", "station_id", {}))
+        assert multi_station_response.get_timestamps()[0] == 1
+        
+        multi_station_response.stations = {"S6-H": SynchronizeEntry("S6-H", "S6-H", entry.values[-1:])}
+        assert multi_station_response.get_timestamps() == [1]
+
+    def test_iter_timestamps_matches_get_timestamps(self, multi_station_response):
+        """Test that iter_timestamps yields every timestamp get_timestamps deduplicates."""
+        timestamps = list(multi_station_response.iter_timestamps())
+        assert sorted(set(timestamps)) == multi_station_response.get_timestamps()
+        assert len(timestamps) == multi_station_response.get_data_count()
+
     def test_get_timestamp_range_empty(self):
         """Test getting timestamp range with empty response."""
         empty_response = SynchronizeResponse()
@@ -19,6 +19,49 @@ class TestTimeSeriesResponse:
         assert len(response.time_series) == 1
         assert response.time_series[0].source_info.site_code.value == "S123-R"
     
+    def test_instances_use_slots(self, sample_time_series_response):
+        """Test that parsed response objects are slotted and carry no per-instance __dict__."""
+        response = TimeSeriesResponse.from_dict(sample_time_series_response["timeSeriesResponse"])
+        entry = response.time_series[0]
+        
+        for obj in (response, response.status, entry, entry.source_info, entry.values[0]):
+            assert not hasattr(obj, '__dict__')
+        
+        with pytest.raises(AttributeError):
+            entry.unexpected_attribute = 1
+    
+    def test_dataframe_from_dict_matches_to_dataframe(self, sample_time_series_response):
+        """Test that building the DataFrame from the raw dict matches the dataclass path."""
+        pd = pytest.importorskip("pandas")
+        response_data = sample_time_series_response["timeSeriesResponse"]
+        
+        for include_metadata in (False, True):
+            expected = TimeSeriesResponse.from_dict(response_data).to_dataframe(include_metadata)
+            actual = TimeSeriesResponse.dataframe_from_dict(response_data, include_metadata)
+            pd.testing.assert_frame_equal(actual, expected)
+    
+    def test_dataframe_from_dict_multiple_sites_and_empty(self, sample_time_series_response):
+        """Test multi-site sorting and the empty response through the raw dict path."""
+        import copy
+        pd = pytest.importorskip("pandas")
+        response_data = sample_time_series_response["timeSeriesResponse"]
+        
+        second = copy.deepcopy(response_data["timeSeries"][0])
+        second["sourceInfo"]["siteCode"]["value"] = "S124-R"
+        second["values"][0]["qualityCode"] = None
+        multi_site = {**response_data, "timeSeries": [response_data["timeSeries"][0], second]}
+        
+        expected = TimeSeriesResponse.from_dict(multi_site).to_dataframe()
+        actual = TimeSeriesResponse.dataframe_from_dict(multi_site)
+        pd.testing.assert_frame_equal(actual, expected)
+        assert len(actual) == 4
+        
+        empty = {**response_data, "timeSeries": []}
+        pd.testing.assert_frame_equal(
+            TimeSeriesResponse.dataframe_from_dict(empty),
+            TimeSeriesResponse.from_dict(empty).to_dataframe()
+        )
+    
     @patch('pandas.DataFrame')
     def test_to_dataframe_without_pandas_raises_error(self, mock_df, sample_time_series_response):
         """Test that missing pandas raises ImportError."""
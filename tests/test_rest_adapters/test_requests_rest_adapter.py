@@ -1,5 +1,6 @@
 """Tests for RestAdapterRequests class."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 import requests
@@ -16,6 +17,63 @@ class TestRestAdapterRequests:
         """Test adapter initialization."""
         adapter = RestAdapterRequests()
         assert adapter is not None
+        assert isinstance(adapter._session, requests.Session)
+    
+    def test_session_pool_sized_for_parallel_requests(self):
+        """Test that the session keeps enough pooled connections for parallel requests."""
+        adapter = RestAdapterRequests()
+        https_adapter = adapter._session.get_adapter('https://dataservice-proxy.api.sfwmd.gov/')
+        assert https_adapter._pool_maxsize == 32
+        assert https_adapter._pool_connections == 8
+    
+    def test_session_retries_transient_server_errors(self):
+        """Test that the session retries transient server errors without raising on exhaustion."""
+        adapter = RestAdapterRequests()
+        retry = adapter._session.get_adapter('https://dataservice-proxy.api.sfwmd.gov/').max_retries
+        assert retry.total == 3
+        assert set(retry.status_forcelist) == {500, 502, 503, 504}
+        assert retry.raise_on_status is False
+    
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_timeout_passed_to_requests(self, mock_requests):
+        """Test that the configured timeout is sent with every request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.reason = "OK"
+        mock_response.content = b'{}'
+        mock_requests.Session.return_value.request.return_value = mock_response
+        
+        RestAdapterRequests().get(endpoint="https://api.test.com/test")
+        assert mock_requests.Session.return_value.request.call_args[1]['timeout'] == (10.0, 300.0)
+        
+        RestAdapterRequests(timeout=5).get(endpoint="https://api.test.com/test")
+        assert mock_requests.Session.return_value.request.call_args[1]['timeout'] == 5
+    
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_close_and_context_manager(self, mock_requests):
+        """Test that closing the adapter, directly or on leaving a with block, closes the session."""
+        with RestAdapterRequests() as adapter:
+            pass
+        mock_requests.Session.return_value.close.assert_called_once()
+        
+        adapter.close()
+        assert mock_requests.Session.return_value.close.call_count == 2
+    
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_session_reused_across_requests(self, mock_requests):
+        """Test that consecutive requests share one pooled session."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.reason = "OK"
+        mock_response.content = b'{}'
+        mock_requests.Session.return_value.request.return_value = mock_response
+        
+        adapter = RestAdapterRequests()
+        adapter.get(endpoint="https://api.test.com/one")
+        adapter.get(endpoint="https://api.test.com/two")
+        
+        mock_requests.Session.assert_called_once()
+        assert mock_requests.Session.return_value.request.call_count == 2
     
     @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
     def test_get_success(self, mock_requests):
@@ -24,8 +82,8 @@ class TestRestAdapterRequests:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.reason = "OK"
-        mock_response.json.return_value = {"status": "success", "data": []}
-        mock_requests.request.return_value = mock_response
+        mock_response.content = b'{"status": "success", "data": []}'
+        mock_requests.Session.return_value.request.return_value = mock_response
         
         adapter = RestAdapterRequests()
         
@@ -36,10 +94,11 @@ class TestRestAdapterRequests:
         assert result.status_code == 200
         assert result.message == "OK"
         assert result.data == {"status": "success", "data": []}
+        assert result.headers is mock_response.headers
         
         # Verify requests.request was called correctly
-        mock_requests.request.assert_called_once()
-        call_args = mock_requests.request.call_args
+        mock_requests.Session.return_value.request.assert_called_once()
+        call_args = mock_requests.Session.return_value.request.call_args
         assert call_args[1]['method'] == 'GET'
         assert call_args[1]['url'] == "https://api.test.com/test"
         assert call_args[1]['verify'] is True
@@ -55,14 +114,14 @@ class TestRestAdapterRequests:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.reason = "OK"
-        mock_response.json.return_value = {"data": "test"}
-        mock_requests.request.return_value = mock_response
+        mock_response.content = b'{"data": "test"}'
+        mock_requests.Session.return_value.request.return_value = mock_response
         
         adapter = RestAdapterRequests()
         result = adapter.get(endpoint="https://api.test.com/test")
         
         # Verify empty headers dict is used when None provided
-        call_args = mock_requests.request.call_args
+        call_args = mock_requests.Session.return_value.request.call_args
         assert call_args[1]['headers'] == {}
     
     @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
@@ -71,8 +130,8 @@ class TestRestAdapterRequests:
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.reason = "Not Found"
-        mock_response.json.return_value = {"error": "Not found"}
-        mock_requests.request.return_value = mock_response
+        mock_response.content = b'{"error": "Not found"}'
+        mock_requests.Session.return_value.request.return_value = mock_response
         
         adapter = RestAdapterRequests()
         result = adapter.get(endpoint="https://api.test.com/not-found")
@@ -84,7 +143,7 @@ class TestRestAdapterRequests:
     @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
     def test_get_connection_error(self, mock_requests):
         """Test GET request with connection error."""
-        mock_requests.request.side_effect = ConnectionError("Connection failed")
+        mock_requests.Session.return_value.request.side_effect = ConnectionError("Connection failed")
         
         adapter = RestAdapterRequests()
         
@@ -98,7 +157,7 @@ class TestRestAdapterRequests:
     @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
     def test_get_timeout_error(self, mock_requests):
         """Test GET request with timeout error."""
-        mock_requests.request.side_effect = Timeout("Request timed out")
+        mock_requests.Session.return_value.request.side_effect = Timeout("Request timed out")
         
         adapter = RestAdapterRequests()
         
@@ -115,8 +174,8 @@ class TestRestAdapterRequests:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.reason = "OK"
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_requests.request.return_value = mock_response
+        mock_response.content = b"<html>Invalid JSON</html>"
+        mock_requests.Session.return_value.request.return_value = mock_response
         
         adapter = RestAdapterRequests()
         result = adapter.get(endpoint="https://api.test.com/test")
@@ -124,6 +183,71 @@ class TestRestAdapterRequests:
         assert result.status_code == 200
         assert result.data == {}  # Falls back to empty dict
     
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_get_empty_body(self, mock_requests):
+        """Test GET request with an empty response body."""
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.reason = "Service Unavailable"
+        mock_response.content = b""
+        mock_requests.Session.return_value.request.return_value = mock_response
+        
+        adapter = RestAdapterRequests()
+        result = adapter.get(endpoint="https://api.test.com/test")
+        
+        assert result.status_code == 503
+        assert result.data == {}
+    
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.json_loads', json.loads)
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_get_stdlib_json_fallback(self, mock_requests):
+        """Test that responses parse with the stdlib json module when no faster parser is installed."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.reason = "OK"
+        mock_response.content = b'{"value": 1.5}'
+        mock_requests.Session.return_value.request.return_value = mock_response
+        
+        adapter = RestAdapterRequests()
+        result = adapter.get(endpoint="https://api.test.com/test")
+        
+        assert result.data == {"value": 1.5}
+    
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_get_stream_success(self, mock_requests):
+        """Test that a successful streamed GET returns the unread, decompressing body."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.reason = "OK"
+        mock_response.ok = True
+        mock_requests.Session.return_value.request.return_value = mock_response
+        
+        adapter = RestAdapterRequests()
+        result = adapter.get_stream(endpoint="https://api.test.com/test", params={"param1": "value1"})
+        
+        assert result.status_code == 200
+        assert result.data == {}
+        assert result.raw is mock_response.raw
+        assert mock_response.raw.decode_content is True
+        assert mock_requests.Session.return_value.request.call_args[1]['stream'] is True
+    
+    @patch('dbhydro_py.rest_adapters.rest_adapter_requests.requests')
+    def test_get_stream_error_is_parsed(self, mock_requests):
+        """Test that an unsuccessful streamed GET is parsed like a regular response."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.reason = "Not Found"
+        mock_response.ok = False
+        mock_response.content = b'{"error": "not found"}'
+        mock_requests.Session.return_value.request.return_value = mock_response
+        
+        adapter = RestAdapterRequests()
+        result = adapter.get_stream(endpoint="https://api.test.com/test")
+        
+        assert result.status_code == 404
+        assert result.data == {"error": "not found"}
+        assert result.raw is None
+    
     def test_post_method_exists(self):
         """Test that POST method exists (implementation not required yet)."""
         adapter = RestAdapterRequests()
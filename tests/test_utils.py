@@ -1,10 +1,11 @@
 """Tests for utility functions."""
 
+import io
 import pytest
 from dataclasses import dataclass, field
 from typing import Optional
 
-from dbhydro_py.utils import dataclass_from_dict
+from dbhydro_py.utils import dataclass_constructor, dataclass_from_dict, iter_json_items, json_loads, _build_constructor
 
 
 @dataclass
@@ -22,6 +23,23 @@ class DataClassWithMetadata:
     description: Optional[str] = None
 
 
+@dataclass
+class NestedTestClass:
+    """Test dataclass with nested dataclass and list fields."""
+    child: SimpleTestClass = field(metadata={"json_key": "child"})
+    children: list[SimpleTestClass] = field(default_factory=list, metadata={"json_key": "children"})
+    tags: list[str] = field(default_factory=list, metadata={"json_key": "tags"})
+    total: int = field(init=False, default=0)
+
+
+@dataclass
+class KeywordOnlyTestClass:
+    """Test dataclass mixing positional and keyword-only fields."""
+    name: str
+    value: int = field(kw_only=True, metadata={"json_key": "itemValue"})
+    note: Optional[str] = None
+
+
 class TestDataclassFromDict:
     """Test cases for dataclass_from_dict utility."""
     
@@ -68,4 +86,94 @@ class TestDataclassFromDict:
             pass
         
         with pytest.raises(TypeError, match="is not a dataclass"):
-            dataclass_from_dict(NotADataclass, {})
\ No newline at end of file
+            dataclass_from_dict(NotADataclass, {})
+    
+    def test_nested_and_list_fields(self):
+        """Test conversion of nested dataclasses, dataclass lists and primitive lists."""
+        data = {
+            "child": {"name": "a", "value": 1},
+            "children": [{"name": "b", "value": 2}, {"name": "c", "value": 3}],
+            "tags": ("x", "y")
+        }
+        
+        result = dataclass_from_dict(NestedTestClass, data)
+        
+        assert result.child == SimpleTestClass(name="a", value=1)
+        assert [child.name for child in result.children] == ["b", "c"]
+        assert result.tags == ["x", "y"]
+        assert result.total == 0
+    
+    def test_missing_list_fields_become_empty_lists(self):
+        """Test that missing or null list fields are converted to empty lists."""
+        result = dataclass_from_dict(NestedTestClass, {"children": None})
+        
+        assert result.child is None
+        assert result.children == []
+        assert result.tags == []
+    
+    def test_constructor_built_once_per_class(self):
+        """Test that the specialized constructor is generated once and reused."""
+        dataclass_from_dict(SimpleTestClass, {"name": "a", "value": 1})
+        misses = _build_constructor.cache_info().misses
+        
+        dataclass_from_dict(SimpleTestClass, {"name": "b", "value": 2})
+        
+        assert _build_constructor.cache_info().misses == misses
+    
+    def test_keyword_only_fields(self):
+        """Test that keyword-only fields are passed by name while the rest stay positional."""
+        result = dataclass_from_dict(KeywordOnlyTestClass, {"name": "a", "itemValue": 3, "note": "n"})
+        
+        assert result == KeywordOnlyTestClass("a", "n", value=3)
+    
+    def test_dataclass_constructor_matches_dataclass_from_dict(self):
+        """Test that the bound constructor is the cached one and converts like dataclass_from_dict."""
+        data = {"displayName": "test", "itemCount": 7}
+        constructor = dataclass_constructor(DataClassWithMetadata)
+        
+        assert constructor is _build_constructor(DataClassWithMetadata)
+        assert constructor(data) == dataclass_from_dict(DataClassWithMetadata, data)
+        with pytest.raises(TypeError, match="is not a dataclass"):
+            dataclass_constructor(dict)
+
+
+class TestIterJsonItems:
+    """Test cases for iter_json_items streaming helper."""
+    
+    def test_yields_items_and_collects_rest(self):
+        """Test that array items are yielded and the rest of the document is collected."""
+        pytest.importorskip("ijson")
+        stream = io.BytesIO(b'{"response": {"items": [{"a": [1, {"b": 2.5}]}, {"a": []}, 3], "status": {"code": 200}}}')
+        document: dict = {}
+        
+        items = list(iter_json_items(stream, "response.items.item", document))
+        
+        assert items == [{"a": [1, {"b": 2.5}]}, {"a": []}, 3]
+        assert isinstance(items[0]["a"][1]["b"], float)
+        assert document == {"response": {"items": [], "status": {"code": 200}}}
+    
+    def test_missing_array(self):
+        """Test that a document without the streamed array yields nothing."""
+        pytest.importorskip("ijson")
+        document: dict = {}
+        
+        items = list(iter_json_items(io.BytesIO(b'{"response": {}}'), "response.items.item", document))
+        
+        assert items == []
+        assert document == {"response": {}}
+
+
+class TestJsonLoads:
+    """Test cases for json_loads function."""
+
+    def test_parses_bytes_and_str(self):
+        """Test that raw response bytes and text parse to the same result."""
+        body = '{"value": 1.5, "name": "S79", "flags": [null, true]}'
+        expected = {"value": 1.5, "name": "S79", "flags": [None, True]}
+        assert json_loads(body.encode()) == expected
+        assert json_loads(body) == expected
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that malformed bodies raise ValueError, as callers expect from every parser."""
+        with pytest.raises(ValueError):
+            json_loads(b"not json")